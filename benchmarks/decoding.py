@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+
+"""Compare the costs of parsing and decoding responses.
+
+The payloads mimic a 20-level order book, a 579-row time and sales
+history, and a 300-row OHLC history. For each available JSON parser,
+the time taken to parse the raw payloads is reported. For each decoding
+mode, the time taken to decode a payload, the time taken to read the
+accessed fields of every row once, and the memory retained by the
+decoded response are reported.
+"""
+
+from collections.abc import Callable
+from json import dumps, loads
+from timeit import repeat
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any
+
+from ritc import _decode_nested, _decode_records
+
+PARSERS: list[tuple[str, Callable[[bytes], Any]]] = [('json', loads)]
+
+try:
+    from orjson import loads as orjson_loads
+except ImportError:
+    pass
+else:
+    PARSERS.append(('orjson', orjson_loads))
+
+REPEAT = 5
+NUMBER = 200
+
+
+def make_order(order_id: int, action: str, price: float) -> dict[str, Any]:
+    return {
+        'order_id': order_id,
+        'period': 1,
+        'tick': 132,
+        'trader_id': 'ANON',
+        'ticker': 'RITC',
+        'type': 'LIMIT',
+        'quantity': 500.0,
+        'action': action,
+        'price': price,
+        'quantity_filled': 0.0,
+        'vwap': None,
+        'status': 'OPEN',
+    }
+
+
+BIDS = [make_order(i, 'BUY', 25.06 - i / 100) for i in range(20)]
+ASKS = [make_order(20 + i, 'SELL', 25.07 + i / 100) for i in range(20)]
+BOOK = {'bid': BIDS, 'ask': ASKS, 'bids': BIDS, 'asks': ASKS}
+TAS = [
+    {
+        'id': 2099 - i,
+        'period': 1,
+        'tick': 299 - i // 2,
+        'price': 26.33,
+        'quantity': 100.0,
+    }
+    for i in range(579)
+]
+HISTORY = [
+    {
+        'tick': 299 - i,
+        'open': 26.27,
+        'high': 26.42,
+        'low': 26.21,
+        'close': 26.33,
+    }
+    for i in range(300)
+]
+
+
+def read_book(book: Any) -> float:
+    total = 0.0
+
+    for side in (book.bids, book.asks):
+        for i in range(len(side)):
+            order = side[i]
+            total += order.price * (order.quantity - order.quantity_filled)
+
+    return total
+
+
+def read_tas(tas: Any) -> float:
+    total = 0.0
+
+    for i in range(len(tas)):
+        total += tas[i].price * tas[i].quantity
+
+    return total
+
+
+def time(function: Callable[[], Any]) -> float:
+    return min(repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER
+
+
+def measure(
+        decode: Callable[[Any], Any],
+        read: Callable[[Any], float],
+        payload: Any,
+) -> tuple[float, float, int]:
+    response = decode(payload)
+    decoding_time = time(lambda: decode(payload))
+    reading_time = time(lambda: read(response))
+
+    start()
+    response = decode(payload)
+    size, _ = get_traced_memory()
+    stop()
+
+    return decoding_time, reading_time, size
+
+
+def main() -> None:
+    for name, payload in (
+            ('book', BOOK),
+            ('tas', TAS),
+            ('history', HISTORY),
+    ):
+        content = dumps(payload).encode()
+
+        for parser_name, parse in PARSERS:
+            parsing_time = time(lambda: parse(content))
+
+            print(
+                f'{name:<8}{parser_name:<10}'
+                f'{parsing_time * 1e6:>10.1f} us parse',
+            )
+
+    for name, read, payload in (
+            ('book', read_book, BOOK),
+            ('tas', read_tas, TAS),
+    ):
+        for mode, decode in (
+                ('nested', _decode_nested),
+                ('records', _decode_records),
+        ):
+            decoding_time, reading_time, size = measure(
+                decode,
+                read,
+                payload,
+            )
+
+            print(
+                f'{name:<8}{mode:<10}'
+                f'{decoding_time * 1e6:>10.1f} us decode'
+                f'{reading_time * 1e6:>10.1f} us read'
+                f'{size / 1024:>10.1f} KiB',
+            )
+
+
+if __name__ == '__main__':
+    main()
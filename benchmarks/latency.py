@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+"""Measure the end-to-end overhead of ``ritc`` against a stand-in
+server.
+
+Each endpoint method is called repeatedly through a :class:`ritc.RIT`
+connected to :class:`benchmarks.server.MockServer`, with and without
+:attr:`ritc.RIT.records`. The throughput, the median and 99th
+percentile latencies, and the number and size of the memory blocks
+allocated by a single call and still alive after it, including its
+result, are reported. The allocations of the server are excluded.
+
+Run from the root of the repository with ``python -m
+benchmarks.latency``.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+from tracemalloc import Filter, start, stop, take_snapshot
+from typing import Any
+
+from benchmarks import server
+from benchmarks.server import MockServer, TICKERS
+from ritc import Metrics, Order, RIT
+
+FILTERS = (Filter(False, server.__file__), Filter(False, '<frozen *>'))
+
+CASES: tuple[tuple[str, int, Callable[[RIT], Any]], ...] = (
+    ('get_case', 500, lambda rit: rit.get_case()),
+    ('get_securities', 500, lambda rit: rit.get_securities()),
+    (
+        'get_securities_book',
+        500,
+        lambda rit: rit.get_securities_book(ticker=TICKERS[0]),
+    ),
+    (
+        'get_securities_tas',
+        200,
+        lambda rit: rit.get_securities_tas(ticker=TICKERS[0]),
+    ),
+    (
+        'post_orders',
+        30,
+        lambda rit: rit.post_orders(
+            True,
+            ticker=TICKERS[0],
+            type=Order.Type.LIMIT,
+            quantity=100,
+            action=Order.Action.BUY,
+            price=24.5,
+        ),
+    ),
+    (
+        'post_commands_cancel',
+        200,
+        lambda rit: rit.post_commands_cancel(ticker=TICKERS[0]),
+    ),
+    (
+        'snapshot',
+        200,
+        lambda rit: rit.snapshot(TICKERS),
+    ),
+)
+
+
+def measure(
+        port: int,
+        records: bool,
+        count: int,
+        call: Callable[[RIT], Any],
+) -> tuple[float, float, float, int, int]:
+    metrics = Metrics()
+    rit = RIT('BENCHMARK', port=port, records=records, hooks=[metrics])
+
+    call(rit)
+    metrics.statistics.clear()
+
+    start_time = perf_counter()
+
+    for _ in range(count):
+        call(rit)
+
+    elapsed_time = perf_counter() - start_time
+
+    start()
+
+    first_snapshot = take_snapshot().filter_traces(FILTERS)
+    result = call(rit)
+    last_snapshot = take_snapshot().filter_traces(FILTERS)
+
+    stop()
+
+    statistics_diff = last_snapshot.compare_to(first_snapshot, 'filename')
+    block_count = sum(statistic.count_diff for statistic in statistics_diff)
+    size = sum(statistic.size_diff for statistic in statistics_diff)
+
+    del result
+
+    latencies = sorted(
+        latency
+        for statistics in metrics.statistics.values()
+        for latency in statistics.latencies
+    )
+    median = latencies[len(latencies) // 2]
+    tail = latencies[round(0.99 * (len(latencies) - 1))]
+
+    return count / elapsed_time, median, tail, block_count, size
+
+
+def main() -> None:
+    with MockServer() as server:
+        for name, count, call in CASES:
+            for mode, records in (('nested', False), ('records', True)):
+                throughput, median, tail, block_count, size = measure(
+                    server.port,
+                    records,
+                    count,
+                    call,
+                )
+
+                print(
+                    f'{name:<24}{mode:<10}'
+                    f'{throughput:>10.1f} calls/s'
+                    f'{median * 1e3:>8.2f} ms p50'
+                    f'{tail * 1e3:>8.2f} ms p99'
+                    f'{block_count:>8} blocks'
+                    f'{size / 1024:>10.1f} KiB',
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,413 @@
+"""An in-process stand-in for the RIT Client application.
+
+The server implements the subset of the RIT REST API exercised by the
+benchmarks and the unit tests, including the rate limit of the order
+insertions, over HTTP/1.1 with keep-alive. The market is synthetic and
+deterministic.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+TICKERS = 'CRZY', 'TAME'
+TICKS_PER_PERIOD = 300
+TICKS_PER_SECOND = 1
+INITIAL_TICK = 150
+API_ORDERS_PER_SECOND = 10
+BOOK_DEPTH = 40
+TAS_COUNT = 600
+NEWS_INTERVAL = 10
+TENDER_INTERVAL = 30
+
+
+@dataclass
+class _Market:
+    start_time: float = field(
+        default_factory=lambda: monotonic() - INITIAL_TICK / TICKS_PER_SECOND,
+    )
+    lock: Lock = field(default_factory=Lock)
+    orders: dict[int, dict[str, Any]] = field(default_factory=dict)
+    order_times: defaultdict[str, list[float]] = field(
+        default_factory=lambda: defaultdict(list),
+    )
+    next_order_id: int = 1
+    status: str = 'ACTIVE'
+
+    @property
+    def tick(self) -> int:
+        elapsed = monotonic() - self.start_time
+
+        return min(int(elapsed * TICKS_PER_SECOND), TICKS_PER_PERIOD)
+
+    def set_tick(self, tick: int) -> None:
+        self.start_time = monotonic() - tick / TICKS_PER_SECOND
+
+    def case(self) -> dict[str, Any]:
+        return {
+            'name': 'RITC Benchmark Case',
+            'period': 1,
+            'tick': self.tick,
+            'ticks_per_period': TICKS_PER_PERIOD,
+            'total_periods': 1,
+            'status': self.status,
+            'is_enforce_trading_limits': True,
+        }
+
+    def securities(self, ticker: str | None) -> list[dict[str, Any]]:
+        return [
+            {
+                'ticker': ticker_,
+                'type': 'STOCK',
+                'size': 1,
+                'position': 0.0,
+                'vwap': 0.0,
+                'nlv': 0.0,
+                'last': 25.0,
+                'bid': 24.99,
+                'bid_size': 1000.0,
+                'ask': 25.01,
+                'ask_size': 1000.0,
+                'volume': 0.0,
+                'unrealized': 0.0,
+                'realized': 0.0,
+                'currency': 'CAD',
+                'total_volume': 0.0,
+                'limits': [{'name': 'LIMIT-STOCK', 'units': 1.0}],
+                'is_tradeable': True,
+                'is_shortable': True,
+                'min_trade_size': 1.0,
+                'max_trade_size': 10000.0,
+                'api_orders_per_second': API_ORDERS_PER_SECOND,
+                'execution_delay_ms': 0,
+            }
+            for ticker_ in TICKERS
+            if ticker is None or ticker == ticker_
+        ]
+
+    def book(self, ticker: str, limit: int) -> dict[str, Any]:
+        tick = self.tick
+        bids = [
+            self.make_order(i, tick, ticker, 'BUY', 24.99 - i / 100)
+            for i in range(min(limit, BOOK_DEPTH))
+        ]
+        asks = [
+            self.make_order(
+                BOOK_DEPTH + i,
+                tick,
+                ticker,
+                'SELL',
+                25.01 + i / 100,
+            )
+            for i in range(min(limit, BOOK_DEPTH))
+        ]
+
+        return {'bid': bids, 'ask': asks, 'bids': bids, 'asks': asks}
+
+    def history(self, limit: int) -> list[dict[str, Any]]:
+        tick = self.tick
+
+        return [
+            {
+                'tick': tick - i,
+                'open': 25.0,
+                'high': 25.1,
+                'low': 24.9,
+                'close': 25.0 + (tick - i) % 7 / 100,
+            }
+            for i in range(min(limit, tick + 1))
+        ]
+
+    def tas(self, after: int, limit: int) -> list[dict[str, Any]]:
+        last_id = self.tick * 2
+
+        return [
+            {
+                'id': id_,
+                'period': 1,
+                'tick': id_ // 2,
+                'price': 25.0 + id_ % 5 / 100,
+                'quantity': 100.0,
+            }
+            for id_ in range(last_id, max(after, last_id - limit), -1)
+        ]
+
+    def news(self, after: int, limit: int) -> list[dict[str, Any]]:
+        last_id = self.tick // NEWS_INTERVAL
+
+        return [
+            {
+                'news_id': id_,
+                'period': 1,
+                'tick': id_ * NEWS_INTERVAL,
+                'ticker': TICKERS[id_ % len(TICKERS)],
+                'headline': f'Headline {id_}',
+                'body': f'Body {id_}',
+            }
+            for id_ in range(last_id, max(after, last_id - limit), -1)
+        ]
+
+    def tenders(self) -> list[dict[str, Any]]:
+        tick = self.tick
+        id_ = tick // TENDER_INTERVAL
+
+        return [
+            {
+                'tender_id': id_,
+                'period': 1,
+                'tick': id_ * TENDER_INTERVAL,
+                'expires': (id_ + 1) * TENDER_INTERVAL,
+                'caption': f'Tender {id_}',
+                'ticker': TICKERS[0],
+                'quantity': 1000.0,
+                'action': 'SELL' if id_ % 2 else 'BUY',
+                'is_fixed_bid': True,
+                'price': 24.9 if id_ % 2 else 25.1,
+            },
+        ]
+
+    def get_orders(self, status: str) -> list[dict[str, Any]]:
+        with self.lock:
+            return [
+                order
+                for order in self.orders.values()
+                if order['status'] == status
+            ]
+
+    def post_order(
+            self,
+            parameters: dict[str, str],
+    ) -> tuple[int, dict[str, Any]]:
+        ticker = parameters['ticker']
+        now = monotonic()
+
+        with self.lock:
+            times = self.order_times[ticker]
+            times[:] = [time for time in times if now - time < 1]
+
+            if len(times) >= API_ORDERS_PER_SECOND:
+                return 429, {
+                    'code': 'TOO_MANY_REQUESTS',
+                    'message': 'API request failed. Rate limit exceeded.',
+                    'wait': round(1 - (now - times[0]), 3),
+                }
+
+            times.append(now)
+            order = self.make_order(
+                self.next_order_id,
+                self.tick,
+                ticker,
+                parameters['action'],
+                float(parameters.get('price', 25.0)),
+            )
+            order['type'] = parameters['type']
+            order['quantity'] = float(parameters['quantity'])
+
+            if order['type'] == 'MARKET':
+                order['quantity_filled'] = order['quantity']
+                order['vwap'] = order['price']
+                order['status'] = 'TRANSACTED'
+
+            self.orders[order['order_id']] = order
+            self.next_order_id += 1
+
+        return 200, order
+
+    def delete_order(self, order_id: int) -> bool:
+        with self.lock:
+            order = self.orders.get(order_id)
+
+            if order is None or order['status'] != 'OPEN':
+                return False
+
+            order['status'] = 'CANCELLED'
+
+            return True
+
+    def cancel(self, parameters: dict[str, str]) -> dict[str, Any]:
+        with self.lock:
+            if 'all' in parameters:
+                ids = list(self.orders)
+            elif 'ticker' in parameters:
+                ids = [
+                    id_
+                    for id_, order in self.orders.items()
+                    if order['ticker'] == parameters['ticker']
+                ]
+            else:
+                ids = [
+                    int(id_)
+                    for id_ in parameters.get('ids', '').split(',')
+                    if id_
+                ]
+
+        cancelled_order_ids = [id_ for id_ in ids if self.delete_order(id_)]
+
+        return {'cancelled_order_ids': cancelled_order_ids}
+
+    @staticmethod
+    def make_order(
+            order_id: int,
+            tick: int,
+            ticker: str,
+            action: str,
+            price: float,
+    ) -> dict[str, Any]:
+        return {
+            'order_id': order_id,
+            'period': 1,
+            'tick': tick,
+            'trader_id': 'ANON',
+            'ticker': ticker,
+            'type': 'LIMIT',
+            'quantity': 500.0,
+            'action': action,
+            'price': round(price, 2),
+            'quantity_filled': 0.0,
+            'vwap': None,
+            'status': 'OPEN',
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    wbufsize = 1 << 16
+    server: _Server
+
+    def do_GET(self) -> None:
+        self.respond()
+
+    def do_POST(self) -> None:
+        self.respond()
+
+    def do_DELETE(self) -> None:
+        self.respond()
+
+    def respond(self) -> None:
+        url = urlsplit(self.path)
+        parameters = dict(parse_qsl(url.query))
+        length = int(self.headers.get('Content-Length', 0))
+
+        if length:
+            parameters.update(parse_qsl(self.rfile.read(length).decode()))
+
+        status_code, data = self.route(self.command, url.path, parameters)
+        content = dumps(data).encode()
+
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def route(
+            self,
+            method: str,
+            path: str,
+            parameters: dict[str, str],
+    ) -> tuple[int, Any]:
+        market = self.server.market
+        limit = int(parameters.get('limit', 20))
+
+        if method == 'GET' and path == '/v1/case':
+            return 200, market.case()
+        elif method == 'GET' and path == '/v1/limits':
+            return 200, [
+                {
+                    'name': 'LIMIT-STOCK',
+                    'gross': 0.0,
+                    'net': 0.0,
+                    'gross_limit': 250000,
+                    'net_limit': 100000,
+                    'gross_fine': 5.0,
+                    'net_fine': 5.0,
+                },
+            ]
+        elif method == 'GET' and path == '/v1/securities':
+            return 200, market.securities(parameters.get('ticker'))
+        elif method == 'GET' and path == '/v1/securities/book':
+            return 200, market.book(parameters['ticker'], limit)
+        elif method == 'GET' and path == '/v1/securities/history':
+            return 200, market.history(int(parameters.get('limit', 300)))
+        elif method == 'GET' and path == '/v1/securities/tas':
+            return 200, market.tas(
+                int(parameters.get('after', 0)),
+                int(parameters.get('limit', TAS_COUNT)),
+            )
+        elif method == 'GET' and path == '/v1/news':
+            return 200, market.news(
+                int(parameters.get('after', parameters.get('since', 0))),
+                limit,
+            )
+        elif method == 'GET' and path == '/v1/orders':
+            return 200, market.get_orders(parameters.get('status', 'OPEN'))
+        elif method == 'GET' and path.startswith('/v1/orders/'):
+            order = market.orders.get(int(path.rsplit('/', 1)[1]))
+
+            if order is None:
+                return 404, {'code': 'NOT_FOUND', 'message': 'Not found.'}
+
+            return 200, order
+        elif method == 'POST' and path == '/v1/orders':
+            return market.post_order(parameters)
+        elif method == 'DELETE' and path.startswith('/v1/orders/'):
+            id_ = int(path.rsplit('/', 1)[1])
+
+            return 200, {'success': market.delete_order(id_)}
+        elif method == 'GET' and path == '/v1/tenders':
+            return 200, market.tenders()
+        elif path.startswith('/v1/tenders/') and method in ('POST', 'DELETE'):
+            return 200, {'success': True}
+        elif method == 'POST' and path == '/v1/commands/cancel':
+            return 200, market.cancel(parameters)
+
+        return 404, {'code': 'NOT_FOUND', 'message': 'Not found.'}
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    market: _Market
+
+
+class MockServer:
+    """A stand-in RIT Client application served from a daemon thread.
+
+    >>> from ritc import RIT
+    >>> with MockServer() as server:
+    ...     rit = RIT('BENCHMARK', port=server.port)
+    ...     rit.get_case().status
+    'ACTIVE'
+    """
+
+    def __init__(self, hostname: str = 'localhost', port: int = 0) -> None:
+        self.server = _Server((hostname, port), _Handler)
+        self.server.market = _Market()
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    @property
+    def market(self) -> _Market:
+        return self.server.market
+
+    def __enter__(self) -> MockServer:
+        self.thread.start()
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -4,26 +4,85 @@ Trader Market Simulator Client Application via REST exchange API.
 
 from __future__ import annotations
 
-from collections.abc import Iterator, Mapping, Sequence
-from dataclasses import dataclass, field
+from asyncio import wrap_future
+from bisect import bisect_left, bisect_right
+from collections import Counter, deque, OrderedDict
+from collections.abc import (
+    Callable,
+    Collection,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from time import sleep
-from typing import Any, Literal, Optional, overload, Protocol, Union
-
-from requests import Session
+from functools import partial
+from gzip import GzipFile
+from io import BufferedIOBase
+from itertools import chain, count
+from json import dumps, loads
+from keyword import iskeyword
+from math import inf, nextafter
+from mmap import mmap
+from multiprocessing.resource_tracker import register, unregister
+from multiprocessing.shared_memory import SharedMemory
+from os import listdir, makedirs, name as os_name, SEEK_END
+from os.path import join
+from queue import Empty, Full, Queue
+from socket import IPPROTO_TCP, SO_KEEPALIVE, SOL_SOCKET, TCP_NODELAY
+from struct import Struct
+from threading import Event, local, Lock, RLock, Thread
+from time import monotonic, perf_counter, sleep, time
+from traceback import print_exception
+from typing import Any, BinaryIO, Literal, Optional, overload, Protocol, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter, DEFAULT_POOLSIZE, HTTPAdapter
+
+try:
+    from orjson import loads as _default_decoder
+except ImportError:  # pragma: no cover
+    from json import loads as _default_decoder
 
 __all__ = (
     'Asset',
+    'AsyncRIT',
+    'BookMirror',
+    'BulkOrderError',
+    'Cache',
     'CancellationResult',
     'Case',
     'Error',
+    'FillReport',
     'Limit',
+    'MarketFeed',
+    'Metrics',
     'News',
+    'NewsStream',
     'Order',
+    'ParquetExporter',
+    'PortfolioTracker',
+    'RateLimiter',
+    'Recorder',
+    'ReplayAdapter',
+    'RequestEvent',
+    'RiskError',
+    'RiskGate',
     'RIT',
     'Security',
+    'SharedMarketPublisher',
+    'SharedMarketReader',
+    'Snapshot',
     'SuccessResult',
+    'TASStream',
     'Tender',
+    'TenderEvaluator',
+    'TickScheduler',
+    'TickStore',
     'Ticker',
     'Trader',
 )
@@ -42,14 +101,7 @@ class _NestedSequence(Sequence[Any]):
         pass
 
     def __getitem__(self, key: Union[int, slice]) -> Any:
-        item = self.__sequence[key]
-
-        if not isinstance(item, str) and isinstance(item, Sequence):
-            item = _NestedSequence(item)
-        elif isinstance(item, Mapping):
-            item = _NestedMapping(item)
-
-        return item
+        return _decode_nested(self.__sequence[key])
 
     def __len__(self) -> int:
         return len(self.__sequence)
@@ -63,14 +115,7 @@ class _NestedMapping(Mapping[Any, Any]):
     __mapping: Mapping[Any, Any]
 
     def __getitem__(self, key: Any) -> Any:
-        item = self.__mapping[key]
-
-        if not isinstance(item, str) and isinstance(item, Sequence):
-            item = _NestedSequence(item)
-        elif isinstance(item, Mapping):
-            item = _NestedMapping(item)
-
-        return item
+        return _decode_nested(self.__mapping[key])
 
     def __iter__(self) -> Iterator[Any]:
         return iter(self.__mapping)
@@ -85,6 +130,117 @@ class _NestedMapping(Mapping[Any, Any]):
         return repr(self.__mapping)
 
 
+def _decode_nested(data: Any) -> Any:
+    if not isinstance(data, str) and isinstance(data, Sequence):
+        data = _NestedSequence(data)
+    elif isinstance(data, Mapping):
+        data = _NestedMapping(data)
+
+    return data
+
+
+class _Record(Mapping[str, Any]):
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'cannot assign to field {repr(name)}')
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _new_record, (tuple(self), tuple(self.values()))
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+_record_types: dict[tuple[str, ...], type[_Record]] = {}
+
+
+def _new_record(keys: tuple[str, ...], values: Iterable[Any]) -> _Record:
+    if keys not in _record_types:
+        _record_types[keys] = type(
+            '_Record',
+            (_Record,),
+            {'__module__': __name__, '__slots__': keys},
+        )
+
+    record = object.__new__(_record_types[keys])
+
+    for key, value in zip(keys, values):
+        object.__setattr__(record, key, value)
+
+    return record
+
+
+def _decode_records(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_decode_records(item) for item in data]
+    elif not isinstance(data, dict):
+        return data
+
+    keys = tuple(data)
+
+    if keys not in _record_types and not all(
+            key.isidentifier() and not iskeyword(key) for key in keys
+    ):
+        return _NestedMapping(
+            {key: _decode_records(value) for key, value in data.items()},
+        )
+
+    return _new_record(keys, map(_decode_records, data.values()))
+
+
+def _copy_records(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_copy_records(item) for item in data]
+    elif not isinstance(data, _Record):
+        return data
+
+    return _new_record(tuple(data), map(_copy_records, data.values()))
+
+
+_BOOK_FIELDS = (('order_id', 'i8'), ('price', 'f8'), ('quantity', 'f8'))
+_HISTORY_FIELDS = (
+    ('tick', 'i8'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+)
+_TAS_FIELDS = (
+    ('id', 'i8'),
+    ('period', 'i8'),
+    ('tick', 'i8'),
+    ('price', 'f8'),
+    ('quantity', 'f8'),
+)
+
+
+def _decode_array(
+        data: Sequence[Mapping[str, Any]],
+        fields: Sequence[tuple[str, str]],
+) -> Any:
+    import numpy
+
+    names = tuple(name for name, _ in fields)
+
+    return numpy.array(
+        [tuple(map(item.__getitem__, names)) for item in data],
+        dtype=list(fields),
+    )
+
+
 class Error(Protocol):
     """This class is for error data."""
 
@@ -374,6 +530,509 @@ class Tender(Protocol):
     price: float
 
 
+@dataclass(frozen=True)
+class RequestEvent:
+    """This class is for completed requests."""
+
+    timestamp: float
+    """The time at which the request was started, in seconds since the
+    epoch.
+    """
+    method: str
+    """The request method."""
+    path: str
+    """The request path."""
+    parameters: dict[Any, Any]
+    """The request parameters."""
+    status_code: int
+    """The status code of the final response."""
+    content: bytes
+    """The raw body of the final response."""
+    latency: float
+    """The number of seconds taken, including the retries."""
+    decoding_time: float
+    """The number of seconds taken to decode the final response."""
+    attempt_count: int
+    """The number of attempts, which is greater than ``1`` if the rate
+    limit was exceeded.
+    """
+    wait_time: float
+    """The number of seconds slept due to exceeded rate limits."""
+
+
+@dataclass
+class Metrics:
+    """This class is for aggregating the latencies and throughputs of
+    requests.
+
+    An instance is meant to be used as one of :attr:`RIT.hooks`. The
+    requests are grouped by their methods and paths, where the
+    identifiers in the paths are replaced with ``{id}``.
+
+    >>> metrics = Metrics()
+    >>> rit = RIT('G4DNIZ5D', hooks=[metrics])
+    >>> for _ in range(100):
+    ...     book = rit.get_securities_book(ticker='RITC')
+    >>> statistics = metrics.statistics['GET', '/v1/securities/book']
+    >>> statistics.count
+    100
+    >>> statistics.percentile(50), statistics.percentile(99)
+    (0.0021..., 0.0049...)
+    """
+
+    @dataclass
+    class Statistics:
+        """This class is for the statistics of requests of a kind."""
+
+        maxlen: int
+        """The maximum number of latencies kept as samples."""
+        count: int = 0
+        """The number of requests."""
+        error_count: int = 0
+        """The number of requests whose final response was an error."""
+        content_size: int = 0
+        """The total number of bytes received."""
+        latency: float = 0.0
+        """The total number of seconds taken."""
+        decoding_time: float = 0.0
+        """The total number of seconds taken to decode the responses."""
+        retry_count: int = 0
+        """The total number of retries due to exceeded rate limits."""
+        wait_time: float = 0.0
+        """The total number of seconds slept due to exceeded rate
+        limits.
+        """
+        latencies: deque[float] = field(init=False)
+        """The latencies of the most recent requests."""
+
+        def __post_init__(self) -> None:
+            self.latencies = deque(maxlen=self.maxlen)
+
+        def percentile(self, percentage: float) -> float:
+            """Return the percentile of the latencies of the most recent
+            requests.
+
+            :param percentage: The percentage between ``0`` and ``100``.
+            :return: The percentile in seconds.
+            """
+            latencies = sorted(self.latencies)
+
+            if not latencies:
+                return 0.0
+
+            index = round(percentage / 100 * (len(latencies) - 1))
+
+            return latencies[index]
+
+    maxlen: int = 1000
+    """The maximum number of latencies kept as samples for each kind of
+    requests. Defaults to ``1000``.
+    """
+    statistics: dict[tuple[str, str], Metrics.Statistics] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The statistics keyed by the request methods and paths."""
+    __lock: Lock = field(default_factory=Lock, init=False)
+
+    def __call__(self, event: RequestEvent) -> None:
+        path = '/'.join(
+            '{id}' if segment.isdigit() else segment
+            for segment in event.path.split('/')
+        )
+
+        with self.__lock:
+            key = event.method, path
+
+            if key not in self.statistics:
+                self.statistics[key] = Metrics.Statistics(self.maxlen)
+
+            statistics = self.statistics[key]
+            statistics.count += 1
+            statistics.error_count += event.status_code >= 400
+            statistics.content_size += len(event.content)
+            statistics.latency += event.latency
+            statistics.decoding_time += event.decoding_time
+            statistics.retry_count += event.attempt_count - 1
+            statistics.wait_time += event.wait_time
+
+            statistics.latencies.append(event.latency)
+
+
+@dataclass
+class Cache:
+    """This class is for caching the responses of ``GET`` requests.
+
+    An instance is meant to be used as :attr:`RIT.cache`, and can be
+    shared by the clients of the strategies in a process. The responses
+    are keyed by the clients, identified by their servers, API keys, and
+    decoding modes, and by their paths and parameters, so that clients
+    never receive the responses of each other. They are discarded when
+
+    - they are older than the time-to-live,
+    - a case newly fetched by the same client has advanced to another
+      tick or period,
+    - any ``POST`` or ``DELETE`` request is sent, or
+    - they are the least recently used and the cache is full.
+
+    The responses decoded into records are copied into and out of the
+    cache, so that the lists in them are never shared between callers.
+    The consistency check of :meth:`RIT.snapshot` always bypasses the
+    cache.
+
+    >>> rit = RIT('G4DNIZ5D', cache=Cache())
+    >>> case = rit.get_case()
+    >>> case is rit.get_case()
+    True
+    >>> rit.cache.hit_count, rit.cache.miss_count
+    (1, 1)
+    """
+
+    ttl: float = 0.1
+    """The number of seconds a response is kept. Defaults to ``0.1``."""
+    maxsize: int = 256
+    """The maximum number of responses kept. Defaults to ``256``."""
+    paths: Collection[str] = (
+        '/v1/case',
+        '/v1/trader',
+        '/v1/limits',
+        '/v1/assets',
+        '/v1/securities',
+    )
+    """The paths of the cached requests. Defaults to those of
+    :meth:`RIT.get_case`, :meth:`RIT.get_trader`, :meth:`RIT.get_limits`,
+    :meth:`RIT.get_assets`, and :meth:`RIT.get_securities`.
+    """
+    hit_count: int = field(default=0, init=False)
+    """The number of requests answered from the cache."""
+    miss_count: int = field(default=0, init=False)
+    """The number of cacheable requests not answered from the cache."""
+    __lock: Lock = field(default_factory=Lock, init=False)
+    __entries: OrderedDict[Any, tuple[float, Any]] = field(
+        default_factory=OrderedDict,
+        init=False,
+    )
+    __ticks: dict[Hashable, tuple[int, int]] = field(
+        default_factory=dict,
+        init=False,
+    )
+
+    def get(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            client: Hashable = None,
+    ) -> Any:
+        """Return the cached response, if any.
+
+        :param path: The request path.
+        :param parameters: The request parameters.
+        :param client: The identity of the client, defaults to ``None``.
+        :return: The cached response, or ``None`` if absent or expired.
+        """
+        if path not in self.paths:
+            return None
+
+        key = client, path, tuple(sorted(parameters.items()))
+
+        with self.__lock:
+            entry = self.__entries.get(key)
+
+            if entry is not None and entry[0] > monotonic():
+                self.hit_count += 1
+
+                self.__entries.move_to_end(key)
+
+                return entry[1]
+
+            self.miss_count += 1
+
+            return None
+
+    def put(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            data: Any,
+            client: Hashable = None,
+    ) -> None:
+        """Cache the response.
+
+        If the response is a case at a different tick or period than
+        the previous one of the client, the other responses of the
+        client are discarded.
+
+        :param path: The request path.
+        :param parameters: The request parameters.
+        :param data: The response.
+        :param client: The identity of the client, defaults to ``None``.
+        :return: ``None``.
+        """
+        if path not in self.paths:
+            return
+
+        key = client, path, tuple(sorted(parameters.items()))
+
+        with self.__lock:
+            if path == '/v1/case':
+                tick = data['period'], data['tick']
+
+                if self.__ticks.get(client) != tick:
+                    self.__ticks[client] = tick
+
+                    for entry_key in tuple(self.__entries):
+                        if entry_key[0] == client:
+                            del self.__entries[entry_key]
+
+            self.__entries[key] = monotonic() + self.ttl, data
+
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(False)
+
+    def clear(self) -> None:
+        """Discard all cached responses.
+
+        :return: ``None``.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+
+@dataclass
+class RateLimiter:
+    """This class is for pacing order submissions on the client side.
+
+    Each ticker is limited by a token bucket that is refilled at its
+    rate, usually its :attr:`Security.api_orders_per_second`, and holds
+    at most ``burst`` tokens. Acquiring a token when the bucket is empty
+    blocks the calling thread until a token is refilled. The waiting
+    threads are served in the order of their arrival.
+
+    As such, orders are sent just as fast as the RIT Client application
+    accepts them, instead of being rejected and retried after the
+    rejection.
+
+    >>> rit = RIT('G4DNIZ5D', rate_limiter=RateLimiter())
+    >>> rit.rate_limiter.update(rit.get_securities())
+    >>> rit.rate_limiter.rates
+    {'CRZY': 10, 'TAME': 10}
+    >>> for _ in range(20):
+    ...     order = rit.post_orders(
+    ...         ticker='CRZY',
+    ...         type='MARKET',
+    ...         quantity=1,
+    ...         action='BUY',
+    ...     )
+    >>> rit.rate_limiter.wait_time('CRZY')
+    1.8999...
+    """
+
+    rates: dict[str, float] = field(default_factory=dict)
+    """The maximum numbers of orders per second, keyed by ticker. The
+    tickers without rates are not limited.
+    """
+    burst: int = 1
+    """The maximum number of orders that can be sent at once. Defaults
+    to ``1``.
+    """
+    __lock: Lock = field(default_factory=Lock, init=False)
+    __arrival_times: dict[str, float] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __queue_depths: dict[str, int] = field(default_factory=dict, init=False)
+    __wait_times: dict[str, float] = field(default_factory=dict, init=False)
+
+    def update(self, securities: Iterable[Security]) -> None:
+        """Set the rates to the :attr:`Security.api_orders_per_second`
+        of the securities.
+
+        :param securities: The securities.
+        :return: ``None``.
+        """
+        for security in securities:
+            if security.api_orders_per_second > 0:
+                self.rates[security.ticker] = security.api_orders_per_second
+
+    def acquire(self, ticker: str) -> float:
+        """Block until an order for the ticker can be sent.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The number of seconds waited.
+        """
+        rate = self.rates.get(ticker)
+
+        if not rate:
+            return 0.0
+
+        interval = 1 / rate
+
+        with self.__lock:
+            now = monotonic()
+            arrival_time = max(self.__arrival_times.get(ticker, now), now)
+            self.__arrival_times[ticker] = arrival_time + interval
+            wait_time = max(
+                arrival_time - (self.burst - 1) * interval - now,
+                0.0,
+            )
+
+            if wait_time:
+                self.__queue_depths[ticker] = self.queue_depth(ticker) + 1
+                self.__wait_times[ticker] = self.wait_time(ticker) + wait_time
+
+        if wait_time:
+            sleep(wait_time)
+
+            with self.__lock:
+                self.__queue_depths[ticker] -= 1
+
+        return wait_time
+
+    def queue_depth(self, ticker: str) -> int:
+        """Return the number of orders waiting for the ticker.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The number of waiting orders.
+        """
+        return self.__queue_depths.get(ticker, 0)
+
+    def wait_time(self, ticker: str) -> float:
+        """Return the total number of seconds waited for the ticker.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The total wait time in seconds.
+        """
+        return self.__wait_times.get(ticker, 0.0)
+
+
+def _split_quantity(quantity: float, max_trade_size: float) -> list[float]:
+    if max_trade_size <= 0:
+        raise ValueError(
+            f'maximum trade size {max_trade_size} is not positive',
+        )
+
+    quantities = []
+
+    while quantity > max_trade_size:
+        quantities.append(max_trade_size)
+
+        quantity -= max_trade_size
+
+    if quantity > 0:
+        quantities.append(quantity)
+
+    return quantities
+
+
+def _get_book_sides(book: Any) -> tuple[Any, Any]:
+    bids = book['bids'] if 'bids' in book else book.get('bid', [])
+    asks = book['asks'] if 'asks' in book else book.get('ask', [])
+
+    return bids, asks
+
+
+class _HTTPAdapter(HTTPAdapter):
+    def __init__(
+            self,
+            socket_options: list[tuple[int, int, int]],
+            **kwargs: Any,
+    ) -> None:
+        self.__socket_options = socket_options
+
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['socket_options'] = self.__socket_options
+
+        super().init_poolmanager(*args, **kwargs)
+
+
+class BulkOrderError(Exception):
+    """This class is for errors of orders inserted together, some of
+    which may have been posted.
+    """
+
+    def __init__(
+            self,
+            orders: Sequence[Optional[Order]],
+            errors: Sequence[Optional[Exception]],
+    ) -> None:
+        super().__init__(
+            f'{sum(error is not None for error in errors)} of'
+            f' {len(errors)} orders failed',
+        )
+
+        self.orders = orders
+        """The posted orders, or ``None`` for those which failed, in
+        the same order.
+        """
+        self.errors = errors
+        """The errors of the orders which failed, or ``None`` for those
+        posted, in the same order.
+        """
+
+
+@dataclass(frozen=True)
+class FillReport:
+    """This class is for the aggregate fills of split orders."""
+
+    orders: list[Order]
+    """The orders."""
+    quantity: float
+    """The total quantity of the orders."""
+    quantity_filled: float
+    """The total filled quantity of the orders."""
+    vwap: Optional[float]
+    """The volume-weighted average fill price, or ``None`` if nothing
+    was filled.
+    """
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """This class is for market snapshots.
+
+    A snapshot bundles the responses of the requests a strategy usually
+    sends at the start of every tick. It is stamped with the
+    :attr:`Case.period` and :attr:`Case.tick` of the case fetched
+    alongside, which are checked against the case fetched once all
+    other responses arrived.
+    """
+
+    case: Case
+    """The current case."""
+    securities: Sequence[Security]
+    """The available securities and associated positions."""
+    books: Mapping[str, Security.Book]
+    """The order books, keyed by :attr:`Security.ticker`."""
+    tas: Mapping[str, Sequence[Security.TAS]]
+    """The time and sales histories, keyed by :attr:`Security.ticker`.
+    Empty if they were not requested.
+    """
+    is_consistent: bool = True
+    """Whether the tick stayed the same while the responses were
+    fetched. If not, the responses may mix two ticks.
+    """
+
+    @property
+    def period(self) -> int:
+        """Return the period of the snapshot.
+
+        :return: The period of the snapshot.
+        """
+        return self.case.period
+
+    @property
+    def tick(self) -> int:
+        """Return the tick of the snapshot.
+
+        :return: The tick of the snapshot.
+        """
+        return self.case.tick
+
+
 @dataclass(frozen=True)
 class RIT:
     """This class contains various methods that interact with the RIT
@@ -385,6 +1044,10 @@ class RIT:
 
     For example :meth:`RIT.get_case` sends a ``GET`` request to the
     ``/case`` path.
+
+    A single client can be shared among threads. The connections to
+    the RIT Client application are pooled and kept alive, up to
+    :attr:`RIT.pool_maxsize` of them.
     """
 
     x_api_key: str
@@ -393,10 +1056,109 @@ class RIT:
     """The hostname of the RITC web server. Defaults to ``localhost``."""
     port: int = 9999
     """The port of the RITC web server. Defaults to ``9999``."""
+    records: bool = False
+    """Whether to decode the responses into records. Defaults to
+    ``False``.
+
+    By default, the responses are lazily wrapped on every item access.
+    If ``True``, each JSON object is instead decoded once into a
+    compact record with ``__slots__`` which supports both attribute and
+    item access. Records are read-only, while lists are left as is.
+    """
+    rate_limiter: Optional[RateLimiter] = field(default=None, hash=False)
+    """The optional rate limiter through which orders are paced before
+    being posted.
+    """
+    hooks: Sequence[Callable[[RequestEvent], None]] = field(
+        default=(),
+        hash=False,
+    )
+    """The callables invoked with a :class:`RequestEvent` after every
+    completed request, such as :class:`Metrics`. Nothing is measured if
+    empty, which is the default. The errors raised by the callables are
+    printed instead of being propagated, so that they never fail the
+    requests.
+    """
+    cache: Optional[Cache] = field(default=None, hash=False)
+    """The optional cache of the responses of ``GET`` requests."""
+    decoder: Callable[[bytes], Any] = _default_decoder
+    """The callable parsing the raw JSON bodies of the responses.
+    Defaults to ``orjson.loads`` if ``orjson`` is installed, or
+    :func:`json.loads` otherwise.
+    """
+    pool_maxsize: int = DEFAULT_POOLSIZE
+    """The maximum number of connections kept alive, which is also the
+    number of threads used for concurrent requests. Threads sharing
+    the client block for a free connection instead of opening extra
+    ones. Defaults to ``10``.
+    """
+    timeout: Union[None, float, tuple[float, float]] = None
+    """The optional number of seconds to wait for the server, either as a
+    single value or as a pair of the connect and read timeouts. Waits
+    forever if ``None``, which is the default.
+    """
+    tcp_nodelay: bool = True
+    """Whether to disable Nagle's algorithm. Defaults to ``True``."""
+    keep_alive: bool = True
+    """Whether to enable TCP keep-alive probes on the connections.
+    Defaults to ``True``.
+    """
+    adapter: Optional[BaseAdapter] = None
+    """The optional transport adapter through which the requests are
+    sent instead of HTTP connections, such as :class:`ReplayAdapter`.
+    The connection and socket settings are ignored if set.
+    """
     __session: Session = field(default_factory=Session, init=False)
+    __executor: ThreadPoolExecutor = field(init=False)
+    __workers: local = field(default_factory=local, init=False)
+    __base_url: str = field(init=False)
+    __cache_client: Hashable = field(init=False)
+    __trading_parameters: dict[str, tuple[float, int, int]] = field(
+        default_factory=dict,
+        init=False,
+        compare=False,
+        hash=False,
+    )
 
     def __post_init__(self) -> None:
+        socket_options = []
+
+        if self.tcp_nodelay:
+            socket_options.append((IPPROTO_TCP, TCP_NODELAY, 1))
+
+        if self.keep_alive:
+            socket_options.append((SOL_SOCKET, SO_KEEPALIVE, 1))
+
+        adapter = self.adapter
+
+        if adapter is None:
+            adapter = _HTTPAdapter(
+                socket_options,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=True,
+            )
+
+        self.__session.mount('http://', adapter)
         self.__session.headers.update({'X-API-Key': self.x_api_key})
+        object.__setattr__(
+            self,
+            '_RIT__executor',
+            ThreadPoolExecutor(
+                self.pool_maxsize,
+                initializer=setattr,
+                initargs=(self.__workers, 'is_worker', True),
+            ),
+        )
+        object.__setattr__(
+            self,
+            '_RIT__base_url',
+            f'http://{self.hostname}:{self.port}',
+        )
+        object.__setattr__(
+            self,
+            '_RIT__cache_client',
+            (self.__base_url, self.x_api_key, self.records, id(self.adapter)),
+        )
 
     @overload  # type: ignore[misc]
     def get_case(self) -> Case:
@@ -744,6 +1506,95 @@ class RIT:
         """
         return self.__get('/v1/securities/tas', kwargs)
 
+    def get_securities_book_arrays(self, **kwargs: Any) -> tuple[Any, Any]:
+        """Get the order book of a security as structured NumPy arrays.
+
+        This method requires NumPy. Each side of the book is decoded
+        straight into an array with the fields ``order_id``, ``price``,
+        and ``quantity``, where the quantity is the unfilled quantity of
+        the order. The orders are in the same order as in
+        :meth:`RIT.get_securities_book`.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> bids, asks = rit.get_securities_book_arrays(ticker='RITC')
+        >>> bids['price'][:2]
+        array([25.06, 25.05])
+        >>> float(asks['price'][0] - bids['price'][0])
+        0.04
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param limit: Maximum number of orders to return for each side of the
+                      order book. Defaults to ``20``.
+        :return: The bids and the asks.
+        """
+        data = self.__fetch('GET', '/v1/securities/book', kwargs)
+        bids, asks = _get_book_sides(data)
+
+        for orders in (bids, asks):
+            for order in orders:
+                order['quantity'] -= order['quantity_filled']
+
+        return (
+            _decode_array(bids, _BOOK_FIELDS),
+            _decode_array(asks, _BOOK_FIELDS),
+        )
+
+    def get_securities_history_array(self, **kwargs: Any) -> Any:
+        """Get the OHLC history for a security as a structured NumPy
+        array.
+
+        This method requires NumPy. The history is decoded straight
+        into an array with the fields ``tick``, ``open``, ``high``,
+        ``low``, and ``close``, in the same order as in
+        :meth:`RIT.get_securities_history`.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> histories = rit.get_securities_history_array(ticker='RITC')
+        >>> histories['close'].mean()
+        25.934241071428574
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param period: Period to retrieve data from. Defaults to the
+                       current period.
+        :param limit: Result set limit. How this value is interpreted
+                      is RIT REST API version dependent.
+        :return: The OHLC history.
+        """
+        return self.__get_array(
+            '/v1/securities/history',
+            kwargs,
+            _HISTORY_FIELDS,
+        )
+
+    def get_securities_tas_array(self, **kwargs: Any) -> Any:
+        """Get time and sales history for a security as a structured
+        NumPy array.
+
+        This method requires NumPy. The history is decoded straight
+        into an array with the fields ``id``, ``period``, ``tick``,
+        ``price``, and ``quantity``, in the same order as in
+        :meth:`RIT.get_securities_tas`.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> tas = rit.get_securities_tas_array(ticker='RITC')
+        >>> tas['id'][:2]
+        array([2099, 2098])
+        >>> prices = tas['price']
+        >>> quantities = tas['quantity']
+        >>> vwap = (prices * quantities).sum() / quantities.sum()
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param after: Retrieve only data with an
+                      :attr:`Security.TAS.id` value greater than this
+                      value.
+        :param period: Period to retrieve data from. Defaults to the
+                       current period.
+        :param limit: Result set limit. How this value is interpreted
+                      is RIT REST API version dependent.
+        :return: The time and sales history.
+        """
+        return self.__get_array('/v1/securities/tas', kwargs, _TAS_FIELDS)
+
     @overload
     def get_orders(
             self,
@@ -809,6 +1660,9 @@ class RIT:
         until the desired timeout has passed and try to post the order
         again.
 
+        If :attr:`RIT.rate_limiter` is set, the order is held back until
+        it can be sent without exceeding the rate limit.
+
         >>> rit = RIT('G4DNIZ5D')
         >>> order = rit.post_orders(
         ...     ticker='RITC',
@@ -842,6 +1696,9 @@ class RIT:
                         order was executed.
         :return: The newly posted order.
         """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(kwargs['ticker'])
+
         return self.__post('/v1/orders', kwargs, wait)
 
     @overload  # type: ignore[misc]
@@ -1105,56 +1962,4175 @@ class RIT:
         """
         return self.__post('/v1/commands/cancel', kwargs)
 
-    def __get(
+    def post_orders_bulk(
             self,
-            path: str,
-            parameters: dict[Any, Any],
+            orders: Iterable[Mapping[str, Any]],
             wait: bool = False,
-    ) -> Any:
-        return self.__request('GET', path, parameters, wait)
+    ) -> list[Order]:
+        """Insert new orders concurrently.
 
-    def __post(
-            self,
-            path: str,
-            parameters: dict[Any, Any],
-            wait: bool = False,
-    ) -> Any:
-        return self.__request('POST', path, parameters, wait)
+        Each order is posted through :meth:`RIT.post_orders`, and hence
+        paced by :attr:`RIT.rate_limiter` if set. If any order fails,
+        a :class:`BulkOrderError` with the posted orders is raised
+        after all orders are attempted.
 
-    def __delete(
-            self,
-            path: str,
-            parameters: dict[Any, Any],
-            wait: bool = False,
-    ) -> Any:
-        return self.__request('DELETE', path, parameters, wait)
+        >>> rit = RIT('G4DNIZ5D')
+        >>> orders = rit.post_orders_bulk(
+        ...     [
+        ...         {
+        ...             'ticker': 'RITC',
+        ...             'type': 'LIMIT',
+        ...             'quantity': 5,
+        ...             'action': 'BUY',
+        ...             'price': 24.5 - i / 100,
+        ...         }
+        ...         for i in range(3)
+        ...     ],
+        ... )
+        >>> [order.price for order in orders]
+        [24.5, 24.49, 24.48]
 
-    def __request(
-            self,
-            method: str,
-            path: str,
-            parameters: dict[Any, Any],
-            wait: bool = False,
-    ) -> Any:
-        data = None
+        :param orders: The parameters of the orders, as accepted by
+                       :meth:`RIT.post_orders`.
+        :param wait: Wait if rate limit is exceeded, defaults to
+                     ``False``.
+        :return: The newly posted orders, in the same order.
+        :raises BulkOrderError: If any order fails.
+        """
+        futures = [
+            self.__submit(partial(self.post_orders, wait, **order))
+            for order in orders
+        ]
 
-        while data is None:
-            response = self.__session.request(
-                method,
-                f'http://{self.hostname}:{self.port}{path}',
-                parameters,
-            )
-            data = response.json()
+        return self.__gather_orders(futures)
+
+    def post_orders_sliced(
+            self,
+            ticker: str,
+            quantity: float,
+            action: Order.Action,
+            type: Order.Type = Order.Type.MARKET,
+            price: Optional[float] = None,
+    ) -> FillReport:
+        """Insert an order of any quantity by splitting it into orders
+        of at most :attr:`Security.max_trade_size`.
+
+        The :attr:`Security.max_trade_size`,
+        :attr:`Security.api_orders_per_second`, and
+        :attr:`Security.execution_delay_ms` of the security are fetched
+        once and cached. The orders are posted concurrently, paced at
+        the maximum allowed rate by :attr:`RIT.rate_limiter` if set, in
+        which the rate of the security is set if missing, or by a rate
+        limiter of this call otherwise. Orders which are not
+        yet filled are fetched again after the execution delay.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> report = rit.post_orders_sliced('CRZY', 95000, 'SELL')
+        >>> len(report.orders)
+        10
+        >>> report.quantity_filled
+        95000.0
+        >>> report.vwap
+        24.9731...
+
+        :param ticker: The ticker.
+        :param quantity: The total quantity.
+        :param action: The order action.
+        :param type: The order type, defaults to
+                     :attr:`Order.Type.MARKET`.
+        :param price: The optional price. Required if type is
+                      :attr:`Order.Type.LIMIT`. Ignored otherwise.
+        :return: The fill report.
+        :raises ValueError: If the security is unknown or its
+                            :attr:`Security.max_trade_size` is not
+                            positive.
+        :raises BulkOrderError: If any order fails.
+        """
+        if ticker not in self.__trading_parameters:
+            securities = self.get_securities(ticker=ticker)
+
+            if not securities:
+                raise ValueError(f'unknown ticker {ticker!r}')
+
+            security = securities[0]
+            self.__trading_parameters[ticker] = (
+                security.max_trade_size,
+                security.api_orders_per_second,
+                security.execution_delay_ms,
+            )
+
+        max_trade_size, api_orders_per_second, execution_delay_ms = (
+            self.__trading_parameters[ticker]
+        )
+        rate_limiter = None
+
+        if self.rate_limiter is None:
+            rate_limiter = RateLimiter({ticker: api_orders_per_second})
+        elif api_orders_per_second > 0:
+            self.rate_limiter.rates.setdefault(ticker, api_orders_per_second)
+
+        futures = []
+
+        for child_quantity in _split_quantity(quantity, max_trade_size):
+            if rate_limiter is not None:
+                rate_limiter.acquire(ticker)
+
+            futures.append(
+                self.submit(
+                    'post_orders',
+                    True,
+                    ticker=ticker,
+                    type=type,
+                    quantity=child_quantity,
+                    action=action,
+                    price=price,
+                ),
+            )
+
+        orders = self.__gather_orders(futures)
+        unfilled_indices = [
+            i
+            for i, order in enumerate(orders)
+            if order.status == Order.Status.OPEN
+            and order.quantity_filled < order.quantity
+        ]
+
+        if unfilled_indices and execution_delay_ms:
+            sleep(execution_delay_ms / 1000)
+
+            unfilled_orders = self.gather(
+                *(
+                    self.submit('get_orders', orders[i].order_id)
+                    for i in unfilled_indices
+                ),
+                return_exceptions=True,
+            )
+
+            for i, order in zip(unfilled_indices, unfilled_orders):
+                if not isinstance(order, Exception):
+                    orders[i] = order
+
+        quantity_filled = 0.0
+        value = 0.0
+
+        for order in orders:
+            if order.quantity_filled:
+                quantity_filled += order.quantity_filled
+                value += order.quantity_filled * order.vwap
+
+        return FillReport(
+            orders,
+            quantity,
+            quantity_filled,
+            value / quantity_filled if quantity_filled else None,
+        )
+
+    def replace_quotes(
+            self,
+            ticker: str,
+            bids: Iterable[tuple[float, float]] = (),
+            asks: Iterable[tuple[float, float]] = (),
+            wait: bool = False,
+    ) -> tuple[Sequence[int], list[Order]]:
+        """Replace the open limit orders of a security with the quotes.
+
+        The quotes are compared against the open orders of the security.
+        The open orders which match a quote in their action, price, and
+        unfilled quantity are left untouched. The rest are cancelled in
+        a single request, while the unmatched quotes are concurrently
+        posted as new limit orders. The cancellation and the insertions
+        are sent at the same time.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> cancelled_order_ids, orders = rit.replace_quotes(
+        ...     'RITC',
+        ...     bids=[(24.5, 100), (24.49, 100)],
+        ...     asks=[(24.55, 100), (24.56, 100)],
+        ... )
+        >>> cancelled_order_ids
+        [3791, 3793]
+        >>> [order.price for order in orders]
+        [24.49, 24.56]
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param bids: The prices and quantities of the bid quotes.
+        :param asks: The prices and quantities of the ask quotes.
+        :param wait: Wait if rate limit is exceeded, defaults to
+                     ``False``.
+        :return: The :attr:`Order.order_id` of the cancelled orders and
+                 the newly posted orders.
+        """
+        quotes = Counter(
+            (action, price, quantity)
+            for action, quotes in (
+                (Order.Action.BUY, bids),
+                (Order.Action.SELL, asks),
+            )
+            for price, quantity in quotes
+        )
+        stale_ids = []
+
+        for order in self.get_orders(status=Order.Status.OPEN):
+            if order.ticker != ticker:
+                continue
+
+            key = (
+                Order.Action(order.action),
+                order.price,
+                order.quantity - order.quantity_filled,
+            )
+
+            if quotes[key] > 0:
+                quotes[key] -= 1
+            else:
+                stale_ids.append(order.order_id)
+
+        if stale_ids:
+            cancellation = self.__submit(
+                partial(
+                    self.post_commands_cancel,
+                    ids=','.join(map(str, stale_ids)),
+                ),
+            )
+
+        orders = self.post_orders_bulk(
+            (
+                {
+                    'ticker': ticker,
+                    'type': Order.Type.LIMIT,
+                    'quantity': quantity,
+                    'action': action,
+                    'price': price,
+                }
+                for action, price, quantity in quotes.elements()
+            ),
+            wait,
+        )
+        cancelled_order_ids: Sequence[int] = []
+
+        if stale_ids:
+            cancelled_order_ids = cancellation.result().cancelled_order_ids
+
+        return cancelled_order_ids, orders
+
+    def submit(
+            self,
+            method_name: str,
+            *args: Any,
+            **kwargs: Any,
+    ) -> Future[Any]:
+        """Call a method of this client in the background.
+
+        The calls are run on a thread pool with as many threads as
+        :attr:`RIT.pool_maxsize`. Errors, such as those raised for
+        error responses, are propagated through the returned futures.
+        The calls made from the thread pool itself, such as the
+        requests of :meth:`RIT.snapshot` when it is submitted, are run
+        immediately instead, so that they never wait for their own
+        threads.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> futures = [
+        ...     rit.submit('get_orders'),
+        ...     rit.submit('get_securities_book', ticker='CRZY'),
+        ...     rit.submit('get_securities_book', ticker='TAME'),
+        ...     rit.submit('get_tenders'),
+        ... ]
+        >>> orders, crzy_book, tame_book, tenders = rit.gather(*futures)
+
+        :param method_name: The name of the method, such as
+                            ``'get_securities_book'``.
+        :param args: The positional arguments of the method.
+        :param kwargs: The keyword arguments of the method.
+        :return: The future of the result.
+        """
+        return self.__submit(
+            partial(getattr(self, method_name), *args, **kwargs),
+        )
+
+    def gather(
+            self,
+            *futures: Future[Any],
+            return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Wait for the futures and return their results.
+
+        :param futures: The futures, usually returned by
+                        :meth:`RIT.submit`.
+        :param return_exceptions: Return the errors of the failed
+                                  futures in place of their results
+                                  instead of raising the first one,
+                                  defaults to ``False``.
+        :return: The results, in the same order.
+        """
+        results = []
+
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+
+                results.append(error)
+
+        return results
+
+    def snapshot(
+            self,
+            tickers: Iterable[str],
+            book_limit: Optional[int] = None,
+            include_tas: bool = True,
+            tas_limit: Optional[int] = None,
+            retries: int = 1,
+    ) -> Snapshot:
+        """Get the case, the securities, the order books, and the time
+        and sales histories of the tickers at once.
+
+        The underlying requests are sent concurrently, so the latency of
+        this method does not grow linearly with the number of tickers.
+        The case is fetched again once all responses arrived, and if the
+        tick changed in the meantime, the requests are sent again, up to
+        ``retries`` times, before the snapshot is returned with
+        :attr:`Snapshot.is_consistent` set to ``False``.
+
+        >>> rit = RIT('G4DNIZ5D')
+        >>> snapshot = rit.snapshot(['CRZY', 'TAME'], book_limit=5)
+        >>> snapshot.tick
+        83
+        >>> snapshot.books['CRZY'].bids[0].price
+        25.06
+        >>> snapshot.tas['CRZY'][0].price
+        25.06
+
+        :param tickers: The :attr:`Security.ticker` of the securities.
+        :param book_limit: Maximum number of orders to return for each
+                           side of the order books. Defaults to ``20``.
+        :param include_tas: Also fetch the time and sales histories,
+                            defaults to ``True``.
+        :param tas_limit: Result set limit of the time and sales
+                          histories. How this value is interpreted is
+                          RIT REST API version dependent.
+        :param retries: Maximum number of times to fetch the responses
+                        again if the tick changed, defaults to ``1``.
+        :return: The snapshot.
+        """
+        tickers = tuple(tickers)
+
+        for _ in range(retries):
+            snapshot = self.__fetch_snapshot(
+                tickers,
+                book_limit,
+                include_tas,
+                tas_limit,
+            )
+
+            if snapshot.is_consistent:
+                return snapshot
+
+        return self.__fetch_snapshot(
+            tickers,
+            book_limit,
+            include_tas,
+            tas_limit,
+        )
+
+    def __fetch_snapshot(
+            self,
+            tickers: Sequence[str],
+            book_limit: Optional[int],
+            include_tas: bool,
+            tas_limit: Optional[int],
+    ) -> Snapshot:
+        case = self.__submit(self.get_case)
+        securities = self.__submit(self.get_securities)
+        books = {}
+        tas = {}
+
+        for ticker in tickers:
+            books[ticker] = self.__submit(
+                partial(
+                    self.get_securities_book,
+                    ticker=ticker,
+                    limit=book_limit,
+                ),
+            )
+
+            if include_tas:
+                tas[ticker] = self.__submit(
+                    partial(
+                        self.get_securities_tas,
+                        ticker=ticker,
+                        limit=tas_limit,
+                    ),
+                )
+
+        snapshot = Snapshot(
+            case.result(),
+            securities.result(),
+            {ticker: future.result() for ticker, future in books.items()},
+            {ticker: future.result() for ticker, future in tas.items()},
+        )
+        last_case = self.__request('GET', '/v1/case', {}, use_cache=False)
+
+        if (
+                snapshot.period != last_case.period
+                or snapshot.tick != last_case.tick
+        ):
+            snapshot = replace(snapshot, is_consistent=False)
+
+        return snapshot
+
+    def __gather_orders(self, futures: Sequence[Future[Any]]) -> list[Any]:
+        results = self.gather(*futures, return_exceptions=True)
+        errors = [
+            result if isinstance(result, Exception) else None
+            for result in results
+        ]
+
+        for error in errors:
+            if error is not None:
+                raise BulkOrderError(
+                    [
+                        None if isinstance(result, Exception) else result
+                        for result in results
+                    ],
+                    errors,
+                ) from error
+
+        return results
+
+    def __submit(self, function: Callable[[], Any]) -> Future[Any]:
+        if not getattr(self.__workers, 'is_worker', False):
+            return self.__executor.submit(function)
+
+        future: Future[Any] = Future()
+
+        try:
+            future.set_result(function())
+        except Exception as error:
+            future.set_exception(error)
+
+        return future
+
+    def __get_array(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            fields: Sequence[tuple[str, str]],
+    ) -> Any:
+        return _decode_array(self.__fetch('GET', path, parameters), fields)
+
+    def __get(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            wait: bool = False,
+    ) -> Any:
+        return self.__request('GET', path, parameters, wait)
+
+    def __post(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            wait: bool = False,
+    ) -> Any:
+        return self.__request('POST', path, parameters, wait)
+
+    def __delete(
+            self,
+            path: str,
+            parameters: dict[Any, Any],
+            wait: bool = False,
+    ) -> Any:
+        return self.__request('DELETE', path, parameters, wait)
+
+    def __request(
+            self,
+            method: str,
+            path: str,
+            parameters: dict[Any, Any],
+            wait: bool = False,
+            use_cache: bool = True,
+    ) -> Any:
+        cache = self.cache
+
+        if cache is not None and method == 'GET' and use_cache:
+            data = cache.get(path, parameters, self.__cache_client)
+
+            if data is not None:
+                return _copy_records(data)
+
+        try:
+            data = self.__fetch(method, path, parameters, wait)
+        finally:
+            if cache is not None and method != 'GET':
+                cache.clear()
+
+        if self.records:
+            data = _decode_records(data)
+        else:
+            data = _decode_nested(data)
+
+        if cache is not None and method == 'GET':
+            cache.put(
+                path,
+                parameters,
+                _copy_records(data),
+                self.__cache_client,
+            )
+
+        return data
+
+    def __fetch(
+            self,
+            method: str,
+            path: str,
+            parameters: dict[Any, Any],
+            wait: bool = False,
+    ) -> Any:
+        timestamp = time()
+        start_time = perf_counter()
+        attempt_count = 0
+        wait_time = 0.0
+        data = None
+
+        while data is None:
+            response = self.__session.request(
+                method,
+                self.__base_url + path,
+                parameters,
+                timeout=self.timeout,
+            )
+            decoding_start_time = perf_counter()
+            data = self.decoder(response.content)
+            decoding_time = perf_counter() - decoding_start_time
+            attempt_count += 1
 
             if wait and not response.ok and 'wait' in data:
                 sleep(data['wait'])
+
+                wait_time += data['wait']
                 data = None
             else:
-                response.raise_for_status()
+                if self.hooks:
+                    event = RequestEvent(
+                        timestamp,
+                        method,
+                        path,
+                        parameters,
+                        response.status_code,
+                        response.content,
+                        perf_counter() - start_time,
+                        decoding_time,
+                        attempt_count,
+                        wait_time,
+                    )
+
+                    for hook in self.hooks:
+                        try:
+                            hook(event)
+                        except Exception as error:
+                            print_exception(
+                                type(error),
+                                error,
+                                error.__traceback__,
+                            )
 
-        if not isinstance(data, str) and isinstance(data, Sequence):
-            data = _NestedSequence(data)
-        elif isinstance(data, Mapping):
-            data = _NestedMapping(data)
+                response.raise_for_status()
 
         return data
+
+
+@dataclass(frozen=True)
+class AsyncRIT:
+    """This class contains the asynchronous counterparts of the methods
+    of :class:`RIT`.
+
+    The blocking requests are submitted through :meth:`RIT.submit` to the
+    thread pool of the underlying :class:`RIT`, whose threads share its
+    keep-alive connection pool, and their futures are awaited. As such,
+    a single event loop can await many independent requests
+    concurrently, and the latency of a batch of requests is roughly that
+    of the slowest one instead of their sum.
+
+    >>> from asyncio import gather, run
+    >>> async def main():
+    ...     rit = AsyncRIT(RIT('G4DNIZ5D'))
+    ...     case, book = await gather(
+    ...         rit.get_case(),
+    ...         rit.get_securities_book(ticker='RITC'),
+    ...     )
+    ...     return case.tick, book.bids[0].price
+    >>> run(main())
+    (83, 25.06)
+    """
+
+    rit: RIT
+    """The underlying synchronous RIT client."""
+
+    @overload  # type: ignore[misc]
+    async def get_case(self) -> Case:
+        pass
+
+    async def get_case(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_case`.
+
+        :return: The awaited result of :meth:`RIT.get_case`.
+        """
+        return await self.__call('get_case', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_trader(self) -> Trader:
+        pass
+
+    async def get_trader(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_trader`.
+
+        :return: The awaited result of :meth:`RIT.get_trader`.
+        """
+        return await self.__call('get_trader', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_limits(self) -> Sequence[Limit]:
+        pass
+
+    async def get_limits(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_limits`.
+
+        :return: The awaited result of :meth:`RIT.get_limits`.
+        """
+        return await self.__call('get_limits', **kwargs)
+
+    @overload
+    async def get_news(
+            self,
+            *,
+            since: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Sequence[News]:
+        pass
+
+    @overload
+    async def get_news(
+            self,
+            *,
+            after: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Sequence[News]:
+        pass
+
+    async def get_news(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_news`.
+
+        :return: The awaited result of :meth:`RIT.get_news`.
+        """
+        return await self.__call('get_news', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_assets(
+            self,
+            *,
+            ticker: Optional[str] = None,
+    ) -> Sequence[Asset]:
+        pass
+
+    async def get_assets(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_assets`.
+
+        :return: The awaited result of :meth:`RIT.get_assets`.
+        """
+        return await self.__call('get_assets', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_assets_history(
+            self,
+            *,
+            ticker: Optional[str] = None,
+            period: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Sequence[Asset.History]:
+        pass
+
+    async def get_assets_history(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_assets_history`.
+
+        :return: The awaited result of :meth:`RIT.get_assets_history`.
+        """
+        return await self.__call('get_assets_history', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_securities(
+            self,
+            *,
+            ticker: Optional[str] = None,
+    ) -> Sequence[Security]:
+        pass
+
+    async def get_securities(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities`.
+
+        :return: The awaited result of :meth:`RIT.get_securities`.
+        """
+        return await self.__call('get_securities', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_securities_book(
+            self,
+            *,
+            ticker: str,
+            limit: Optional[int] = None,
+    ) -> Security.Book:
+        pass
+
+    async def get_securities_book(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities_book`.
+
+        :return: The awaited result of :meth:`RIT.get_securities_book`.
+        """
+        return await self.__call('get_securities_book', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_securities_history(
+            self,
+            *,
+            ticker: str,
+            period: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Sequence[Security.History]:
+        pass
+
+    async def get_securities_history(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities_history`.
+
+        :return: The awaited result of :meth:`RIT.get_securities_history`.
+        """
+        return await self.__call('get_securities_history', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_securities_tas(
+            self,
+            *,
+            ticker: str,
+            after: Optional[int] = None,
+            period: Optional[int] = None,
+            limit: Optional[int] = None,
+    ) -> Sequence[Security.TAS]:
+        pass
+
+    async def get_securities_tas(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities_tas`.
+
+        :return: The awaited result of :meth:`RIT.get_securities_tas`.
+        """
+        return await self.__call('get_securities_tas', **kwargs)
+
+    async def get_securities_book_arrays(
+            self,
+            **kwargs: Any,
+    ) -> tuple[Any, Any]:
+        """Asynchronously call :meth:`RIT.get_securities_book_arrays`.
+
+        :return: The awaited result of :meth:`RIT.get_securities_book_arrays`.
+        """
+        arrays: tuple[Any, Any] = await self.__call(
+            'get_securities_book_arrays',
+            **kwargs,
+        )
+
+        return arrays
+
+    async def get_securities_history_array(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities_history_array`.
+
+        :return: The awaited result of
+                 :meth:`RIT.get_securities_history_array`.
+        """
+        return await self.__call('get_securities_history_array', **kwargs)
+
+    async def get_securities_tas_array(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_securities_tas_array`.
+
+        :return: The awaited result of :meth:`RIT.get_securities_tas_array`.
+        """
+        return await self.__call('get_securities_tas_array', **kwargs)
+
+    @overload
+    async def get_orders(
+            self,
+            *,
+            status: Optional[Order.Status] = None,
+    ) -> Sequence[Order]:
+        pass
+
+    @overload
+    async def get_orders(self, id: int) -> Order:
+        pass
+
+    async def get_orders(self, id: Optional[int] = None, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_orders`.
+
+        :return: The awaited result of :meth:`RIT.get_orders`.
+        """
+        return await self.__call('get_orders', id, **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def post_orders(
+            self,
+            wait: bool = False,
+            *,
+            ticker: str,
+            type: Order.Type,
+            quantity: float,
+            action: Order.Action,
+            price: Optional[float] = None,
+            dry_run: Optional[int] = None,
+    ) -> Order:
+        pass
+
+    async def post_orders(self, wait: bool = False, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.post_orders`.
+
+        :return: The awaited result of :meth:`RIT.post_orders`.
+        """
+        return await self.__call('post_orders', wait, **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def delete_orders(self, id: int) -> SuccessResult:
+        pass
+
+    async def delete_orders(self, id: int, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.delete_orders`.
+
+        :return: The awaited result of :meth:`RIT.delete_orders`.
+        """
+        return await self.__call('delete_orders', id, **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def get_tenders(self) -> Sequence[Tender]:
+        pass
+
+    async def get_tenders(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_tenders`.
+
+        :return: The awaited result of :meth:`RIT.get_tenders`.
+        """
+        return await self.__call('get_tenders', **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def post_tenders(
+            self,
+            id: int,
+            *,
+            price: Optional[float] = None,
+    ) -> SuccessResult:
+        pass
+
+    async def post_tenders(self, id: int, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.post_tenders`.
+
+        :return: The awaited result of :meth:`RIT.post_tenders`.
+        """
+        return await self.__call('post_tenders', id, **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def delete_tenders(self, id: int) -> SuccessResult:
+        pass
+
+    async def delete_tenders(self, id: int, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.delete_tenders`.
+
+        :return: The awaited result of :meth:`RIT.delete_tenders`.
+        """
+        return await self.__call('delete_tenders', id, **kwargs)
+
+    @overload
+    async def get_leases(self) -> Sequence[Asset.Lease]:
+        pass
+
+    @overload
+    async def get_leases(self, id: int) -> Asset.Lease:
+        pass
+
+    async def get_leases(self, id: Optional[int] = None, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.get_leases`.
+
+        :return: The awaited result of :meth:`RIT.get_leases`.
+        """
+        return await self.__call('get_leases', id, **kwargs)
+
+    @overload
+    async def post_leases(
+            self,
+            *,
+            ticker: str,
+            from1: Optional[str] = None,
+            quantity1: Optional[float] = None,
+            from2: Optional[str] = None,
+            quantity2: Optional[float] = None,
+            from3: Optional[str] = None,
+            quantity3: Optional[float] = None,
+    ) -> Asset.Lease:
+        pass
+
+    @overload
+    async def post_leases(
+            self,
+            id: int,
+            *,
+            from1: str,
+            quantity1: float,
+            from2: Optional[str] = None,
+            quantity2: Optional[float] = None,
+            from3: Optional[str] = None,
+            quantity3: Optional[float] = None,
+    ) -> Asset.Lease:
+        pass
+
+    async def post_leases(
+            self,
+            id: Optional[int] = None,
+            **kwargs: Any,
+    ) -> Any:
+        """Asynchronously call :meth:`RIT.post_leases`.
+
+        :return: The awaited result of :meth:`RIT.post_leases`.
+        """
+        return await self.__call('post_leases', id, **kwargs)
+
+    @overload  # type: ignore[misc]
+    async def delete_leases(self, id: int) -> SuccessResult:
+        pass
+
+    async def delete_leases(self, id: int, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.delete_leases`.
+
+        :return: The awaited result of :meth:`RIT.delete_leases`.
+        """
+        return await self.__call('delete_leases', id, **kwargs)
+
+    @overload
+    async def post_commands_cancel(
+            self,
+            *,
+            all: Literal[1],
+    ) -> CancellationResult:
+        pass
+
+    @overload
+    async def post_commands_cancel(self, *, ticker: str) -> CancellationResult:
+        pass
+
+    @overload
+    async def post_commands_cancel(self, *, ids: str) -> CancellationResult:
+        pass
+
+    @overload
+    async def post_commands_cancel(self, *, query: str) -> CancellationResult:
+        pass
+
+    async def post_commands_cancel(self, **kwargs: Any) -> Any:
+        """Asynchronously call :meth:`RIT.post_commands_cancel`.
+
+        :return: The awaited result of :meth:`RIT.post_commands_cancel`.
+        """
+        return await self.__call('post_commands_cancel', **kwargs)
+
+    async def __call(
+            self,
+            method_name: str,
+            *args: Any,
+            **kwargs: Any,
+    ) -> Any:
+        return await wrap_future(self.rit.submit(method_name, *args, **kwargs))
+
+
+_DEFAULT_LIMIT = 20
+
+
+def _take_new(
+        fetch: Callable[..., Sequence[Any]],
+        key: str,
+        cursor: int,
+        limit: Optional[int],
+) -> tuple[list[Any], int]:
+    items = fetch(limit=limit)
+
+    while (
+            items
+            and len(items) >= (_DEFAULT_LIMIT if limit is None else limit)
+            and min(item[key] for item in items) > cursor + 1
+    ):
+        limit = 2 * max(len(items), limit or 0)
+        items = fetch(limit=limit)
+
+    new_items = [item for item in items if item[key] > cursor]
+
+    new_items.sort(key=lambda item: item[key])
+
+    if new_items:
+        cursor = new_items[-1][key]
+
+    return new_items, cursor
+
+
+@dataclass
+class TASStream:
+    """This class is for incrementally fetching the time and sales
+    histories of securities.
+
+    The last :attr:`Security.TAS.id` of each ticker is kept as a cursor
+    and passed as ``after``, so that only the newly printed trades are
+    requested on each update. As the result set limit counts backwards
+    from the most recent trade, a full response whose oldest trade is
+    not right after the cursor is fetched again with a doubled limit,
+    until no trade is left out. The new trades are appended in
+    chronological order to a bounded buffer per ticker, discarding the
+    oldest ones if full.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> stream = TASStream(rit, ['RITC'])
+    >>> len(stream.update()['RITC'])  # All trades since the start
+    579
+    >>> stream.update()
+    {'RITC': []}
+    >>> stream.cursors['RITC']
+    2099
+    >>> stream.buffers['RITC'][-1].price
+    26.33
+    """
+
+    rit: RIT
+    """The RIT client."""
+    tickers: Sequence[str]
+    """The :attr:`Security.ticker` of the securities."""
+    maxlen: Optional[int] = 10000
+    """The maximum number of trades buffered per ticker. Unbounded if
+    ``None``. Defaults to ``10000``.
+    """
+    limit: Optional[int] = None
+    """The initial result set limit of each update, doubled as needed.
+    How this value is interpreted is RIT REST API version dependent.
+    """
+    cursors: dict[str, int] = field(default_factory=dict, init=False)
+    """The last :attr:`Security.TAS.id` seen, keyed by ticker."""
+    buffers: dict[str, deque[Security.TAS]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The buffered trades, keyed by ticker, from oldest to newest."""
+
+    def __post_init__(self) -> None:
+        for ticker in self.tickers:
+            self.cursors[ticker] = 0
+            self.buffers[ticker] = deque(maxlen=self.maxlen)
+
+    def update(self) -> dict[str, list[Security.TAS]]:
+        """Fetch and buffer the trades printed since the last update.
+
+        :return: The new trades from oldest to newest, keyed by ticker.
+        """
+        updates = {}
+
+        for ticker in self.tickers:
+            updates[ticker], self.cursors[ticker] = _take_new(
+                partial(
+                    self.rit.get_securities_tas,
+                    ticker=ticker,
+                    after=self.cursors[ticker],
+                ),
+                'id',
+                self.cursors[ticker],
+                self.limit,
+            )
+
+            self.buffers[ticker].extend(updates[ticker])
+
+        return updates
+
+
+@dataclass
+class NewsStream:
+    """This class is for incrementally fetching the news.
+
+    The last :attr:`News.news_id` is kept as a cursor, so that only the
+    news items published since the last update are requested. Like
+    :class:`TASStream`, a full response whose oldest item is not right
+    after the cursor is fetched again with a doubled limit. The new
+    items are appended in chronological order to a bounded buffer,
+    discarding the oldest ones if full.
+
+    The cursor is passed as ``after`` by default. For RIT Client
+    applications with REST API ``v1.0.3`` or lower, ``cursor_name``
+    must be set to ``'since'``.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> stream = NewsStream(rit)
+    >>> stream.update()
+    [{'news_id': 1, 'period': 1, 'tick': 0, 'ticker': '', ...}, ...]
+    >>> stream.update()
+    []
+    """
+
+    rit: RIT
+    """The RIT client."""
+    maxlen: Optional[int] = 1000
+    """The maximum number of news items buffered. Unbounded if
+    ``None``. Defaults to ``1000``.
+    """
+    limit: Optional[int] = None
+    """The initial result set limit of each update, counting backwards
+    from the most recent news item, doubled as needed. Defaults to
+    ``20``.
+    """
+    cursor_name: Literal['after', 'since'] = 'after'
+    """The name of the cursor parameter. Defaults to ``'after'``."""
+    cursor: int = field(default=0, init=False)
+    """The last :attr:`News.news_id` seen."""
+    buffer: deque[News] = field(init=False)
+    """The buffered news items from oldest to newest."""
+
+    def __post_init__(self) -> None:
+        self.buffer = deque(maxlen=self.maxlen)
+
+    def update(self) -> list[News]:
+        """Fetch and buffer the news published since the last update.
+
+        :return: The new news items from oldest to newest.
+        """
+        parameters: dict[str, Any] = {self.cursor_name: self.cursor}
+        update, self.cursor = _take_new(
+            partial(self.rit.get_news, **parameters),
+            'news_id',
+            self.cursor,
+            self.limit,
+        )
+
+        self.buffer.extend(update)
+
+        return update
+
+
+@dataclass
+class _Ladder:
+    is_descending: bool = False
+    keys: list[float] = field(default_factory=list)
+    prices: list[float] = field(default_factory=list)
+    sizes: list[float] = field(default_factory=list)
+    cumulative_sizes: list[float] = field(default_factory=list)
+    cumulative_values: list[float] = field(default_factory=list)
+    indices: dict[float, int] = field(default_factory=dict)
+    stale_index: int = 0
+
+    def key(self, price: float) -> float:
+        return -price if self.is_descending else price
+
+    def add(self, price: float, size: float) -> None:
+        index = self.indices.get(price)
+
+        if index is None:
+            key = self.key(price)
+            index = bisect_left(self.keys, key)
+
+            self.keys.insert(index, key)
+            self.prices.insert(index, price)
+            self.sizes.insert(index, 0.0)
+            self.cumulative_sizes.insert(index, 0.0)
+            self.cumulative_values.insert(index, 0.0)
+            self.reindex(index)
+
+        self.sizes[index] += size
+
+        if self.sizes[index] <= 0:
+            del self.keys[index]
+            del self.prices[index]
+            del self.sizes[index]
+            del self.cumulative_sizes[index]
+            del self.cumulative_values[index]
+            del self.indices[price]
+            self.reindex(index)
+
+        self.stale_index = min(self.stale_index, index)
+
+    def reindex(self, start: int) -> None:
+        for index in range(start, len(self.prices)):
+            self.indices[self.prices[index]] = index
+
+    def refresh(self) -> None:
+        if self.stale_index:
+            total_size = self.cumulative_sizes[self.stale_index - 1]
+            total_value = self.cumulative_values[self.stale_index - 1]
+        else:
+            total_size = 0.0
+            total_value = 0.0
+
+        for index in range(self.stale_index, len(self.prices)):
+            total_size += self.sizes[index]
+            total_value += self.prices[index] * self.sizes[index]
+            self.cumulative_sizes[index] = total_size
+            self.cumulative_values[index] = total_value
+
+        self.stale_index = len(self.prices)
+
+
+@dataclass
+class BookMirror:
+    """This class is for local mirrors of order books.
+
+    Each update fetches the order book of a ticker, computes the
+    difference against the previous poll by :attr:`Order.order_id`, and
+    applies only the difference to the price levels, recomputing the
+    cumulative sizes from the best changed level onwards, so that the
+    best prices and the depths at price levels can be queried in
+    constant time, and the cumulative sizes in logarithmic time.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> mirror = BookMirror(rit)
+    >>> diff = mirror.update('RITC')
+    >>> len(diff.added)
+    40
+    >>> mirror.best_bid('RITC'), mirror.best_ask('RITC')
+    (25.06, 25.1)
+    >>> mirror.depth('RITC', Order.Action.BUY, 25.06)
+    1200.0
+    >>> mirror.cumulative_size('RITC', Order.Action.SELL, 25.11)
+    3400.0
+    >>> diff = mirror.update('RITC')
+    >>> diff.changed
+    [{'order_id': 2505, 'period': 1, 'tick': 133, ...}]
+    """
+
+    @dataclass(frozen=True)
+    class Diff:
+        """This class is for differences between two polls of an order
+        book.
+        """
+
+        added: list[Order]
+        """The orders which appeared."""
+        removed: list[Order]
+        """The orders which disappeared, filled or cancelled."""
+        changed: list[Order]
+        """The orders whose price, quantity, or filled quantity
+        changed.
+        """
+
+    rit: RIT
+    """The RIT client."""
+    limit: Optional[int] = None
+    """Maximum number of orders to fetch for each side of the order
+    books. Defaults to ``20``.
+    """
+    orders: dict[str, dict[int, Order]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The orders in the order books, keyed by ticker and
+    :attr:`Order.order_id`.
+    """
+    __ladders: dict[tuple[str, Order.Action], _Ladder] = field(
+        default_factory=dict,
+        init=False,
+    )
+
+    def update(self, ticker: str) -> BookMirror.Diff:
+        """Fetch the order book of the security and apply it.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The difference against the previous order book.
+        """
+        book = self.rit.get_securities_book(ticker=ticker, limit=self.limit)
+
+        return self.apply(ticker, book)
+
+    def apply(self, ticker: str, book: Security.Book) -> BookMirror.Diff:
+        """Apply an already fetched order book of the security.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param book: The order book.
+        :return: The difference against the previous order book.
+        """
+        old_orders = self.orders.get(ticker, {})
+        new_orders = {}
+        added = []
+        changed = []
+
+        for orders in _get_book_sides(book):
+            for order in orders:
+                new_orders[order.order_id] = order
+                old_order = old_orders.get(order.order_id)
+
+                if old_order is None:
+                    added.append(order)
+                elif (
+                        old_order.price != order.price
+                        or old_order.quantity != order.quantity
+                        or old_order.quantity_filled != order.quantity_filled
+                ):
+                    changed.append(order)
+
+        removed = [
+            order
+            for order_id, order in old_orders.items()
+            if order_id not in new_orders
+        ]
+        self.orders[ticker] = new_orders
+
+        for order in removed:
+            self.__add(ticker, order, -1)
+
+        for order in changed:
+            self.__add(ticker, old_orders[order.order_id], -1)
+            self.__add(ticker, order, 1)
+
+        for order in added:
+            self.__add(ticker, order, 1)
+
+        for action in (Order.Action.BUY, Order.Action.SELL):
+            self.__ladder(ticker, action).refresh()
+
+        return BookMirror.Diff(added, removed, changed)
+
+    def best_bid(self, ticker: str) -> Optional[float]:
+        """Return the best bid price of the security.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The best bid price, or ``None`` if there are no bids.
+        """
+        prices = self.__ladder(ticker, Order.Action.BUY).prices
+
+        return prices[0] if prices else None
+
+    def best_ask(self, ticker: str) -> Optional[float]:
+        """Return the best ask price of the security.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The best ask price, or ``None`` if there are no asks.
+        """
+        prices = self.__ladder(ticker, Order.Action.SELL).prices
+
+        return prices[0] if prices else None
+
+    def depth(self, ticker: str, action: Order.Action, price: float) -> float:
+        """Return the unfilled quantity resting at the price level.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param action: The side of the order book, :attr:`Order.Action.BUY`
+                       for the bids and :attr:`Order.Action.SELL` for the
+                       asks.
+        :param price: The price level.
+        :return: The unfilled quantity at the price level.
+        """
+        ladder = self.__ladder(ticker, action)
+        index = ladder.indices.get(price)
+
+        return 0.0 if index is None else ladder.sizes[index]
+
+    def cumulative_size(
+            self,
+            ticker: str,
+            action: Order.Action,
+            price: float,
+    ) -> float:
+        """Return the unfilled quantity resting at the price and all
+        better prices.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param action: The side of the order book, :attr:`Order.Action.BUY`
+                       for the bids and :attr:`Order.Action.SELL` for the
+                       asks.
+        :param price: The price.
+        :return: The cumulative unfilled quantity.
+        """
+        ladder = self.__ladder(ticker, action)
+        index = bisect_right(ladder.keys, ladder.key(price))
+
+        return ladder.cumulative_sizes[index - 1] if index else 0.0
+
+    def vwap(
+            self,
+            ticker: str,
+            action: Order.Action,
+            quantity: float,
+    ) -> Optional[float]:
+        """Return the average price of taking the quantity from a side of
+        the order book, walking down the price levels.
+
+        The cost is logarithmic in the number of price levels.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param action: The side of the order book, :attr:`Order.Action.BUY`
+                       for the bids and :attr:`Order.Action.SELL` for the
+                       asks.
+        :param quantity: The quantity.
+        :return: The volume-weighted average price, or ``None`` if the
+                 side of the order book is not deep enough.
+        """
+        ladder = self.__ladder(ticker, action)
+        index = bisect_left(ladder.cumulative_sizes, quantity)
+
+        if quantity <= 0 or index == len(ladder.prices):
+            return None
+
+        excess = ladder.cumulative_sizes[index] - quantity
+        value = ladder.cumulative_values[index] - excess * ladder.prices[index]
+
+        return value / quantity
+
+    def __ladder(self, ticker: str, action: Order.Action) -> _Ladder:
+        key = ticker, Order.Action(action)
+
+        if key not in self.__ladders:
+            self.__ladders[key] = _Ladder(action == Order.Action.BUY)
+
+        return self.__ladders[key]
+
+    def __add(self, ticker: str, order: Order, sign: int) -> None:
+        self.__ladder(ticker, order.action).add(
+            order.price,
+            sign * (order.quantity - order.quantity_filled),
+        )
+
+
+@dataclass
+class MarketFeed:
+    """This class is for sharing a single polling loop among strategies.
+
+    Once started, a background thread repeatedly takes
+    :meth:`RIT.snapshot` at the interval and publishes each snapshot to
+    the subscribed callbacks and queues. The snapshots are immutable, so
+    they can be safely shared among the threads of the strategies.
+
+    The callbacks are invoked from the polling thread and should return
+    quickly. The queues are bounded; if a queue is full, its oldest
+    snapshot is discarded in favor of the newest one.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> with MarketFeed(rit, ['CRZY', 'TAME']) as feed:
+    ...     snapshots = feed.queue()
+    ...     snapshot = snapshots.get()
+    >>> snapshot.books['CRZY'].bids[0].price
+    25.06
+    """
+
+    rit: RIT
+    """The RIT client."""
+    tickers: Sequence[str]
+    """The :attr:`Security.ticker` of the securities."""
+    interval: float = 0.1
+    """The number of seconds between the starts of consecutive polls.
+    Defaults to ``0.1``.
+    """
+    book_limit: Optional[int] = None
+    """Maximum number of orders to fetch for each side of the order
+    books. Defaults to ``20``.
+    """
+    include_tas: bool = True
+    """Whether to fetch the time and sales histories. Defaults to
+    ``True``.
+    """
+    tas_limit: Optional[int] = None
+    """The result set limit of the time and sales histories."""
+    on_error: Optional[Callable[[Exception], None]] = None
+    """The optional callable invoked with the errors raised while
+    polling or by the callbacks. The errors are printed to the standard
+    error if ``None``. The polling continues regardless.
+    """
+    snapshot: Optional[Snapshot] = field(default=None, init=False)
+    """The most recent snapshot."""
+    __callbacks: list[Callable[[Snapshot], None]] = field(
+        default_factory=list,
+        init=False,
+    )
+    __queues: list[Queue[Snapshot]] = field(default_factory=list, init=False)
+    __lock: Lock = field(default_factory=Lock, init=False)
+    __stop: Event = field(default_factory=Event, init=False)
+    __thread: Optional[Thread] = field(default=None, init=False)
+
+    def __enter__(self) -> MarketFeed:
+        self.start()
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def subscribe(self, callback: Callable[[Snapshot], None]) -> None:
+        """Invoke the callback with every new snapshot.
+
+        :param callback: The callback.
+        :return: ``None``.
+        """
+        with self.__lock:
+            self.__callbacks.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Snapshot], None]) -> None:
+        """Stop invoking the callback.
+
+        :param callback: The callback.
+        :return: ``None``.
+        """
+        with self.__lock:
+            self.__callbacks.remove(callback)
+
+    def queue(self, maxsize: int = 1) -> Queue[Snapshot]:
+        """Create a queue into which every new snapshot is put.
+
+        :param maxsize: The maximum number of snapshots in the queue.
+                        Defaults to ``1``.
+        :return: The queue.
+        """
+        queue: Queue[Snapshot] = Queue(maxsize)
+
+        with self.__lock:
+            self.__queues.append(queue)
+
+        return queue
+
+    def start(self) -> None:
+        """Start polling in a background thread, unless already
+        started.
+
+        :return: ``None``.
+        """
+        with self.__lock:
+            if self.__thread is not None and self.__thread.is_alive():
+                return
+
+            self.__stop.clear()
+
+            self.__thread = Thread(target=self.__run, daemon=True)
+
+            self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and wait for the background thread to finish.
+
+        :return: ``None``.
+        """
+        self.__stop.set()
+
+        if self.__thread is not None:
+            self.__thread.join()
+
+            self.__thread = None
+
+    def publish(self, snapshot: Snapshot) -> None:
+        """Publish the snapshot to the subscribers.
+
+        The errors raised by the callbacks are passed to
+        :attr:`MarketFeed.on_error`, and do not prevent the snapshot
+        from being published to the other subscribers.
+
+        :param snapshot: The snapshot.
+        :return: ``None``.
+        """
+        self.snapshot = snapshot
+
+        with self.__lock:
+            callbacks = tuple(self.__callbacks)
+            queues = tuple(self.__queues)
+
+        for callback in callbacks:
+            try:
+                callback(snapshot)
+            except Exception as error:
+                self.__handle(error)
+
+        for queue in queues:
+            while True:
+                try:
+                    queue.put_nowait(snapshot)
+                except Full:
+                    try:
+                        queue.get_nowait()
+                    except Empty:
+                        pass
+                else:
+                    break
+
+    def __run(self) -> None:
+        while not self.__stop.is_set():
+            start_time = monotonic()
+
+            try:
+                snapshot = self.rit.snapshot(
+                    self.tickers,
+                    self.book_limit,
+                    self.include_tas,
+                    self.tas_limit,
+                )
+            except Exception as error:
+                self.__handle(error)
+            else:
+                self.publish(snapshot)
+
+            self.__stop.wait(
+                max(self.interval - (monotonic() - start_time), 0.0),
+            )
+
+    def __handle(self, error: Exception) -> None:
+        try:
+            if self.on_error is None:
+                raise error
+
+            self.on_error(error)
+        except Exception as unhandled_error:
+            print_exception(
+                type(unhandled_error),
+                unhandled_error,
+                unhandled_error.__traceback__,
+            )
+
+
+@dataclass
+class TickScheduler:
+    """This class is for invoking handlers once per tick of the case.
+
+    The scheduler learns the duration of a tick from the times at which
+    new ticks are observed, counting the ticks across periods with
+    :attr:`Case.ticks_per_period`. Between ticks, it sleeps until
+    shortly before the next tick is expected, and only then polls
+    :meth:`RIT.get_case` at a fine interval. While the case is paused,
+    it polls at a coarse interval, and the time spent paused is not
+    counted towards the tick duration. It returns once the case is
+    stopped.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> scheduler = TickScheduler(rit)
+    >>> scheduler.register(lambda case: print(case.tick))
+    >>> scheduler.run()
+    83
+    84
+    85
+    ...
+    """
+
+    rit: RIT
+    """The RIT client."""
+    poll_interval: float = 0.01
+    """The number of seconds between polls near the expected start of a
+    tick. Defaults to ``0.01``.
+    """
+    pause_interval: float = 0.5
+    """The number of seconds between polls while the case is paused.
+    Defaults to ``0.5``.
+    """
+    lead_time: float = 0.05
+    """The number of seconds before the expected start of a tick at which
+    the polling resumes. Defaults to ``0.05``.
+    """
+    smoothing: float = 0.2
+    """The weight of the latest observation in the exponential moving
+    average of the tick duration. Defaults to ``0.2``.
+    """
+    tick_duration: Optional[float] = field(default=None, init=False)
+    """The learned number of seconds per tick, if any."""
+    __handlers: list[Callable[[Case], None]] = field(
+        default_factory=list,
+        init=False,
+    )
+    __stop: Event = field(default_factory=Event, init=False)
+    __tick: Optional[tuple[int, int]] = field(default=None, init=False)
+    __tick_time: Optional[float] = field(default=None, init=False)
+
+    def register(self, handler: Callable[[Case], None]) -> None:
+        """Invoke the handler with the case on every new tick.
+
+        :param handler: The handler.
+        :return: ``None``.
+        """
+        self.__handlers.append(handler)
+
+    def run(self) -> None:
+        """Invoke the handlers on every new tick until the case is
+        stopped or :meth:`TickScheduler.stop` is called.
+
+        :return: ``None``.
+        """
+        self.__stop.clear()
+
+        while not self.__stop.is_set():
+            delay = self.poll()
+
+            if delay is None:
+                break
+
+            self.__stop.wait(delay)
+
+    def poll(self) -> Optional[float]:
+        """Fetch the case once and invoke the handlers if a new tick has
+        started.
+
+        :return: The number of seconds to wait before polling again, or
+                 ``None`` if the case is stopped.
+        """
+        case = self.rit.get_case()
+        now = monotonic()
+
+        if case.status == Case.Status.STOPPED:
+            return None
+        elif case.status == Case.Status.PAUSED:
+            self.__tick_time = None
+
+            return self.pause_interval
+
+        tick = case.period, case.tick
+
+        if tick != self.__tick:
+            if self.__tick is not None and self.__tick_time is not None:
+                tick_count = (
+                    (tick[0] - self.__tick[0]) * case.ticks_per_period
+                    + tick[1]
+                    - self.__tick[1]
+                )
+
+                if tick_count > 0:
+                    self.__learn((now - self.__tick_time) / tick_count)
+
+            self.__tick = tick
+            self.__tick_time = now
+
+            for handler in self.__handlers:
+                handler(case)
+
+            now = monotonic()
+
+        if self.tick_duration is None or self.__tick_time is None:
+            return self.poll_interval
+
+        return max(
+            self.__tick_time + self.tick_duration - self.lead_time - now,
+            self.poll_interval,
+        )
+
+    def stop(self) -> None:
+        """Make :meth:`TickScheduler.run` return.
+
+        :return: ``None``.
+        """
+        self.__stop.set()
+
+    def __learn(self, tick_duration: float) -> None:
+        if self.tick_duration is None:
+            self.tick_duration = tick_duration
+        else:
+            self.tick_duration += self.smoothing * (
+                tick_duration - self.tick_duration
+            )
+
+
+@dataclass
+class PortfolioTracker:
+    """This class is for tracking positions and profits and losses
+    locally.
+
+    The tracker is seeded from :meth:`RIT.get_securities` and
+    :meth:`RIT.get_limits`, and is then updated incrementally from the
+    fills of the orders, either applied as returned by
+    :meth:`RIT.post_orders` or fetched through
+    :meth:`RIT.get_orders`. The orders already reflected in the seeded
+    positions are not applied again. Only the open orders, and those
+    which were open and have since been closed, are fetched for the
+    updates, so that the orders which were filled at once are picked up
+    only if applied or once reconciled. Every so often, the tracker is
+    reconciled with the RIT Client application by seeding it again.
+
+    The profits and losses are computed against the average costs, and
+    the limit usages by weighing the absolute and signed positions with
+    the :attr:`Security.Limit.units` of the securities.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> tracker = PortfolioTracker(rit)
+    >>> order = rit.post_orders(
+    ...     ticker='CRZY',
+    ...     type='MARKET',
+    ...     quantity=100,
+    ...     action='BUY',
+    ... )
+    >>> tracker.apply(order)
+    100.0
+    >>> tracker.positions['CRZY'].position
+    100.0
+    >>> tracker.gross('LIMIT-STOCK'), tracker.net('LIMIT-STOCK')
+    (100.0, 100.0)
+    """
+
+    @dataclass
+    class Position:
+        """This class is for the positions of securities."""
+
+        position: float = 0.0
+        """The position."""
+        vwap: float = 0.0
+        """The average cost of the position."""
+        realized: float = 0.0
+        """The realized profit and loss."""
+        price: float = 0.0
+        """The price at which the position is marked."""
+        units: dict[str, float] = field(default_factory=dict)
+        """The :attr:`Security.Limit.units`, keyed by
+        :attr:`Security.Limit.name`.
+        """
+
+        @property
+        def unrealized(self) -> float:
+            """Return the unrealized profit and loss.
+
+            :return: The unrealized profit and loss.
+            """
+            return (self.price - self.vwap) * self.position
+
+        def fill(self, quantity: float, price: float) -> None:
+            """Apply a fill.
+
+            :param quantity: The signed filled quantity, positive if
+                             bought and negative if sold.
+            :param price: The fill price.
+            :return: ``None``.
+            """
+            if self.position * quantity >= 0:
+                self.vwap = (
+                    (self.vwap * self.position + price * quantity)
+                    / (self.position + quantity)
+                )
+            else:
+                closed_quantity = min(abs(quantity), abs(self.position))
+                closed_quantity *= 1 if self.position > 0 else -1
+                self.realized += (price - self.vwap) * closed_quantity
+
+                if abs(quantity) > abs(self.position):
+                    self.vwap = price
+
+            self.position += quantity
+
+            if not self.position:
+                self.vwap = 0.0
+
+    rit: RIT
+    """The RIT client."""
+    reconciliation_interval: float = 5.0
+    """The number of seconds between reconciliations in
+    :meth:`PortfolioTracker.update`. Defaults to ``5.0``.
+    """
+    positions: dict[str, PortfolioTracker.Position] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The positions, keyed by :attr:`Security.ticker`."""
+    limits: dict[str, Limit] = field(default_factory=dict, init=False)
+    """The limits, keyed by :attr:`Limit.name`."""
+    reconciliation_retries: int = 2
+    """The maximum number of times to fetch the securities and the
+    orders again in :meth:`PortfolioTracker.reconcile` if the orders
+    were filled in the meantime. Defaults to ``2``.
+    """
+    __fills: dict[int, tuple[float, float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __open_order_ids: set[int] = field(default_factory=set, init=False)
+    __lock: Lock = field(default_factory=Lock, init=False)
+    __reconciliation_time: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        self.reconcile()
+
+    def reconcile(self) -> None:
+        """Seed the positions and limits from the RIT Client
+        application.
+
+        The orders are fetched before and after the securities, and the
+        securities are fetched again if any order was filled in the
+        meantime, up to the number of retries, so that the positions
+        agree with the fills of the orders.
+
+        :return: ``None``.
+        """
+        limits, transacted_orders, open_orders = self.rit.gather(
+            self.rit.submit('get_limits'),
+            self.rit.submit('get_orders', status=Order.Status.TRANSACTED),
+            self.rit.submit('get_orders', status=Order.Status.OPEN),
+        )
+        orders = [*transacted_orders, *open_orders]
+
+        for _ in range(self.reconciliation_retries + 1):
+            securities = self.rit.get_securities()
+            last_orders = orders
+            orders = self.__fetch_orders()
+
+            if self.__fills_of(last_orders) == self.__fills_of(orders):
+                break
+
+        with self.__lock:
+            for security in securities:
+                self.positions[security.ticker] = PortfolioTracker.Position(
+                    security.position,
+                    security.vwap or 0.0,
+                    security.realized,
+                    security.last,
+                    {limit.name: limit.units for limit in security.limits},
+                )
+
+            for limit in limits:
+                self.limits[limit.name] = limit
+
+            self.__open_order_ids.clear()
+
+            for order in orders:
+                self.__fills[order.order_id] = self.__fill_of(order)
+
+                if order.status == Order.Status.OPEN:
+                    self.__open_order_ids.add(order.order_id)
+
+            self.__reconciliation_time = monotonic()
+
+    def update(self) -> None:
+        """Apply the fills of the open orders, and of the orders closed
+        since the last update, fetched from the RIT Client application,
+        or reconcile if due.
+
+        :return: ``None``.
+        """
+        if (
+                monotonic() - self.__reconciliation_time
+                >= self.reconciliation_interval
+        ):
+            self.reconcile()
+
+            return
+
+        with self.__lock:
+            open_order_ids = set(self.__open_order_ids)
+
+        orders = self.rit.get_orders(status=Order.Status.OPEN)
+        closed_orders = self.rit.gather(
+            *(
+                self.rit.submit('get_orders', order_id)
+                for order_id in open_order_ids.difference(
+                    order.order_id for order in orders
+                )
+            ),
+            return_exceptions=True,
+        )
+
+        for order in (*orders, *closed_orders):
+            if not isinstance(order, Exception):
+                self.apply(order)
+
+    def apply(self, order: Order) -> float:
+        """Apply the unseen fills of the order.
+
+        :param order: The order, as returned by
+                      :meth:`RIT.post_orders` or
+                      :meth:`RIT.get_orders`.
+        :return: The newly filled quantity.
+        """
+        quantity, value = self.__fill_of(order)
+
+        with self.__lock:
+            if order.status == Order.Status.OPEN:
+                self.__open_order_ids.add(order.order_id)
+            else:
+                self.__open_order_ids.discard(order.order_id)
+
+            old_quantity, old_value = self.__fills.get(
+                order.order_id,
+                (0.0, 0.0),
+            )
+            quantity_delta = quantity - old_quantity
+
+            if quantity_delta <= 0:
+                return 0.0
+
+            self.__fills[order.order_id] = quantity, value
+            price = (value - old_value) / quantity_delta
+
+            if order.action == Order.Action.SELL:
+                quantity_delta = -quantity_delta
+
+            if order.ticker not in self.positions:
+                self.positions[order.ticker] = PortfolioTracker.Position()
+
+            self.positions[order.ticker].fill(quantity_delta, price)
+
+        return abs(quantity_delta)
+
+    def mark(self, ticker: str, price: float) -> None:
+        """Set the price at which the position is marked.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param price: The price.
+        :return: ``None``.
+        """
+        with self.__lock:
+            if ticker not in self.positions:
+                self.positions[ticker] = PortfolioTracker.Position()
+
+            self.positions[ticker].price = price
+
+    def gross(self, name: str) -> float:
+        """Return the gross usage of the limit.
+
+        :param name: The :attr:`Limit.name`.
+        :return: The gross usage.
+        """
+        with self.__lock:
+            return sum(
+                abs(position.position) * position.units.get(name, 0.0)
+                for position in self.positions.values()
+            )
+
+    def net(self, name: str) -> float:
+        """Return the net usage of the limit.
+
+        :param name: The :attr:`Limit.name`.
+        :return: The net usage.
+        """
+        with self.__lock:
+            return sum(
+                position.position * position.units.get(name, 0.0)
+                for position in self.positions.values()
+            )
+
+    def utilization(self, name: str) -> tuple[float, float]:
+        """Return the gross and net usages of the limit as fractions of
+        the :attr:`Limit.gross_limit` and :attr:`Limit.net_limit`.
+
+        :param name: The :attr:`Limit.name`.
+        :return: The gross and the absolute net utilizations.
+        """
+        limit = self.limits[name]
+
+        return (
+            self.gross(name) / limit.gross_limit,
+            abs(self.net(name)) / limit.net_limit,
+        )
+
+    def __fetch_orders(self) -> list[Order]:
+        transacted_orders, open_orders = self.rit.gather(
+            self.rit.submit('get_orders', status=Order.Status.TRANSACTED),
+            self.rit.submit('get_orders', status=Order.Status.OPEN),
+        )
+
+        return [*transacted_orders, *open_orders]
+
+    @staticmethod
+    def __fills_of(
+            orders: Iterable[Order],
+    ) -> dict[int, tuple[float, float]]:
+        return {
+            order.order_id: PortfolioTracker.__fill_of(order)
+            for order in orders
+        }
+
+    @staticmethod
+    def __fill_of(order: Order) -> tuple[float, float]:
+        quantity = order.quantity_filled or 0.0
+
+        return quantity, quantity * (order.vwap or 0.0)
+
+
+class RiskError(Exception):
+    """This class is for orders rejected by pre-trade risk checks."""
+
+
+@dataclass
+class RiskGate:
+    """This class is for checking orders against trading limits before
+    they are posted.
+
+    The gate rejects orders whose quantities are outside the
+    :attr:`Security.min_trade_size` and :attr:`Security.max_trade_size`
+    of their securities, and, if :attr:`Case.is_enforce_trading_limits`,
+    orders that would push the gross or net usage of any limit beyond
+    its :attr:`Limit.gross_limit` or :attr:`Limit.net_limit`. The
+    usages are computed from the positions of the
+    :class:`PortfolioTracker`, to which the posted orders are applied,
+    as if the open orders were all filled. The open orders are those
+    posted through the gate and those fetched by
+    :meth:`RiskGate.refresh`. Rejected orders never reach the RIT Client
+    application.
+
+    Each order is checked and its quantity reserved under a lock, so
+    that concurrent orders are checked against each other, but posted
+    outside of it. The reservation is released once the order is
+    posted, or if posting it fails.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> gate = RiskGate(PortfolioTracker(rit))
+    >>> gate.post_orders(
+    ...     ticker='CRZY',
+    ...     type='MARKET',
+    ...     quantity=300000,
+    ...     action='BUY',
+    ... )
+    Traceback (most recent call last):
+        ...
+    ritc.RiskError: quantity 300000 above maximum trade size 10000.0
+    >>> report = gate.post_orders_sliced('CRZY', 30000, 'BUY')
+    >>> [order.quantity for order in report.orders]
+    [10000.0, 10000.0, 10000.0]
+    """
+
+    tracker: PortfolioTracker
+    """The portfolio tracker."""
+    __trade_sizes: dict[str, tuple[float, float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __is_enforce_trading_limits: bool = field(default=True, init=False)
+    __open_orders: dict[int, tuple[str, float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __reservations: dict[int, tuple[str, float]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __reservation_ids: Iterator[int] = field(
+        default_factory=count,
+        init=False,
+    )
+    __lock: RLock = field(default_factory=RLock, init=False)
+
+    def __post_init__(self) -> None:
+        case, securities = self.tracker.rit.gather(
+            self.tracker.rit.submit('get_case'),
+            self.tracker.rit.submit('get_securities'),
+        )
+        self.__is_enforce_trading_limits = case.is_enforce_trading_limits
+
+        for security in securities:
+            self.__trade_sizes[security.ticker] = (
+                security.min_trade_size,
+                security.max_trade_size,
+            )
+
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Fetch the open orders, replacing those known to the gate.
+
+        :return: ``None``.
+        """
+        orders = self.tracker.rit.get_orders(status=Order.Status.OPEN)
+
+        with self.__lock:
+            self.__open_orders.clear()
+
+            for order in orders:
+                self.__track(order)
+
+    def check(
+            self,
+            ticker: str,
+            action: Order.Action,
+            quantity: float,
+            split: bool = False,
+    ) -> None:
+        """Check the order.
+
+        :param ticker: The ticker.
+        :param action: The order action.
+        :param quantity: The order quantity.
+        :param split: Whether the order is to be split into orders of at
+                      most :attr:`Security.max_trade_size`, defaults to
+                      ``False``.
+        :return: ``None``.
+        :raises RiskError: If the order is rejected.
+        """
+        min_trade_size, max_trade_size = self.__trade_sizes.get(
+            ticker,
+            (0.0, float('inf')),
+        )
+
+        if quantity < min_trade_size:
+            raise RiskError(
+                f'quantity {quantity} below minimum trade size'
+                f' {min_trade_size}',
+            )
+        elif not split and quantity > max_trade_size:
+            raise RiskError(
+                f'quantity {quantity} above maximum trade size'
+                f' {max_trade_size}',
+            )
+
+        if not self.__is_enforce_trading_limits:
+            return
+
+        position = self.tracker.positions.get(ticker)
+
+        if position is None:
+            return
+
+        if action == Order.Action.SELL:
+            quantity = -quantity
+
+        with self.__lock:
+            for name in position.units:
+                limit = self.tracker.limits.get(name)
+
+                if limit is None:
+                    continue
+
+                gross, long, short = self.__usages(name)
+                new_gross, new_long, new_short = self.__usages(
+                    name,
+                    ticker,
+                    quantity,
+                )
+
+                if quantity > 0:
+                    net, new_net = long, new_long
+                else:
+                    net, new_net = short, new_short
+
+                if new_gross > gross and new_gross > limit.gross_limit:
+                    raise RiskError(
+                        f'gross usage {new_gross} of {name} above gross'
+                        f' limit {limit.gross_limit}',
+                    )
+                elif (
+                        abs(new_net) > abs(net)
+                        and abs(new_net) > limit.net_limit
+                ):
+                    raise RiskError(
+                        f'net usage {new_net} of {name} beyond net limit'
+                        f' {limit.net_limit}',
+                    )
+
+    def post_orders(self, wait: bool = False, **kwargs: Any) -> Order:
+        """Check and insert a new order.
+
+        The arguments are the same as those of :meth:`RIT.post_orders`.
+
+        :return: The newly posted order.
+        :raises RiskError: If the order is rejected.
+        """
+        reservation_id = self.__reserve(
+            kwargs['ticker'],
+            kwargs['action'],
+            kwargs['quantity'],
+        )
+
+        try:
+            order: Order = self.tracker.rit.post_orders(wait, **kwargs)
+        except BaseException:
+            self.__release(reservation_id)
+
+            raise
+
+        self.__release(reservation_id, [order])
+
+        return order
+
+    def post_orders_sliced(
+            self,
+            ticker: str,
+            quantity: float,
+            action: Order.Action,
+            type: Order.Type = Order.Type.MARKET,
+            price: Optional[float] = None,
+    ) -> FillReport:
+        """Check an order as a whole, and insert it through
+        :meth:`RIT.post_orders_sliced`.
+
+        The arguments are the same as those of
+        :meth:`RIT.post_orders_sliced`.
+
+        :return: The fill report.
+        :raises RiskError: If the order is rejected.
+        """
+        reservation_id = self.__reserve(ticker, action, quantity, True)
+
+        try:
+            report = self.tracker.rit.post_orders_sliced(
+                ticker,
+                quantity,
+                action,
+                type,
+                price,
+            )
+        except BulkOrderError as error:
+            self.__release(
+                reservation_id,
+                [order for order in error.orders if order is not None],
+            )
+
+            raise
+        except BaseException:
+            self.__release(reservation_id)
+
+            raise
+
+        self.__release(reservation_id, report.orders)
+
+        return report
+
+    def __reserve(
+            self,
+            ticker: str,
+            action: Order.Action,
+            quantity: float,
+            split: bool = False,
+    ) -> int:
+        with self.__lock:
+            self.check(ticker, action, quantity, split)
+
+            reservation_id = next(self.__reservation_ids)
+
+            if action == Order.Action.SELL:
+                quantity = -quantity
+
+            self.__reservations[reservation_id] = ticker, quantity
+
+        return reservation_id
+
+    def __release(
+            self,
+            reservation_id: int,
+            orders: Iterable[Order] = (),
+    ) -> None:
+        with self.__lock:
+            del self.__reservations[reservation_id]
+
+            for order in orders:
+                self.tracker.apply(order)
+                self.__track(order)
+
+    def __track(self, order: Order) -> None:
+        quantity = order.quantity - (order.quantity_filled or 0.0)
+
+        if order.status != Order.Status.OPEN or quantity <= 0:
+            self.__open_orders.pop(order.order_id, None)
+
+            return
+
+        if order.action == Order.Action.SELL:
+            quantity = -quantity
+
+        self.__open_orders[order.order_id] = order.ticker, quantity
+
+    def __usages(
+            self,
+            name: str,
+            ticker: Optional[str] = None,
+            quantity: float = 0.0,
+    ) -> tuple[float, float, float]:
+        buys: dict[str, float] = {}
+        sells: dict[str, float] = {}
+
+        for open_ticker, open_quantity in chain(
+                self.__open_orders.values(),
+                self.__reservations.values(),
+        ):
+            orders = buys if open_quantity > 0 else sells
+            orders[open_ticker] = orders.get(open_ticker, 0.0) + open_quantity
+
+        gross = long = short = 0.0
+
+        for position_ticker, position in self.tracker.positions.items():
+            units = position.units.get(name, 0.0)
+            buy = buys.get(position_ticker, 0.0)
+            sell = sells.get(position_ticker, 0.0)
+
+            if position_ticker == ticker:
+                if quantity > 0:
+                    buy += quantity
+                else:
+                    sell += quantity
+
+            long_position = position.position + buy
+            short_position = position.position + sell
+            gross += units * max(abs(long_position), abs(short_position))
+            long += units * long_position
+            short += units * short_position
+
+        return gross, long, short
+
+
+@dataclass
+class TenderEvaluator:
+    """This class is for evaluating tenders as soon as they appear.
+
+    The evaluator keeps the order books of the tender-eligible tickers
+    in a :class:`BookMirror`, refreshed by
+    :meth:`TenderEvaluator.refresh`, and again by
+    :meth:`TenderEvaluator.poll` whenever they are older than the
+    latency budget. When :meth:`TenderEvaluator.poll` finds a new
+    tender, its unwind price is computed from the mirrored order book:
+    a tender to buy is unwound by selling into the bids, and a tender to
+    sell by buying from the asks. The tender is worth accepting if the
+    profit per unit of unwinding it is at least the minimum profit.
+
+    If automated, the worthwhile tenders are accepted and the rest are
+    declined, as long as the decisions are made within the latency
+    budget. Otherwise, the tenders are left untouched, and evaluated
+    again on the next poll. The bid prices of the tenders which are not
+    fixed-bid are set to earn exactly the minimum profit.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> evaluator = TenderEvaluator(rit, ['RITC'], min_profit=0.02)
+    >>> evaluator.refresh()
+    >>> decisions = evaluator.poll()
+    >>> decisions[0].tender.tender_id, decisions[0].is_worthwhile
+    (1507, True)
+    >>> decisions[0].profit
+    0.0573...
+    """
+
+    @dataclass(frozen=True)
+    class Decision:
+        """This class is for evaluations of tenders."""
+
+        tender: Tender
+        """The tender."""
+        unwind_price: Optional[float]
+        """The average price of unwinding the tender, or ``None`` if the
+        order book is not deep enough.
+        """
+        profit: Optional[float]
+        """The profit per unit of accepting the tender at the price, or
+        ``None`` if the order book is not deep enough.
+        """
+        price: Optional[float]
+        """The price at which the tender is to be accepted."""
+        is_worthwhile: bool
+        """Whether the tender is worth accepting."""
+        latency: float
+        """The number of seconds taken to evaluate the tender since it
+        was fetched.
+        """
+        book_age: float
+        """The number of seconds since the order books were mirrored
+        when the tender was evaluated.
+        """
+
+    rit: RIT
+    """The RIT client."""
+    tickers: Sequence[str]
+    """The :attr:`Security.ticker` of the tender-eligible securities."""
+    min_profit: float = 0.0
+    """The minimum profit per unit of a worthwhile tender. Defaults to
+    ``0.0``.
+    """
+    is_automated: bool = False
+    """Whether to accept or decline the tenders automatically. Defaults
+    to ``False``.
+    """
+    latency_budget: float = 0.25
+    """The maximum number of seconds between fetching a tender and
+    deciding on it for the decision to be acted upon, and the maximum
+    age of the mirrored order books. Defaults to ``0.25``.
+    """
+    book_limit: Optional[int] = None
+    """Maximum number of orders to mirror for each side of the order
+    books. Defaults to ``20``.
+    """
+    mirror: BookMirror = field(init=False)
+    """The mirror of the order books."""
+    decisions: dict[int, TenderEvaluator.Decision] = field(
+        default_factory=dict,
+        init=False,
+    )
+    """The final decisions, keyed by :attr:`Tender.tender_id`."""
+    __refresh_time: Optional[float] = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.mirror = BookMirror(self.rit, self.book_limit)
+
+    @property
+    def book_age(self) -> float:
+        """Return the number of seconds since the order books were
+        mirrored.
+
+        :return: The age of the mirrored order books, or ``inf`` if they
+                 were never mirrored.
+        """
+        if self.__refresh_time is None:
+            return inf
+
+        return monotonic() - self.__refresh_time
+
+    def refresh(self) -> None:
+        """Fetch the order books of the tender-eligible securities
+        concurrently.
+
+        :return: ``None``.
+        """
+        books = self.rit.gather(
+            *(
+                self.rit.submit(
+                    'get_securities_book',
+                    ticker=ticker,
+                    limit=self.book_limit,
+                )
+                for ticker in self.tickers
+            ),
+        )
+        self.__refresh_time = monotonic()
+
+        for ticker, book in zip(self.tickers, books):
+            self.mirror.apply(ticker, book)
+
+    def evaluate(
+            self,
+            tender: Tender,
+            start_time: Optional[float] = None,
+    ) -> TenderEvaluator.Decision:
+        """Evaluate the tender against the mirrored order book.
+
+        :param tender: The tender.
+        :param start_time: The :func:`time.monotonic` time at which the
+                           tender was fetched. Defaults to now.
+        :return: The decision.
+        """
+        if start_time is None:
+            start_time = monotonic()
+
+        unwind_price = self.mirror.vwap(
+            tender.ticker,
+            tender.action,
+            tender.quantity,
+        )
+        profit = price = None
+        is_worthwhile = False
+
+        if unwind_price is not None:
+            if tender.action == Order.Action.BUY:
+                sign = 1
+            else:
+                sign = -1
+
+            if tender.is_fixed_bid:
+                price = tender.price
+                profit = sign * (unwind_price - price)
+                is_worthwhile = profit >= self.min_profit
+            else:
+                price = unwind_price - sign * self.min_profit
+                profit = self.min_profit
+                is_worthwhile = True
+
+        return TenderEvaluator.Decision(
+            tender,
+            unwind_price,
+            profit,
+            price,
+            is_worthwhile,
+            monotonic() - start_time,
+            self.book_age,
+        )
+
+    def poll(self) -> list[TenderEvaluator.Decision]:
+        """Fetch the active tenders and evaluate the new ones.
+
+        The order books are refreshed first if they are older than the
+        latency budget. The tenders which have expired are ignored. If
+        automated, the decisions made within the latency budget are
+        acted upon, while the tenders decided on too late are evaluated
+        again on the next poll. The tenders whose unwind prices are
+        unknown, because their order books are not mirrored or not deep
+        enough, are neither accepted nor declined, and are also
+        evaluated again on the next poll.
+
+        :return: The decisions on the new tenders.
+        """
+        start_time = monotonic()
+        case = self.rit.submit('get_case')
+        tenders = self.rit.get_tenders()
+        tick = case.result().tick
+        tenders = [
+            tender
+            for tender in tenders
+            if (
+                tender.tender_id not in self.decisions
+                and tender.expires >= tick
+            )
+        ]
+
+        if tenders and self.book_age > self.latency_budget:
+            self.refresh()
+
+        decisions = [self.evaluate(tender, start_time) for tender in tenders]
+
+        final_decisions = [
+            decision
+            for decision in decisions
+            if decision.unwind_price is not None
+        ]
+
+        for decision in final_decisions:
+            if (
+                    not self.is_automated
+                    or decision.latency <= self.latency_budget
+            ):
+                self.decisions[decision.tender.tender_id] = decision
+
+        if self.is_automated:
+            futures = []
+
+            for decision in final_decisions:
+                if decision.latency > self.latency_budget:
+                    continue
+                elif decision.is_worthwhile:
+                    futures.append(
+                        self.rit.submit(
+                            'post_tenders',
+                            decision.tender.tender_id,
+                            price=decision.price,
+                        ),
+                    )
+                else:
+                    futures.append(
+                        self.rit.submit(
+                            'delete_tenders',
+                            decision.tender.tender_id,
+                        ),
+                    )
+
+            self.rit.gather(*futures)
+
+        return decisions
+
+
+_RECORDER_LENGTHS = Struct('<II')
+
+
+def _read_exactly(file: BufferedIOBase, size: int) -> Optional[bytes]:
+    try:
+        data = file.read(size)
+    except EOFError:
+        return None
+
+    return data if len(data) == size else None
+
+
+@dataclass
+class Recorder:
+    """This class is for recording the responses of the RIT Client
+    application to a file.
+
+    An instance is meant to be used as one of :attr:`RIT.hooks`. The
+    requests are only put into a queue on the calling thread, while a
+    background thread appends them to the file. Each request is stored
+    as a pair of lengths followed by a compact JSON header with the
+    timestamp, the method, the path, the parameters, and the status
+    code, and the raw body of the response. The file is optionally
+    compressed with gzip.
+
+    >>> with Recorder('session.rit.gz', compress=True) as recorder:
+    ...     rit = RIT('G4DNIZ5D', hooks=[recorder])
+    ...     case = rit.get_case()
+    >>> entries = list(Recorder.read('session.rit.gz'))
+    >>> entries[0].path
+    '/v1/case'
+    """
+
+    @dataclass(frozen=True)
+    class Entry:
+        """This class is for recorded requests."""
+
+        timestamp: float
+        """The time at which the request was started, in seconds since
+        the epoch.
+        """
+        method: str
+        """The request method."""
+        path: str
+        """The request path."""
+        parameters: dict[str, Any]
+        """The request parameters, without the unset ones."""
+        status_code: int
+        """The status code of the response."""
+        content: bytes
+        """The raw body of the response."""
+
+    path: str
+    """The path of the file, to which the requests are appended."""
+    compress: bool = False
+    """Whether to compress the file with gzip. Defaults to ``False``."""
+    __queue: Queue[Optional[RequestEvent]] = field(
+        default_factory=Queue,
+        init=False,
+    )
+    __thread: Thread = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.__thread = Thread(target=self.__run, daemon=True)
+
+        self.__thread.start()
+
+    def __enter__(self) -> Recorder:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __call__(self, event: RequestEvent) -> None:
+        self.__queue.put_nowait(event)
+
+    def close(self) -> None:
+        """Write the pending requests and close the file.
+
+        :return: ``None``.
+        """
+        self.__queue.put(None)
+        self.__thread.join()
+
+    @staticmethod
+    def read(path: str) -> Iterator[Recorder.Entry]:
+        """Read the recorded requests.
+
+        The reading stops at the last complete request, so that the
+        files which were not closed, such as after a crash, can be read
+        up to where they were written.
+
+        :param path: The path of the file.
+        :return: The recorded requests, in the order they were
+                 completed.
+        """
+        with open(path, 'rb') as raw_file:
+            file: BufferedIOBase = raw_file
+            is_compressed = raw_file.read(2) == b'\x1f\x8b'
+
+            raw_file.seek(0)
+
+            if is_compressed:
+                file = GzipFile(fileobj=raw_file)
+
+            while lengths := _read_exactly(file, _RECORDER_LENGTHS.size):
+                header_length, content_length = _RECORDER_LENGTHS.unpack(
+                    lengths,
+                )
+                header = _read_exactly(file, header_length)
+                content = _read_exactly(file, content_length)
+
+                if header is None or content is None:
+                    break
+
+                (
+                    timestamp,
+                    method,
+                    request_path,
+                    parameters,
+                    status_code,
+                ) = loads(header)
+
+                yield Recorder.Entry(
+                    timestamp,
+                    method,
+                    request_path,
+                    parameters,
+                    status_code,
+                    content,
+                )
+
+    def __run(self) -> None:
+        file: BufferedIOBase
+
+        if self.compress:
+            file = GzipFile(self.path, 'ab')
+        else:
+            file = open(self.path, 'ab')
+
+        with file:
+            while True:
+                event = self.__queue.get()
+
+                if event is None:
+                    break
+
+                header = dumps(
+                    (
+                        event.timestamp,
+                        event.method,
+                        event.path,
+                        {
+                            key: value
+                            for key, value in event.parameters.items()
+                            if value is not None
+                        },
+                        event.status_code,
+                    ),
+                    separators=(',', ':'),
+                ).encode()
+
+                file.write(
+                    _RECORDER_LENGTHS.pack(len(header), len(event.content)),
+                )
+                file.write(header)
+                file.write(event.content)
+
+                if self.__queue.empty():
+                    file.flush()
+
+
+class ReplayAdapter(BaseAdapter):
+    """This class is for replaying recorded sessions through a
+    :class:`RIT`.
+
+    The adapter answers the requests of a client with the responses
+    recorded by a :class:`Recorder`, without any RIT Client application.
+    A ``GET`` request is answered with the most recent response recorded
+    as of the replay clock to the same path, ticker, and period. The
+    other parameters, such as ``limit``, are ignored. If only the
+    responses for all tickers are recorded, their items of the ticker
+    are returned. The requests without such responses are answered with
+    ``404 Not Found``.
+
+    If the speed is ``None``, which is the default, the replay clock is
+    unbounded and advances to the next recorded case every time the case
+    is requested, exposing the responses recorded until the case after
+    it, and a stopped case is returned once the recorded cases run out.
+    Otherwise, the replay clock advances with the wall clock, multiplied
+    by the speed, and a stopped case is returned once it passes the last
+    recorded response.
+
+    The orders are simulated. Market orders and marketable limit orders
+    are filled against the most recent recorded order book of the
+    security, while the rest of the limit orders stay open until
+    cancelled. The positions are not simulated. Other ``POST`` and
+    ``DELETE`` requests are answered with success.
+
+    As the adapter only needs the path of the recording, the replays
+    can be run in parallel by a process pool.
+
+    >>> def backtest(path):
+    ...     rit = RIT('REPLAY', adapter=ReplayAdapter(path))
+    ...     scheduler = TickScheduler(rit, poll_interval=0)
+    ...     scheduler.register(partial(strategy, rit))
+    ...     scheduler.run()
+    ...     return rit.get_orders(status=Order.Status.TRANSACTED)
+    >>> with ProcessPoolExecutor() as executor:
+    ...     results = list(executor.map(backtest, paths))
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = None) -> None:
+        """Load the recorded session.
+
+        :param path: The path of the recording.
+        :param speed: The speed of the replay clock relative to the wall
+                      clock, or ``None`` to replay as fast as possible.
+        """
+        super().__init__()
+
+        self.speed = speed
+        self.__lock = Lock()
+        self.__timestamps: dict[Any, list[float]] = {}
+        self.__entries: dict[Any, list[Recorder.Entry]] = {}
+        self.__cases: list[Recorder.Entry] = []
+        self.__case_index = 0
+        self.__end_timestamp = -inf
+        self.__orders: dict[int, dict[str, Any]] = {}
+        self.__order_id = 0
+
+        for entry in Recorder.read(path):
+            if entry.method != 'GET' or entry.status_code >= 400:
+                continue
+
+            if entry.path == '/v1/case':
+                self.__cases.append(entry)
+
+            key = self.__key(entry.path, entry.parameters)
+
+            self.__timestamps.setdefault(key, []).append(entry.timestamp)
+            self.__entries.setdefault(key, []).append(entry)
+
+            self.__end_timestamp = max(self.__end_timestamp, entry.timestamp)
+
+        self.__timestamp = inf
+
+        if self.__cases:
+            self.__start_timestamp = self.__cases[0].timestamp
+        else:
+            self.__start_timestamp = self.__timestamp
+
+        self.__start_time = monotonic()
+
+        if self.speed is None:
+            self.__seek(0)
+
+    def send(
+            self,
+            request: PreparedRequest,
+            stream: bool = False,
+            timeout: Union[
+                None,
+                float,
+                tuple[float, float],
+                tuple[float, None],
+            ] = None,
+            verify: Union[bool, str] = True,
+            cert: Any = None,
+            proxies: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        url = urlsplit(request.url or '')
+        parameters = dict(parse_qsl(url.query))
+
+        with self.__lock:
+            status_code, data = self.__respond(
+                request.method or 'GET',
+                url.path,
+                parameters,
+            )
+
+        response = Response()
+        response.status_code = status_code
+        response._content = (
+            data if isinstance(data, bytes) else dumps(data).encode()
+        )
+        response.url = request.url or ''
+        response.request = request
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json'
+
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def __respond(
+            self,
+            method: str,
+            path: str,
+            parameters: dict[str, str],
+    ) -> tuple[int, Any]:
+        if self.speed is not None:
+            self.__timestamp = self.__start_timestamp + self.speed * (
+                monotonic() - self.__start_time
+            )
+
+        if (
+                method == 'GET'
+                and path == '/v1/case'
+                and self.__cases
+                and (
+                    self.__timestamp > self.__end_timestamp
+                    if self.speed is not None
+                    else self.__case_index >= len(self.__cases)
+                )
+        ):
+            case = loads(self.__cases[-1].content)
+            case['status'] = Case.Status.STOPPED.value
+
+            return 200, case
+        elif method == 'GET' and path == '/v1/case' and self.speed is None:
+            if not self.__cases:
+                return 404, {'code': 'NOT_FOUND', 'message': 'No case.'}
+
+            entry = self.__cases[self.__case_index]
+
+            self.__seek(self.__case_index)
+
+            self.__case_index += 1
+
+            return entry.status_code, entry.content
+        elif method == 'GET' and path == '/v1/orders':
+            status = parameters.get('status', Order.Status.OPEN.value)
+
+            return 200, [
+                order
+                for order in self.__orders.values()
+                if order['status'] == status
+            ]
+        elif method == 'GET' and path.startswith('/v1/orders/'):
+            order = self.__orders.get(int(path.rsplit('/', 1)[1]))
+
+            if order is None:
+                return 404, {'code': 'NOT_FOUND', 'message': 'No order.'}
+
+            return 200, order
+        elif method == 'GET':
+            data = self.__find(path, parameters)
+
+            if data is None:
+                return 404, {'code': 'NOT_FOUND', 'message': 'Not recorded.'}
+
+            return 200, data
+        elif method == 'POST' and path == '/v1/orders':
+            return 200, self.__post_order(parameters)
+        elif method == 'DELETE' and path.startswith('/v1/orders/'):
+            order = self.__orders.get(int(path.rsplit('/', 1)[1]))
+
+            if order is None or order['status'] != Order.Status.OPEN:
+                return 200, {'success': False}
+
+            order['status'] = Order.Status.CANCELLED.value
+
+            return 200, {'success': True}
+        elif method == 'POST' and path == '/v1/commands/cancel':
+            ids = parameters.get('ids', '').split(',')
+            cancelled_order_ids = []
+
+            for order in self.__orders.values():
+                if (
+                        order['status'] == Order.Status.OPEN
+                        and (
+                            'all' in parameters
+                            or order['ticker'] == parameters.get('ticker')
+                            or str(order['order_id']) in ids
+                        )
+                ):
+                    order['status'] = Order.Status.CANCELLED.value
+
+                    cancelled_order_ids.append(order['order_id'])
+
+            return 200, {'cancelled_order_ids': cancelled_order_ids}
+
+        return 200, {'success': True}
+
+    def __seek(self, case_index: int) -> None:
+        if case_index + 1 < len(self.__cases):
+            self.__timestamp = nextafter(
+                self.__cases[case_index + 1].timestamp,
+                -inf,
+            )
+        else:
+            self.__timestamp = inf
+
+    def __find(self, path: str, parameters: Mapping[str, Any]) -> Any:
+        entry = self.__find_entry(self.__key(path, parameters))
+
+        if entry is not None:
+            return entry.content
+
+        ticker = parameters.get('ticker')
+
+        if ticker is None:
+            return None
+
+        entry = self.__find_entry(
+            self.__key(
+                path,
+                {
+                    key: value
+                    for key, value in parameters.items()
+                    if key != 'ticker'
+                },
+            ),
+        )
+
+        if entry is None:
+            return None
+
+        data = loads(entry.content)
+
+        if not isinstance(data, list):
+            return None
+
+        return [item for item in data if item.get('ticker') == ticker]
+
+    def __load(self, path: str, parameters: Mapping[str, Any]) -> Any:
+        data = self.__find(path, parameters)
+
+        if data is None:
+            return {}
+        elif isinstance(data, bytes):
+            return loads(data)
+
+        return data
+
+    def __find_entry(self, key: Any) -> Optional[Recorder.Entry]:
+        timestamps = self.__timestamps.get(key, [])
+        index = bisect_right(timestamps, self.__timestamp)
+
+        if not index:
+            return None
+
+        return self.__entries[key][index - 1]
+
+    def __post_order(self, parameters: dict[str, str]) -> dict[str, Any]:
+        self.__order_id += 1
+        ticker = parameters['ticker']
+        action = parameters['action']
+        quantity = float(parameters['quantity'])
+        price = float(parameters.get('price') or 0)
+        case = self.__load('/v1/case', {})
+        book = self.__load('/v1/securities/book', {'ticker': ticker})
+        is_market = parameters['type'] == Order.Type.MARKET
+        quantity_filled = 0.0
+        value = 0.0
+
+        bids, asks = _get_book_sides(book)
+        orders = asks if action == Order.Action.BUY else bids
+
+        for book_order in orders:
+            if quantity_filled >= quantity:
+                break
+            elif not is_market and (
+                    book_order['price'] > price
+                    if action == Order.Action.BUY
+                    else book_order['price'] < price
+            ):
+                break
+
+            size = min(
+                book_order['quantity'] - book_order['quantity_filled'],
+                quantity - quantity_filled,
+            )
+            quantity_filled += size
+            value += size * book_order['price']
+
+        if is_market or quantity_filled >= quantity:
+            status = Order.Status.TRANSACTED
+        else:
+            status = Order.Status.OPEN
+
+        order: dict[str, Any] = {
+            'order_id': self.__order_id,
+            'period': case.get('period'),
+            'tick': case.get('tick'),
+            'trader_id': 'REPLAY',
+            'ticker': ticker,
+            'type': parameters['type'],
+            'quantity': quantity,
+            'action': action,
+            'price': None if is_market else price,
+            'quantity_filled': quantity_filled,
+            'vwap': value / quantity_filled if quantity_filled else None,
+            'status': status.value,
+        }
+        self.__orders[self.__order_id] = order
+
+        return order
+
+    @staticmethod
+    def __key(
+            path: str,
+            parameters: Mapping[str, Any],
+    ) -> tuple[str, Optional[str], Optional[str]]:
+        ticker = parameters.get('ticker')
+        period = parameters.get('period')
+
+        return (
+            path,
+            None if ticker is None else str(ticker),
+            None if period is None else str(period),
+        )
+
+
+_TICK_FILE_COUNT = Struct('<Q')
+_TICK_STORE_HISTORY_FIELDS = (('period', 'i8'),) + _HISTORY_FIELDS
+
+
+@dataclass
+class _TickFile:
+    path: str
+    fields: tuple[tuple[str, str], ...]
+    capacity: int
+    count: int = field(default=0, init=False)
+    file: BinaryIO = field(init=False)
+    buffer: mmap = field(init=False)
+    record: Struct = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.record = Struct(
+            '<' + ''.join(
+                'q' if kind == 'i8' else 'd' for _, kind in self.fields
+            ),
+        )
+        self.file = open(self.path, 'a+b')
+
+        self.file.seek(0, SEEK_END)
+
+        if self.file.tell() < _TICK_FILE_COUNT.size:
+            self.file.truncate(self.offset(self.capacity))
+        else:
+            self.capacity = (
+                self.file.tell() - _TICK_FILE_COUNT.size
+            ) // self.record.size
+
+        self.buffer = mmap(self.file.fileno(), 0)
+        self.count, = _TICK_FILE_COUNT.unpack_from(self.buffer)
+
+    def offset(self, index: int) -> int:
+        return _TICK_FILE_COUNT.size + index * self.record.size
+
+    def __getitem__(self, index: int) -> tuple[Any, ...]:
+        return self.record.unpack_from(self.buffer, self.offset(index))
+
+    def key(self, index: int) -> tuple[int, int]:
+        values = self[index]
+        names = tuple(name for name, _ in self.fields)
+
+        return values[names.index('period')], values[names.index('tick')]
+
+    def bisect(self, key: tuple[int, int]) -> int:
+        low = 0
+        high = self.count
+
+        while low < high:
+            middle = (low + high) // 2
+
+            if self.key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return low
+
+    def write(self, index: int, values: Sequence[Any]) -> None:
+        if index >= self.capacity:
+            self.capacity = max(2 * self.capacity, index + 1)
+
+            self.file.truncate(self.offset(self.capacity))
+
+            # The previous map is left to the views still exported from
+            # it instead of being closed.
+            self.buffer = mmap(self.file.fileno(), 0)
+
+        self.record.pack_into(self.buffer, self.offset(index), *values)
+
+        if index >= self.count:
+            self.count = index + 1
+
+            _TICK_FILE_COUNT.pack_into(self.buffer, 0, self.count)
+
+    def close(self) -> None:
+        if not self.buffer.closed:
+            self.buffer.flush()
+            self.buffer.close()
+
+        self.file.close()
+
+
+@dataclass
+class TickStore:
+    """This class is for persisting the times and sales and the
+    histories of securities to memory-mapped files.
+
+    Each ticker has a file of trades and a file of candles in the
+    directory, holding fixed-width little-endian records of 64-bit
+    integers and floats after a record count. The records are kept in
+    chronological order, so that a range of periods and ticks is found
+    by a binary search, and the files are reopened without being read.
+    The candles are stored along with their periods.
+
+    The files are grown geometrically as the records are appended. Only
+    the pages being accessed are held in memory, and the arrays returned
+    are views of the mapped files without copies.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> with TickStore('ticks') as store:
+    ...     store.append_tas('RITC', rit.get_securities_tas(ticker='RITC'))
+    ...     store.append_history(
+    ...         'RITC',
+    ...         1,
+    ...         rit.get_securities_history(ticker='RITC'),
+    ...     )
+    ...     store.get_tas('RITC', (1, 100), (1, 110))[0].price
+    579
+    300
+    26.33
+    >>> with TickStore('ticks') as store:
+    ...     store.get_history_array('RITC')['close'].mean()
+    26.171
+    """
+
+    directory: str
+    """The path of the directory of the files, created if missing."""
+    capacity: int = 4096
+    """The initial number of records allocated per file. Defaults to
+    ``4096``.
+    """
+    __files: dict[tuple[str, str], _TickFile] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __lock: Lock = field(default_factory=Lock, init=False)
+
+    def __post_init__(self) -> None:
+        makedirs(self.directory, exist_ok=True)
+
+    def __enter__(self) -> TickStore:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def tickers(self) -> list[str]:
+        """Return the stored tickers.
+
+        :return: The :attr:`Security.ticker` of the stored securities.
+        """
+        tickers = set()
+
+        for name in listdir(self.directory):
+            ticker, _, extension = name.rpartition('.')
+
+            if extension in ('tas', 'history'):
+                tickers.add(ticker)
+
+        return sorted(tickers)
+
+    def append_tas(self, ticker: str, tas: Iterable[Security.TAS]) -> int:
+        """Append the trades of a security.
+
+        The trades already stored, whose :attr:`Security.TAS.id` are not
+        greater than the last one stored, are skipped.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param tas: The trades, in any order.
+        :return: The number of trades appended.
+        """
+        with self.__lock:
+            file = self.__file(ticker, 'tas')
+            last_id = file[file.count - 1][0] if file.count else -1
+            count = 0
+
+            for item in sorted(tas, key=lambda item: item.id):
+                if item.id > last_id:
+                    file.write(
+                        file.count,
+                        (
+                            item.id,
+                            item.period,
+                            item.tick,
+                            item.price,
+                            item.quantity,
+                        ),
+                    )
+
+                    count += 1
+
+            return count
+
+    def append_history(
+            self,
+            ticker: str,
+            period: int,
+            history: Iterable[Security.History],
+    ) -> int:
+        """Append the candles of a security.
+
+        The candles before the last one stored are skipped, while the
+        last one is overwritten, as it may have been incomplete.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param period: The period of the candles.
+        :param history: The candles, in any order.
+        :return: The number of candles appended or overwritten.
+        """
+        with self.__lock:
+            file = self.__file(ticker, 'history')
+            last_key = file.key(file.count - 1) if file.count else (-1, -1)
+            count = 0
+
+            for item in sorted(history, key=lambda item: item.tick):
+                key = period, item.tick
+
+                if key >= last_key:
+                    file.write(
+                        file.count - (key == last_key),
+                        (
+                            period,
+                            item.tick,
+                            item.open,
+                            item.high,
+                            item.low,
+                            item.close,
+                        ),
+                    )
+
+                    last_key = key
+                    count += 1
+
+            return count
+
+    def get_tas(
+            self,
+            ticker: str,
+            start: Optional[tuple[int, int]] = None,
+            stop: Optional[tuple[int, int]] = None,
+    ) -> list[Security.TAS]:
+        """Return the stored trades of a security within a range.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param start: The inclusive ``(period, tick)`` from which the
+                      trades are returned. Unbounded if ``None``.
+        :param stop: The exclusive ``(period, tick)`` until which the
+                     trades are returned. Unbounded if ``None``.
+        :return: The trades from oldest to newest.
+        """
+        return self.__get(ticker, 'tas', start, stop)
+
+    def get_history(
+            self,
+            ticker: str,
+            start: Optional[tuple[int, int]] = None,
+            stop: Optional[tuple[int, int]] = None,
+    ) -> list[Security.History]:
+        """Return the stored candles of a security within a range.
+
+        The candles also have the ``period`` attribute.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param start: The inclusive ``(period, tick)`` from which the
+                      candles are returned. Unbounded if ``None``.
+        :param stop: The exclusive ``(period, tick)`` until which the
+                     candles are returned. Unbounded if ``None``.
+        :return: The candles from oldest to newest.
+        """
+        return self.__get(ticker, 'history', start, stop)
+
+    def get_tas_array(
+            self,
+            ticker: str,
+            start: Optional[tuple[int, int]] = None,
+            stop: Optional[tuple[int, int]] = None,
+    ) -> Any:
+        """Return the stored trades of a security within a range as a
+        view of the file.
+
+        This method requires ``numpy``. The view must be released before
+        the store is closed.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param start: The inclusive ``(period, tick)`` from which the
+                      trades are returned. Unbounded if ``None``.
+        :param stop: The exclusive ``(period, tick)`` until which the
+                     trades are returned. Unbounded if ``None``.
+        :return: The structured array of the trades from oldest to
+                 newest.
+        """
+        return self.__get_array(ticker, 'tas', start, stop)
+
+    def get_history_array(
+            self,
+            ticker: str,
+            start: Optional[tuple[int, int]] = None,
+            stop: Optional[tuple[int, int]] = None,
+    ) -> Any:
+        """Return the stored candles of a security within a range as a
+        view of the file.
+
+        This method requires ``numpy``. The view must be released before
+        the store is closed.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :param start: The inclusive ``(period, tick)`` from which the
+                      candles are returned. Unbounded if ``None``.
+        :param stop: The exclusive ``(period, tick)`` until which the
+                     candles are returned. Unbounded if ``None``.
+        :return: The structured array of the candles from oldest to
+                 newest.
+        """
+        return self.__get_array(ticker, 'history', start, stop)
+
+    def flush(self) -> None:
+        """Write the changes of the files to the disk.
+
+        :return: ``None``.
+        """
+        with self.__lock:
+            for file in self.__files.values():
+                file.buffer.flush()
+
+    def close(self) -> None:
+        """Write the changes of the files to the disk and close them.
+
+        The files with views still alive are left open, so that the store
+        can be closed again once the views are released. Closing a closed
+        store does nothing.
+
+        :return: ``None``.
+        :raises BufferError: If any file has views still alive.
+        """
+        with self.__lock:
+            for key, file in tuple(self.__files.items()):
+                try:
+                    file.close()
+                except BufferError:
+                    continue
+
+                del self.__files[key]
+
+            if self.__files:
+                raise BufferError(
+                    f'{len(self.__files)} files have views still alive',
+                )
+
+    def __file(self, ticker: str, kind: str) -> _TickFile:
+        key = ticker, kind
+
+        if key not in self.__files:
+            fields: tuple[tuple[str, str], ...]
+
+            if kind == 'tas':
+                fields = _TAS_FIELDS
+            else:
+                fields = _TICK_STORE_HISTORY_FIELDS
+
+            self.__files[key] = _TickFile(
+                join(self.directory, f'{ticker}.{kind}'),
+                fields,
+                self.capacity,
+            )
+
+        return self.__files[key]
+
+    def __range(
+            self,
+            file: _TickFile,
+            start: Optional[tuple[int, int]],
+            stop: Optional[tuple[int, int]],
+    ) -> tuple[int, int]:
+        return (
+            0 if start is None else file.bisect(start),
+            file.count if stop is None else file.bisect(stop),
+        )
+
+    def __get(
+            self,
+            ticker: str,
+            kind: str,
+            start: Optional[tuple[int, int]],
+            stop: Optional[tuple[int, int]],
+    ) -> list[Any]:
+        with self.__lock:
+            file = self.__file(ticker, kind)
+            names = tuple(name for name, _ in file.fields)
+
+            return [
+                _decode_records(dict(zip(names, file[index])))
+                for index in range(*self.__range(file, start, stop))
+            ]
+
+    def __get_array(
+            self,
+            ticker: str,
+            kind: str,
+            start: Optional[tuple[int, int]],
+            stop: Optional[tuple[int, int]],
+    ) -> Any:
+        import numpy
+
+        with self.__lock:
+            file = self.__file(ticker, kind)
+            start_index, stop_index = self.__range(file, start, stop)
+
+            return numpy.frombuffer(
+                file.buffer,
+                [(name, '<' + type_) for name, type_ in file.fields],
+                max(stop_index - start_index, 0),
+                file.offset(start_index),
+            )
+
+
+_PARQUET_COLUMNS = {
+    'tas': (
+        ('id', 'int64'),
+        ('tick', 'int64'),
+        ('price', 'float64'),
+        ('quantity', 'float64'),
+    ),
+    'history': (
+        ('tick', 'int64'),
+        ('open', 'float64'),
+        ('high', 'float64'),
+        ('low', 'float64'),
+        ('close', 'float64'),
+    ),
+    'book': (
+        ('timestamp', 'float64'),
+        ('tick', 'int64'),
+        ('action', 'string'),
+        ('level', 'int64'),
+        ('order_id', 'int64'),
+        ('price', 'float64'),
+        ('quantity', 'float64'),
+        ('quantity_filled', 'float64'),
+    ),
+    'orders': (
+        ('timestamp', 'float64'),
+        ('order_id', 'int64'),
+        ('tick', 'int64'),
+        ('trader_id', 'string'),
+        ('type', 'string'),
+        ('quantity', 'float64'),
+        ('action', 'string'),
+        ('price', 'float64'),
+        ('quantity_filled', 'float64'),
+        ('vwap', 'float64'),
+        ('status', 'string'),
+    ),
+    'news': (
+        ('news_id', 'int64'),
+        ('tick', 'int64'),
+        ('headline', 'string'),
+        ('body', 'string'),
+    ),
+}
+
+
+@dataclass
+class ParquetExporter:
+    """This class is for exporting the responses recorded by a
+    :class:`Recorder` to Parquet files.
+
+    The times and sales, the histories, the order books, the orders, and
+    the news are written to separate tables in the directory, each
+    partitioned by ticker and period in the Hive layout, such as
+    ``tas/ticker=RITC/period=1/part-0.parquet``. The rows are buffered
+    per partition and written as record batches once the chunk size is
+    reached, so that the recordings are never loaded as a whole.
+
+    The trades and the news seen in earlier responses are skipped, and a
+    candle is only written once a later one is seen or the exporter is
+    closed, as it may have been incomplete. The order books and the
+    orders are written as snapshots, along with the timestamps of the
+    responses.
+
+    This class requires ``pyarrow``.
+
+    >>> with ParquetExporter('dataset') as exporter:
+    ...     exporter.export('session.rit.gz')
+    >>> import pandas
+    >>> pandas.read_parquet('dataset/tas').columns.tolist()
+    ['id', 'tick', 'price', 'quantity', 'ticker', 'period']
+    """
+
+    directory: str
+    """The path of the directory of the tables, created if missing."""
+    chunk_size: int = 65536
+    """The number of rows per record batch. Defaults to ``65536``."""
+    decoder: Callable[[bytes], Any] = _default_decoder
+    """The JSON parser of the recorded responses. Defaults to
+    ``orjson.loads`` if installed, and ``json.loads`` otherwise.
+    """
+    __rows: dict[tuple[str, str, int], list[dict[str, Any]]] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __writers: dict[tuple[str, str, int], Any] = field(
+        default_factory=dict,
+        init=False,
+    )
+    __case: Optional[dict[str, Any]] = field(default=None, init=False)
+    __tas_ids: dict[str, int] = field(default_factory=dict, init=False)
+    __news_ids: set[int] = field(default_factory=set, init=False)
+    __candles: dict[tuple[str, int], dict[str, Any]] = field(
+        default_factory=dict,
+        init=False,
+    )
+
+    def __enter__(self) -> ParquetExporter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def export(self, path: str) -> None:
+        """Write the responses of a recording.
+
+        :param path: The path of the recording.
+        :return: ``None``.
+        """
+        for entry in Recorder.read(path):
+            self.write(entry)
+
+    def write(self, entry: Recorder.Entry) -> None:
+        """Write the response of a recorded request.
+
+        The responses not to be exported are ignored.
+
+        :param entry: The recorded request.
+        :return: ``None``.
+        """
+        if entry.status_code >= 400 or not entry.content:
+            return
+
+        path = entry.path
+        parameters = entry.parameters
+
+        if path == '/v1/case':
+            self.__case = self.decoder(entry.content)
+        elif path == '/v1/securities/tas':
+            ticker = parameters['ticker']
+            last_id = self.__tas_ids.get(ticker, -1)
+
+            for item in sorted(
+                    self.decoder(entry.content),
+                    key=lambda item: item['id'],
+            ):
+                if item['id'] > last_id:
+                    self.__append('tas', ticker, item['period'], item)
+
+                    last_id = item['id']
+
+            self.__tas_ids[ticker] = last_id
+        elif path == '/v1/securities/history':
+            ticker = parameters['ticker']
+            period = parameters.get('period', self.__get_case('period'))
+            key = ticker, period
+            history = sorted(
+                self.decoder(entry.content),
+                key=lambda item: item['tick'],
+            )
+
+            for item in history:
+                candle = self.__candles.get(key)
+
+                if candle is not None and candle['tick'] < item['tick']:
+                    self.__append('history', ticker, period, candle)
+
+                if candle is None or candle['tick'] <= item['tick']:
+                    self.__candles[key] = item
+        elif path == '/v1/securities/book':
+            ticker = parameters['ticker']
+            book = self.decoder(entry.content)
+            period = self.__get_case('period')
+            tick = self.__get_case('tick')
+
+            for action, orders in zip(
+                    (Order.Action.BUY, Order.Action.SELL),
+                    _get_book_sides(book),
+            ):
+                for level, order in enumerate(orders):
+                    self.__append(
+                        'book',
+                        ticker,
+                        period,
+                        {
+                            **order,
+                            'timestamp': entry.timestamp,
+                            'tick': tick,
+                            'action': action.value,
+                            'level': level,
+                        },
+                    )
+        elif path == '/v1/orders' or path.startswith('/v1/orders/'):
+            orders = self.decoder(entry.content)
+
+            if isinstance(orders, dict):
+                orders = [orders]
+
+            for order in orders:
+                if 'order_id' in order:
+                    self.__append(
+                        'orders',
+                        order['ticker'],
+                        order['period'],
+                        {**order, 'timestamp': entry.timestamp},
+                    )
+        elif path == '/v1/news':
+            for item in sorted(
+                    self.decoder(entry.content),
+                    key=lambda item: item['news_id'],
+            ):
+                if item['news_id'] not in self.__news_ids:
+                    self.__news_ids.add(item['news_id'])
+                    self.__append(
+                        'news',
+                        item['ticker'],
+                        item['period'],
+                        item,
+                    )
+
+    def close(self) -> None:
+        """Write the buffered rows and close the files.
+
+        :return: ``None``.
+        """
+        for (ticker, period), candle in self.__candles.items():
+            self.__append('history', ticker, period, candle)
+
+        self.__candles.clear()
+
+        for key in tuple(self.__rows):
+            self.__flush(key)
+
+        for writer in self.__writers.values():
+            writer.close()
+
+        self.__writers.clear()
+
+    def __get_case(self, name: str) -> Any:
+        return None if self.__case is None else self.__case[name]
+
+    def __append(
+            self,
+            table: str,
+            ticker: str,
+            period: int,
+            row: dict[str, Any],
+    ) -> None:
+        key = table, ticker or '__HIVE_DEFAULT_PARTITION__', period
+        rows = self.__rows.setdefault(key, [])
+
+        rows.append(row)
+
+        if len(rows) >= self.chunk_size:
+            self.__flush(key)
+
+    def __flush(self, key: tuple[str, str, int]) -> None:
+        import pyarrow  # type: ignore[import]
+        import pyarrow.parquet  # type: ignore[import]
+
+        table, ticker, period = key
+        rows = self.__rows.pop(key, [])
+        schema = pyarrow.schema(_PARQUET_COLUMNS[table])
+
+        if key not in self.__writers:
+            directory = join(
+                self.directory,
+                table,
+                f'ticker={ticker}',
+                f'period={period}',
+            )
+
+            makedirs(directory, exist_ok=True)
+
+            self.__writers[key] = pyarrow.parquet.ParquetWriter(
+                join(directory, 'part-0.parquet'),
+                schema,
+            )
+
+        self.__writers[key].write_batch(
+            pyarrow.RecordBatch.from_pylist(rows, schema),
+        )
+
+
+_SHARED_MARKET_HEADER = Struct('<Qqqq')
+_SHARED_MARKET_TICKER = Struct('<16s')
+_SHARED_MARKET_QUOTE = Struct('<dddddd')
+
+
+@dataclass
+class SharedMarketPublisher:
+    """This class is for publishing the market state to shared memory.
+
+    The publisher lays out the :attr:`Case.period`, the
+    :attr:`Case.tick`, and the top of the book, the last price, and the
+    position of each security in a block of shared memory, from which
+    any number of :class:`SharedMarketReader` in other processes read
+    without sending requests. The block is guarded by a sequence lock:
+    the sequence number is odd while the block is being written, so
+    that the readers retry on torn reads instead of blocking the
+    publisher. Only one publisher may write to a block.
+
+    An instance can be subscribed to a :class:`MarketFeed`, or updated
+    in a polling loop.
+
+    >>> rit = RIT('G4DNIZ5D')
+    >>> with SharedMarketPublisher(['CRZY', 'TAME']) as publisher:
+    ...     with MarketFeed(rit, ['CRZY', 'TAME']) as feed:
+    ...         feed.subscribe(publisher)
+    ...         run_workers(publisher.name)
+    """
+
+    tickers: Sequence[str]
+    """The :attr:`Security.ticker` of the securities, each of at most
+    16 bytes.
+    """
+    name: Optional[str] = None
+    """The name of the block of shared memory. A unique name is
+    generated if ``None``.
+    """
+    __memory: SharedMemory = field(init=False)
+    __indices: dict[str, int] = field(init=False)
+    __sequence: int = field(default=0, init=False)
+    __lock: Lock = field(default_factory=Lock, init=False)
+
+    def __post_init__(self) -> None:
+        for ticker in self.tickers:
+            if len(ticker.encode()) > _SHARED_MARKET_TICKER.size:
+                raise ValueError(
+                    f'ticker {repr(ticker)} is longer than'
+                    f' {_SHARED_MARKET_TICKER.size} bytes',
+                )
+
+        self.__memory = SharedMemory(
+            self.name,
+            True,
+            _SHARED_MARKET_HEADER.size
+            + len(self.tickers) * (
+                _SHARED_MARKET_TICKER.size + _SHARED_MARKET_QUOTE.size
+            ),
+        )
+        self.__indices = {}
+        self.name = self.__memory.name
+
+        _SHARED_MARKET_HEADER.pack_into(
+            self.__memory.buf,
+            0,
+            0,
+            0,
+            0,
+            len(self.tickers),
+        )
+
+        for index, ticker in enumerate(self.tickers):
+            self.__indices[ticker] = index
+
+            _SHARED_MARKET_TICKER.pack_into(
+                self.__memory.buf,
+                _SHARED_MARKET_HEADER.size
+                + index * _SHARED_MARKET_TICKER.size,
+                ticker.encode(),
+            )
+
+    def __enter__(self) -> SharedMarketPublisher:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __call__(self, snapshot: Snapshot) -> None:
+        self.publish(snapshot.case, snapshot.securities)
+
+    def update(self, rit: RIT) -> None:
+        """Fetch and publish the case and the securities.
+
+        :param rit: The RIT client.
+        :return: ``None``.
+        """
+        self.publish(rit.get_case(), rit.get_securities())
+
+    def publish(self, case: Case, securities: Iterable[Security]) -> None:
+        """Publish the case and the securities.
+
+        The securities not published are ignored.
+
+        :param case: The current case.
+        :param securities: The securities and associated positions.
+        :return: ``None``.
+        """
+        buffer = self.__memory.buf
+        offset = _SHARED_MARKET_HEADER.size + len(self.tickers) * (
+            _SHARED_MARKET_TICKER.size
+        )
+
+        with self.__lock:
+            self.__sequence += 1
+
+            _SHARED_MARKET_HEADER.pack_into(
+                buffer,
+                0,
+                self.__sequence,
+                case.period,
+                case.tick,
+                len(self.tickers),
+            )
+
+            for security in securities:
+                index = self.__indices.get(security.ticker)
+
+                if index is not None:
+                    _SHARED_MARKET_QUOTE.pack_into(
+                        buffer,
+                        offset + index * _SHARED_MARKET_QUOTE.size,
+                        security.bid,
+                        security.bid_size,
+                        security.ask,
+                        security.ask_size,
+                        security.last,
+                        security.position,
+                    )
+
+            self.__sequence += 1
+
+            _SHARED_MARKET_HEADER.pack_into(
+                buffer,
+                0,
+                self.__sequence,
+                case.period,
+                case.tick,
+                len(self.tickers),
+            )
+
+    def close(self) -> None:
+        """Close and remove the block of shared memory.
+
+        :return: ``None``.
+        """
+        if os_name == 'posix':
+            # The readers sharing the resource tracker of this process
+            # may have unregistered the block.
+            register(
+                self.__memory._name,  # type: ignore[attr-defined]
+                'shared_memory',
+            )
+
+        self.__memory.close()
+        self.__memory.unlink()
+
+
+@dataclass
+class SharedMarketReader:
+    """This class is for reading the market state published by a
+    :class:`SharedMarketPublisher`.
+
+    The reads are retried until they are consistent, and never block
+    the publisher. If the publisher stops in the middle of writing, the
+    reads give up after the timeout.
+
+    >>> with SharedMarketReader(name) as reader:
+    ...     state = reader.read()
+    ...     quote = reader.get('CRZY')
+    >>> state.tick
+    31
+    >>> quote.bid
+    25.06
+    """
+
+    @dataclass(frozen=True)
+    class Quote:
+        """This class is for published securities."""
+
+        bid: float
+        """The best bid price."""
+        bid_size: float
+        """The quantity at the best bid price."""
+        ask: float
+        """The best ask price."""
+        ask_size: float
+        """The quantity at the best ask price."""
+        last: float
+        """The last traded price."""
+        position: float
+        """The position."""
+
+    @dataclass(frozen=True)
+    class State:
+        """This class is for published market states."""
+
+        sequence: int
+        """The sequence number of the publication, which increases with
+        every publication. Zero if nothing is published yet.
+        """
+        period: int
+        """The :attr:`Case.period`."""
+        tick: int
+        """The :attr:`Case.tick`."""
+        quotes: Mapping[str, SharedMarketReader.Quote]
+        """The securities, keyed by :attr:`Security.ticker`."""
+
+    name: str
+    """The name of the block of shared memory."""
+    timeout: float = 1.0
+    """The maximum number of seconds to retry an inconsistent read for.
+    Defaults to ``1.0``.
+    """
+    tickers: tuple[str, ...] = field(init=False)
+    """The :attr:`Security.ticker` of the published securities."""
+    __memory: SharedMemory = field(init=False)
+    __indices: dict[str, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.__memory = SharedMemory(self.name)
+
+        if os_name == 'posix':
+            # The block is owned by the publisher, so the resource
+            # tracker must not remove it when this process exits.
+            unregister(
+                self.__memory._name,  # type: ignore[attr-defined]
+                'shared_memory',
+            )
+
+        *_, count = _SHARED_MARKET_HEADER.unpack_from(self.__memory.buf)
+        self.tickers = tuple(
+            _SHARED_MARKET_TICKER.unpack_from(
+                self.__memory.buf,
+                _SHARED_MARKET_HEADER.size
+                + index * _SHARED_MARKET_TICKER.size,
+            )[0].rstrip(b'\0').decode()
+            for index in range(count)
+        )
+        self.__indices = {
+            ticker: index for index, ticker in enumerate(self.tickers)
+        }
+
+    def __enter__(self) -> SharedMarketReader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def read(self) -> SharedMarketReader.State:
+        """Read the market state.
+
+        :return: The market state.
+        :raises TimeoutError: If no consistent read is made within the
+                              timeout.
+        """
+        buffer = self.__memory.buf
+        offset = _SHARED_MARKET_HEADER.size + len(self.tickers) * (
+            _SHARED_MARKET_TICKER.size
+        )
+        deadline = None
+
+        while True:
+            sequence, period, tick, count = (
+                _SHARED_MARKET_HEADER.unpack_from(buffer)
+            )
+
+            if not sequence % 2:
+                quotes = bytes(
+                    buffer[offset:offset + count * _SHARED_MARKET_QUOTE.size],
+                )
+
+                if _SHARED_MARKET_HEADER.unpack_from(buffer)[0] == sequence:
+                    break
+
+            deadline = self.__retry(deadline)
+
+        return SharedMarketReader.State(
+            sequence // 2,
+            period,
+            tick,
+            {
+                ticker: SharedMarketReader.Quote(*values)
+                for ticker, values in zip(
+                    self.tickers,
+                    _SHARED_MARKET_QUOTE.iter_unpack(quotes),
+                )
+            },
+        )
+
+    def get(self, ticker: str) -> SharedMarketReader.Quote:
+        """Read a security.
+
+        :param ticker: The :attr:`Security.ticker`.
+        :return: The security.
+        :raises TimeoutError: If no consistent read is made within the
+                              timeout.
+        """
+        buffer = self.__memory.buf
+        offset = (
+            _SHARED_MARKET_HEADER.size
+            + len(self.tickers) * _SHARED_MARKET_TICKER.size
+            + self.__indices[ticker] * _SHARED_MARKET_QUOTE.size
+        )
+        deadline = None
+
+        while True:
+            sequence = _SHARED_MARKET_HEADER.unpack_from(buffer)[0]
+
+            if not sequence % 2:
+                values = _SHARED_MARKET_QUOTE.unpack_from(buffer, offset)
+
+                if _SHARED_MARKET_HEADER.unpack_from(buffer)[0] == sequence:
+                    return SharedMarketReader.Quote(*values)
+
+            deadline = self.__retry(deadline)
+
+    def close(self) -> None:
+        """Close the block of shared memory.
+
+        :return: ``None``.
+        """
+        self.__memory.close()
+
+    def __retry(self, deadline: Optional[float]) -> float:
+        if deadline is None:
+            return monotonic() + self.timeout
+        elif monotonic() > deadline:
+            raise TimeoutError(
+                f'no consistent read of {repr(self.name)} within'
+                f' {self.timeout} seconds',
+            )
+
+        return deadline
@@ -37,8 +37,13 @@ setup(
         'Source': 'https://github.com/AussieSeaweed/ritc',
         'Tracker': 'https://github.com/AussieSeaweed/ritc/issues',
     },
-    packages=find_packages(),
+    packages=find_packages(exclude=('tests',)),
     install_requires=['requests>=2.28.0<3'],
+    extras_require={
+        'numpy': ['numpy>=1.22'],
+        'orjson': ['orjson>=3'],
+        'pyarrow': ['pyarrow>=10'],
+    },
     python_requires='>=3.9',
     package_data={'ritc': ['py.typed']},
 )
@@ -0,0 +1,76 @@
+from importlib.util import find_spec
+from unittest import main, skipUnless, TestCase
+
+from benchmarks.server import MockServer
+from ritc import RIT
+
+
+@skipUnless(find_spec('numpy'), 'requires numpy')
+class ArraysTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_book(self) -> None:
+        book = self.rit.get_securities_book(ticker='CRZY', limit=5)
+        bids, asks = self.rit.get_securities_book_arrays(
+            ticker='CRZY',
+            limit=5,
+        )
+
+        for orders, array in ((book.bids, bids), (book.asks, asks)):
+            self.assertEqual(
+                list(array['order_id']),
+                [order.order_id for order in orders],
+            )
+            self.assertEqual(
+                list(array['price']),
+                [order.price for order in orders],
+            )
+            self.assertEqual(
+                list(array['quantity']),
+                [order.quantity - order.quantity_filled for order in orders],
+            )
+
+    def test_history(self) -> None:
+        history = self.rit.get_securities_history(ticker='CRZY', limit=10)
+        array = self.rit.get_securities_history_array(
+            ticker='CRZY',
+            limit=10,
+        )
+
+        self.assertEqual(
+            array.dtype.names,
+            ('tick', 'open', 'high', 'low', 'close'),
+        )
+        self.assertEqual(list(array['tick']), [ohlc.tick for ohlc in history])
+        self.assertEqual(
+            list(array['close']),
+            [ohlc.close for ohlc in history],
+        )
+
+    def test_tas(self) -> None:
+        tas = self.rit.get_securities_tas(ticker='CRZY', after=250)
+        array = self.rit.get_securities_tas_array(ticker='CRZY', after=250)
+
+        self.assertEqual(
+            array.dtype.names,
+            ('id', 'period', 'tick', 'price', 'quantity'),
+        )
+        self.assertEqual(list(array['id']), [item.id for item in tas])
+        self.assertEqual(list(array['price']), [item.price for item in tas])
+
+        array = self.rit.get_securities_tas_array(
+            ticker='CRZY',
+            after=self.server.market.tick * 2,
+        )
+
+        self.assertEqual(len(array), 0)
+        self.assertEqual(array.dtype.names[0], 'id')
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
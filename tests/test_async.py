@@ -0,0 +1,56 @@
+from asyncio import gather, run
+from unittest import main, TestCase
+
+from requests import HTTPError
+
+from benchmarks.server import MockServer, TICKERS
+from ritc import AsyncRIT, Order, RIT
+
+
+class AsyncRITTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = AsyncRIT(RIT('TEST', port=self.server.port))
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_gather(self) -> None:
+        async def request() -> None:
+            case, *books = await gather(
+                self.rit.get_case(),
+                *(
+                    self.rit.get_securities_book(ticker=ticker, limit=5)
+                    for ticker in TICKERS
+                ),
+            )
+
+            self.assertEqual(case.tick, self.server.market.tick)
+            self.assertEqual([len(book.bids) for book in books], [5, 5])
+
+        run(request())
+
+    def test_orders(self) -> None:
+        async def request() -> None:
+            order = await self.rit.post_orders(
+                ticker='CRZY',
+                type=Order.Type.MARKET,
+                quantity=10,
+                action=Order.Action.BUY,
+            )
+            same_order = await self.rit.get_orders(order.order_id)
+            orders = await self.rit.get_orders(
+                status=Order.Status.TRANSACTED,
+            )
+
+            self.assertEqual(same_order.quantity_filled, 10)
+            self.assertEqual([order.order_id for order in orders], [1])
+
+            with self.assertRaises(HTTPError):
+                await self.rit.get_orders(0)
+
+        run(request())
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,92 @@
+from typing import Any
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import BookMirror, Order, RIT
+
+
+class BookMirrorTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+        self.mirror = BookMirror(self.rit)
+
+        self.mirror.update('CRZY')
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_update(self) -> None:
+        book = self.server.market.book('CRZY', 20)
+        bids = book['bids'][1:] + [
+            self.server.market.make_order(100, 0, 'CRZY', 'BUY', 24.98),
+        ]
+        asks = [{**book['asks'][0], 'quantity_filled': 300.0}]
+        asks += book['asks'][1:]
+
+        self.server.market.book = (  # type: ignore[method-assign]
+            lambda ticker, limit: {'bids': bids, 'asks': asks}
+        )
+
+        diff = self.mirror.update('CRZY')
+        mirror = BookMirror(self.rit)
+
+        mirror.update('CRZY')
+        self.assertEqual(len(diff.added), 1)
+        self.assertEqual(len(diff.removed), 1)
+        self.assertEqual(len(diff.changed), 1)
+        self.assertEqual(self.mirror.best_bid('CRZY'), 24.98)
+        self.assertEqual(self.mirror.best_ask('CRZY'), 25.01)
+        self.assertEqual(
+            self.mirror.depth('CRZY', Order.Action.BUY, 24.98),
+            1000,
+        )
+        self.assertEqual(self.mirror.depth('CRZY', Order.Action.BUY, 24.99), 0)
+        self.assertEqual(
+            self.mirror.depth('CRZY', Order.Action.SELL, 25.01),
+            200,
+        )
+
+        for action in (Order.Action.BUY, Order.Action.SELL):
+            for price in (24.8, 24.9, 24.98, 24.985, 25.01, 25.1, 25.2):
+                self.assertEqual(
+                    self.mirror.cumulative_size('CRZY', action, price),
+                    mirror.cumulative_size('CRZY', action, price),
+                )
+
+    def test_cumulative_size(self) -> None:
+        def cumulative_size(action: Any, price: float) -> float:
+            return self.mirror.cumulative_size('CRZY', action, price)
+
+        self.assertEqual(cumulative_size(Order.Action.BUY, 25), 0)
+        self.assertEqual(cumulative_size(Order.Action.BUY, 24.99), 500)
+        self.assertEqual(cumulative_size(Order.Action.BUY, 24.975), 1000)
+        self.assertEqual(cumulative_size(Order.Action.BUY, 0), 10000)
+        self.assertEqual(cumulative_size(Order.Action.SELL, 25), 0)
+        self.assertEqual(cumulative_size(Order.Action.SELL, 25.015), 500)
+        self.assertEqual(cumulative_size(Order.Action.SELL, 25.02), 1000)
+
+    def test_singular_keys(self) -> None:
+        book = self.server.market.book
+
+        self.server.market.book = (  # type: ignore[method-assign]
+            lambda ticker, limit: {
+                'bid': book(ticker, limit)['bids'][1:],
+                'ask': book(ticker, limit)['asks'],
+            }
+        )
+
+        diff = self.mirror.update('CRZY')
+
+        self.assertEqual(len(diff.removed), 1)
+        self.assertEqual(self.mirror.best_bid('CRZY'), 24.98)
+        self.assertEqual(self.mirror.best_ask('CRZY'), 25.01)
+
+        bids, asks = self.rit.get_securities_book_arrays(ticker='CRZY')
+
+        self.assertEqual(list(bids['price'][:2]), [24.98, 24.97])
+        self.assertEqual(asks['price'][0], 25.01)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
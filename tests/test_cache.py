@@ -0,0 +1,131 @@
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import Cache, Order, RIT
+
+
+class CacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port, cache=Cache(ttl=60))
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_get(self) -> None:
+        case = self.rit.get_case()
+
+        self.assertIs(self.rit.get_case(), case)
+        self.assertIsNot(
+            self.rit.get_securities(ticker='CRZY'),
+            self.rit.get_securities(),
+        )
+        self.assertIsNot(
+            self.rit.get_securities_book(ticker='CRZY'),
+            self.rit.get_securities_book(ticker='CRZY'),
+        )
+
+        assert self.rit.cache is not None
+
+        self.assertEqual(self.rit.cache.hit_count, 1)
+        self.assertEqual(self.rit.cache.miss_count, 3)
+
+    def test_post(self) -> None:
+        securities = self.rit.get_securities()
+
+        self.rit.post_orders(
+            ticker='CRZY',
+            type=Order.Type.MARKET,
+            quantity=1,
+            action=Order.Action.BUY,
+        )
+
+        self.assertIsNot(self.rit.get_securities(), securities)
+
+    def test_tick(self) -> None:
+        cache = Cache(ttl=60)
+
+        cache.put('/v1/case', {}, {'period': 1, 'tick': 1}, 'A')
+        cache.put('/v1/securities', {}, 'A', 'A')
+        cache.put('/v1/securities', {}, 'B', 'B')
+        cache.put('/v1/case', {}, {'period': 1, 'tick': 1}, 'A')
+
+        self.assertEqual(cache.get('/v1/securities', {}, 'A'), 'A')
+
+        cache.put('/v1/case', {}, {'period': 1, 'tick': 2}, 'A')
+
+        self.assertIsNone(cache.get('/v1/securities', {}, 'A'))
+        self.assertEqual(cache.get('/v1/securities', {}, 'B'), 'B')
+
+    def test_clients(self) -> None:
+        cache = Cache(ttl=60)
+        rit = RIT('TEST', port=self.server.port, cache=cache)
+        other_rit = RIT('OTHER', port=self.server.port, cache=cache)
+        records_rit = RIT(
+            'TEST',
+            port=self.server.port,
+            records=True,
+            cache=cache,
+        )
+        case = rit.get_case()
+
+        self.assertIs(rit.get_case(), case)
+        self.assertIsNot(other_rit.get_case(), case)
+        self.assertIsNot(records_rit.get_case(), case)
+        self.assertIs(
+            RIT('TEST', port=self.server.port, cache=cache).get_case(),
+            case,
+        )
+
+        cache.put('/v1/case', {}, {'period': 2, 'tick': 0})
+
+        self.assertIs(rit.get_case(), case)
+
+    def test_records(self) -> None:
+        rit = RIT(
+            'TEST',
+            port=self.server.port,
+            records=True,
+            cache=Cache(ttl=60),
+        )
+        securities = rit.get_securities()
+        length = len(securities)
+
+        assert isinstance(securities, list)
+
+        securities.clear()
+
+        self.assertEqual(len(rit.get_securities()), length)
+
+        securities = rit.get_securities()
+
+        assert isinstance(securities, list)
+
+        securities.clear()
+
+        self.assertEqual(len(rit.get_securities()), length)
+
+    def test_snapshot(self) -> None:
+        market = self.server.market
+        tick = self.rit.get_case().tick
+
+        market.set_tick(tick + 1)
+
+        snapshot = self.rit.snapshot(['CRZY'], retries=0)
+
+        self.assertFalse(snapshot.is_consistent)
+
+        snapshot = self.rit.snapshot(['CRZY'], retries=0)
+
+        self.assertTrue(snapshot.is_consistent)
+        self.assertEqual(snapshot.tick, tick + 1)
+
+    def test_ttl(self) -> None:
+        rit = RIT('TEST', port=self.server.port, cache=Cache(ttl=0))
+        case = rit.get_case()
+
+        self.assertIsNot(rit.get_case(), case)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
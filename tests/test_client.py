@@ -0,0 +1,62 @@
+from socket import IPPROTO_TCP, SO_KEEPALIVE, SOL_SOCKET, TCP_NODELAY
+from typing import Any
+from unittest import main, TestCase
+
+from requests.adapters import HTTPAdapter
+
+from benchmarks.server import MockServer
+from ritc import Cache, Metrics, RateLimiter, RIT
+
+
+def _get_adapter(rit: RIT) -> Any:
+    return getattr(rit, '_RIT__session').get_adapter(
+        f'http://{rit.hostname}:{rit.port}',
+    )
+
+
+class ClientTestCase(TestCase):
+    def test_hash(self) -> None:
+        rit = RIT(
+            'TEST',
+            rate_limiter=RateLimiter(),
+            hooks=[Metrics()],
+            cache=Cache(),
+        )
+
+        self.assertEqual(len({rit, rit}), 1)
+        self.assertIsInstance(hash(RIT('TEST')), int)
+
+    def test_adapter(self) -> None:
+        with MockServer() as server:
+            rit = RIT('TEST', port=server.port, pool_maxsize=4)
+            pool_manager = _get_adapter(rit).poolmanager
+
+            self.assertEqual(
+                pool_manager.connection_pool_kw['socket_options'],
+                [(IPPROTO_TCP, TCP_NODELAY, 1), (SOL_SOCKET, SO_KEEPALIVE, 1)],
+            )
+            self.assertEqual(pool_manager.connection_pool_kw['maxsize'], 4)
+            self.assertTrue(pool_manager.connection_pool_kw['block'])
+
+            for _ in range(5):
+                rit.get_case()
+
+            key, = pool_manager.pools.keys()
+            pool = pool_manager.pools[key]
+
+            self.assertEqual(pool.num_connections, 1)
+            self.assertEqual(pool.num_requests, 5)
+
+    def test_socket_options(self) -> None:
+        rit = RIT('TEST', tcp_nodelay=False, keep_alive=False)
+        pool_manager = _get_adapter(rit).poolmanager
+
+        self.assertEqual(pool_manager.connection_pool_kw['socket_options'], [])
+
+        adapter = HTTPAdapter()
+
+        self.assertIs(_get_adapter(RIT('TEST', adapter=adapter)), adapter)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,179 @@
+from typing import Any
+from unittest import main, TestCase
+
+from benchmarks.server import API_ORDERS_PER_SECOND, MockServer, TICKERS
+from ritc import BulkOrderError, Order, RIT
+
+
+class ConcurrencyTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_submit(self) -> None:
+        case, book = self.rit.gather(
+            self.rit.submit('get_case'),
+            self.rit.submit('get_securities_book', ticker='CRZY'),
+        )
+
+        self.assertEqual(case.tick, self.server.market.tick)
+        self.assertEqual(book.bids[0].price, 24.99)
+
+    def test_gather(self) -> None:
+        results = self.rit.gather(
+            self.rit.submit('get_case'),
+            self.rit.submit('get_orders', 0),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(results[0].status, 'ACTIVE')
+        self.assertIsInstance(results[1], Exception)
+
+        with self.assertRaises(Exception):
+            self.rit.gather(self.rit.submit('get_orders', 0))
+
+    def test_submit_nested(self) -> None:
+        futures = [
+            self.rit.submit('snapshot', TICKERS)
+            for _ in range(2 * self.rit.pool_maxsize)
+        ]
+
+        for snapshot in self.rit.gather(*futures):
+            self.assertEqual(set(snapshot.books), set(TICKERS))
+
+        rit = RIT('TEST', port=self.server.port, pool_maxsize=1)
+        snapshot, report = rit.gather(
+            rit.submit('snapshot', TICKERS),
+            rit.submit('post_orders_sliced', 'CRZY', 5, Order.Action.BUY),
+        )
+
+        self.assertEqual(set(snapshot.books), set(TICKERS))
+        self.assertEqual(report.quantity_filled, 5)
+
+    def test_snapshot(self) -> None:
+        snapshot = self.rit.snapshot(TICKERS, book_limit=5)
+
+        self.assertEqual(snapshot.tick, self.server.market.tick)
+        self.assertEqual(len(snapshot.securities), len(TICKERS))
+        self.assertEqual(set(snapshot.books), set(TICKERS))
+        self.assertEqual(len(snapshot.books['CRZY'].bids), 5)
+        self.assertEqual(set(snapshot.tas), set(TICKERS))
+
+        snapshot = self.rit.snapshot(TICKERS, include_tas=False)
+
+        self.assertFalse(snapshot.tas)
+
+    def test_snapshot_tick(self) -> None:
+        market = self.server.market
+        case = market.case
+        calls = []
+
+        def advance() -> dict[str, Any]:
+            calls.append(market.tick)
+            response = case()
+
+            if len(calls) == 1:
+                market.set_tick(market.tick + 1)
+
+            return response
+
+        market.case = advance  # type: ignore[method-assign]
+        snapshot = self.rit.snapshot(['CRZY'])
+
+        self.assertEqual(len(calls), 4)
+        self.assertTrue(snapshot.is_consistent)
+        self.assertEqual(snapshot.tick, market.tick)
+
+        calls.clear()
+
+        snapshot = self.rit.snapshot(['CRZY'], retries=0)
+
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(snapshot.is_consistent)
+
+    def test_post_orders_bulk(self) -> None:
+        orders = self.rit.post_orders_bulk(
+            {
+                'ticker': 'CRZY',
+                'type': Order.Type.LIMIT,
+                'quantity': 5,
+                'action': Order.Action.BUY,
+                'price': 24.5 - i / 100,
+            }
+            for i in range(3)
+        )
+
+        self.assertEqual(
+            [order.price for order in orders],
+            [24.5, 24.49, 24.48],
+        )
+        self.assertEqual(
+            len(self.rit.get_orders(status=Order.Status.OPEN)),
+            3,
+        )
+
+    def test_post_orders_bulk_error(self) -> None:
+        with self.assertRaises(BulkOrderError) as context:
+            self.rit.post_orders_bulk(
+                {
+                    'ticker': 'CRZY',
+                    'type': Order.Type.MARKET,
+                    'quantity': 1,
+                    'action': Order.Action.BUY,
+                }
+                for _ in range(API_ORDERS_PER_SECOND + 2)
+            )
+
+        orders = [
+            order for order in context.exception.orders if order is not None
+        ]
+        errors = [
+            error for error in context.exception.errors if error is not None
+        ]
+
+        self.assertEqual(len(orders), API_ORDERS_PER_SECOND)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(
+            len(self.rit.get_orders(status=Order.Status.TRANSACTED)),
+            API_ORDERS_PER_SECOND,
+        )
+
+    def test_replace_quotes(self) -> None:
+        cancelled_order_ids, orders = self.rit.replace_quotes(
+            'CRZY',
+            bids=[(24.5, 100), (24.49, 100)],
+            asks=[(25.5, 100)],
+        )
+
+        self.assertFalse(cancelled_order_ids)
+        self.assertEqual(len(orders), 3)
+
+        order_ids = {order.price: order.order_id for order in orders}
+        cancelled_order_ids, orders = self.rit.replace_quotes(
+            'CRZY',
+            bids=[(24.5, 100), (24.48, 100)],
+            asks=[(25.5, 200)],
+        )
+
+        self.assertEqual(
+            sorted(cancelled_order_ids),
+            sorted([order_ids[24.49], order_ids[25.5]]),
+        )
+        self.assertEqual(
+            sorted((order.price, order.quantity) for order in orders),
+            [(24.48, 100), (25.5, 200)],
+        )
+        self.assertEqual(
+            sorted(
+                order.price
+                for order in self.rit.get_orders(status=Order.Status.OPEN)
+            ),
+            [24.48, 24.5, 25.5],
+        )
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
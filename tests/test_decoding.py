@@ -0,0 +1,99 @@
+from collections.abc import Mapping, Sequence
+from copy import deepcopy
+from importlib.util import find_spec
+from json import loads as json_loads
+from pickle import dumps, loads
+from typing import Any
+from unittest import main, skipUnless, TestCase
+
+from benchmarks.server import MockServer
+from ritc import RIT
+
+
+def _plain(data: Any) -> Any:
+    if isinstance(data, Mapping):
+        return {key: _plain(value) for key, value in data.items()}
+    elif not isinstance(data, str) and isinstance(data, Sequence):
+        return [_plain(item) for item in data]
+
+    return data
+
+
+class DecodingTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+        self.records_rit = RIT('TEST', port=self.server.port, records=True)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_records(self) -> None:
+        for method_name, kwargs in (
+                ('get_case', {}),
+                ('get_limits', {}),
+                ('get_securities', {}),
+                ('get_securities_book', {'ticker': 'CRZY'}),
+                ('get_securities_history', {'ticker': 'CRZY'}),
+                ('get_securities_tas', {'ticker': 'CRZY'}),
+                ('get_news', {}),
+                ('get_tenders', {}),
+        ):
+            with self.subTest(method_name=method_name):
+                self.assertEqual(
+                    _plain(getattr(self.records_rit, method_name)(**kwargs)),
+                    _plain(getattr(self.rit, method_name)(**kwargs)),
+                )
+
+    def test_record(self) -> None:
+        case: Any = self.records_rit.get_case()
+
+        self.assertEqual(case.tick, case['tick'])
+        self.assertEqual(type(case).__module__, 'ritc')
+
+        with self.assertRaises(AttributeError):
+            case.tick = 0
+
+        with self.assertRaises(KeyError):
+            case['none']
+
+    def test_pickle(self) -> None:
+        book = self.records_rit.get_securities_book(ticker='CRZY')
+
+        for copy in (loads(dumps(book)), deepcopy(book)):
+            self.assertIs(type(copy), type(book))
+            self.assertEqual(_plain(copy), _plain(book))
+
+    @skipUnless(find_spec('orjson'), 'requires orjson')
+    def test_decoder(self) -> None:
+        from orjson import loads as orjson_loads
+
+        json_rit = RIT('TEST', port=self.server.port, decoder=json_loads)
+        orjson_rit = RIT('TEST', port=self.server.port, decoder=orjson_loads)
+
+        self.assertIs(self.rit.decoder, orjson_loads)
+
+        for method_name, kwargs in (
+                ('get_case', {}),
+                ('get_securities', {}),
+                ('get_securities_book', {'ticker': 'CRZY'}),
+                ('get_securities_tas', {'ticker': 'CRZY'}),
+                ('get_news', {}),
+        ):
+            with self.subTest(method_name=method_name):
+                self.assertEqual(
+                    _plain(getattr(orjson_rit, method_name)(**kwargs)),
+                    _plain(getattr(json_rit, method_name)(**kwargs)),
+                )
+
+        content = (
+            b'{"price": 25.06, "quantity": 1e3, "ticker": "CRZY",'
+            b' "name": "\\u00e9", "orders": [{"id": 1, "vwap": null}],'
+            b' "is_fixed_bid": true}'
+        )
+
+        self.assertEqual(orjson_loads(content), json_loads(content))
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
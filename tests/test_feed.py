@@ -0,0 +1,60 @@
+from time import sleep
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer, TICKERS
+from ritc import MarketFeed, RIT, Snapshot
+
+
+class MarketFeedTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_callback_error(self) -> None:
+        errors: list[Exception] = []
+        snapshots: list[Snapshot] = []
+
+        def fail(snapshot: Snapshot) -> None:
+            raise ValueError
+
+        feed = MarketFeed(
+            self.rit,
+            TICKERS,
+            interval=0.01,
+            on_error=errors.append,
+        )
+
+        feed.subscribe(fail)
+        feed.subscribe(snapshots.append)
+
+        with feed:
+            sleep(0.2)
+
+        self.assertGreater(len(snapshots), 1)
+        self.assertEqual(len(errors), len(snapshots))
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_start(self) -> None:
+        snapshots: list[Snapshot] = []
+        feed = MarketFeed(self.rit, TICKERS, interval=0.05)
+
+        feed.subscribe(snapshots.append)
+        feed.start()
+        feed.start()
+        sleep(0.12)
+        feed.stop()
+
+        self.assertLessEqual(len(snapshots), 3)
+
+        count = len(snapshots)
+
+        sleep(0.1)
+
+        self.assertEqual(len(snapshots), count)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,87 @@
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import main, TestCase
+
+from requests import HTTPError
+
+from benchmarks.server import MockServer
+from ritc import Metrics, Order, RequestEvent, RIT
+
+
+class MetricsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.metrics = Metrics()
+        self.rit = RIT('TEST', port=self.server.port, hooks=[self.metrics])
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_statistics(self) -> None:
+        for _ in range(5):
+            self.rit.get_securities_book(ticker='CRZY')
+
+        statistics = self.metrics.statistics['GET', '/v1/securities/book']
+
+        self.assertEqual(statistics.count, 5)
+        self.assertEqual(statistics.error_count, 0)
+        self.assertEqual(statistics.retry_count, 0)
+        self.assertEqual(len(statistics.latencies), 5)
+        self.assertGreater(statistics.content_size, 0)
+        self.assertGreater(statistics.latency, 0)
+        self.assertLessEqual(
+            statistics.percentile(0),
+            statistics.percentile(100),
+        )
+
+    def test_errors(self) -> None:
+        for id in (1000, 1001):
+            with self.assertRaises(HTTPError):
+                self.rit.get_orders(id)
+
+        statistics = self.metrics.statistics['GET', '/v1/orders/{id}']
+
+        self.assertEqual(statistics.count, 2)
+        self.assertEqual(statistics.error_count, 2)
+
+    def test_maxlen(self) -> None:
+        metrics = Metrics(maxlen=2)
+        rit = RIT('TEST', port=self.server.port, hooks=[metrics])
+
+        for _ in range(3):
+            rit.get_case()
+
+        statistics = metrics.statistics['GET', '/v1/case']
+
+        self.assertEqual(statistics.count, 3)
+        self.assertEqual(len(statistics.latencies), 2)
+
+    def test_hook_error(self) -> None:
+        events: list[RequestEvent] = []
+
+        def hook(event: RequestEvent) -> None:
+            raise RuntimeError
+
+        rit = RIT(
+            'TEST',
+            port=self.server.port,
+            hooks=[hook, events.append],
+        )
+        stderr = StringIO()
+
+        with redirect_stderr(stderr):
+            order = rit.post_orders(
+                ticker='CRZY',
+                type=Order.Type.MARKET,
+                quantity=100,
+                action=Order.Action.BUY,
+            )
+
+        self.assertEqual(order.quantity_filled, 100)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].status_code, 200)
+        self.assertIn('RuntimeError', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,58 @@
+from unittest import main, TestCase
+
+from benchmarks.server import API_ORDERS_PER_SECOND, MockServer
+from ritc import Metrics, Order, RateLimiter, RIT
+
+
+class PostOrdersSlicedTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_post_orders_sliced(self) -> None:
+        report = self.rit.post_orders_sliced('CRZY', 25000, Order.Action.BUY)
+
+        self.assertEqual(
+            [order.quantity for order in report.orders],
+            [10000, 10000, 5000],
+        )
+        self.assertEqual(report.quantity_filled, 25000)
+        self.assertAlmostEqual(report.vwap or 0, 25)
+
+    def test_rate_limiter(self) -> None:
+        rate_limiter = RateLimiter()
+        metrics = Metrics()
+        rit = RIT(
+            'TEST',
+            port=self.server.port,
+            rate_limiter=rate_limiter,
+            hooks=[metrics],
+        )
+        report = rit.post_orders_sliced('CRZY', 150000, Order.Action.BUY)
+        statistics = metrics.statistics['POST', '/v1/orders']
+
+        self.assertEqual(report.quantity_filled, 150000)
+        self.assertEqual(rate_limiter.rates, {'CRZY': API_ORDERS_PER_SECOND})
+        self.assertGreater(rate_limiter.wait_time('CRZY'), 1)
+        self.assertLess(statistics.wait_time, 1)
+
+    def test_unknown_ticker(self) -> None:
+        with self.assertRaises(ValueError):
+            self.rit.post_orders_sliced('NONE', 100, Order.Action.BUY)
+
+    def test_max_trade_size(self) -> None:
+        security = self.server.market.securities('CRZY')[0]
+
+        self.server.market.securities = (  # type: ignore[method-assign]
+            lambda ticker: [{**security, 'max_trade_size': 0.0}]
+        )
+
+        with self.assertRaises(ValueError):
+            self.rit.post_orders_sliced('CRZY', 100, Order.Action.BUY)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,96 @@
+from importlib.util import find_spec
+from os import remove
+from shutil import rmtree
+from tempfile import mkdtemp, mkstemp
+from typing import Any
+from unittest import main, skipUnless, TestCase
+
+from benchmarks.server import MockServer, NEWS_INTERVAL
+from ritc import Order, ParquetExporter, Recorder, RIT
+
+
+@skipUnless(find_spec('pyarrow'), 'pyarrow is not installed')
+class ParquetExporterTestCase(TestCase):
+    def setUp(self) -> None:
+        descriptor, self.path = mkstemp()
+        self.directory = mkdtemp()
+
+        with open(descriptor, 'wb'):
+            pass
+
+        with MockServer() as server, Recorder(self.path, True) as recorder:
+            rit = RIT('TEST', port=server.port, hooks=[recorder])
+
+            for tick in (100, 101):
+                server.market.set_tick(tick)
+                rit.get_case()
+                rit.get_securities_tas(ticker='CRZY', limit=10)
+                rit.get_securities_history(ticker='CRZY', limit=5)
+                rit.get_securities_book(ticker='TAME', limit=3)
+
+            server.market.set_tick(3 * NEWS_INTERVAL)
+            rit.get_news(limit=2)
+            rit.get_news(limit=3)
+            rit.post_orders(
+                ticker='CRZY',
+                type=Order.Type.MARKET,
+                quantity=10,
+                action=Order.Action.BUY,
+            )
+            rit.get_orders(status=Order.Status.TRANSACTED)
+
+    def tearDown(self) -> None:
+        remove(self.path)
+        rmtree(self.directory)
+
+    def read(self, table: str) -> list[dict[str, Any]]:
+        import pyarrow.dataset  # type: ignore[import]
+
+        dataset = pyarrow.dataset.dataset(
+            f'{self.directory}/{table}',
+            partitioning='hive',
+        )
+        rows: list[dict[str, Any]] = dataset.to_table().to_pylist()
+
+        return rows
+
+    def test_export(self) -> None:
+        with ParquetExporter(self.directory) as exporter:
+            exporter.export(self.path)
+
+        tas = self.read('tas')
+        history = self.read('history')
+        book = self.read('book')
+        orders = self.read('orders')
+        news = self.read('news')
+
+        self.assertEqual(
+            sorted(row['id'] for row in tas),
+            list(range(191, 203)),
+        )
+        self.assertEqual({row['ticker'] for row in tas}, {'CRZY'})
+        self.assertEqual({row['period'] for row in tas}, {1})
+        self.assertEqual(
+            sorted(row['tick'] for row in history),
+            list(range(96, 102)),
+        )
+        self.assertEqual(len(book), 12)
+        self.assertEqual(
+            sorted(
+                (row['tick'], row['action'], row['level'])
+                for row in book
+            )[:4],
+            [
+                (100, 'BUY', 0),
+                (100, 'BUY', 1),
+                (100, 'BUY', 2),
+                (100, 'SELL', 0),
+            ],
+        )
+        self.assertEqual(len({row['order_id'] for row in orders}), 1)
+        self.assertEqual({row['quantity_filled'] for row in orders}, {10})
+        self.assertEqual(sorted(row['news_id'] for row in news), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,98 @@
+from typing import Any, Optional
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import Metrics, Order, PortfolioTracker, RIT
+
+
+class PortfolioTrackerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.metrics = Metrics()
+        self.rit = RIT('TEST', port=self.server.port, hooks=[self.metrics])
+        self.tracker = PortfolioTracker(self.rit)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def post_orders(self, **kwargs: Any) -> Order:
+        order: Order = self.rit.post_orders(
+            ticker='CRZY',
+            quantity=100,
+            **kwargs,
+        )
+
+        return order
+
+    def test_apply(self) -> None:
+        buy = self.post_orders(type=Order.Type.MARKET, action='BUY')
+        sell = self.post_orders(type=Order.Type.MARKET, action='SELL')
+
+        self.assertEqual(self.tracker.apply(buy), 100)
+        self.assertEqual(self.tracker.apply(buy), 0)
+        self.assertEqual(self.tracker.gross('LIMIT-STOCK'), 100)
+        self.assertEqual(self.tracker.net('LIMIT-STOCK'), 100)
+        self.assertEqual(self.tracker.positions['CRZY'].vwap, 25)
+        self.assertEqual(self.tracker.apply(sell), 100)
+        self.assertEqual(self.tracker.positions['CRZY'].position, 0)
+        self.assertEqual(self.tracker.positions['CRZY'].realized, 0)
+        self.assertEqual(self.tracker.utilization('LIMIT-STOCK'), (0, 0))
+
+    def test_update(self) -> None:
+        order = self.post_orders(
+            type=Order.Type.LIMIT,
+            action='SELL',
+            price=26,
+        )
+
+        self.tracker.update()
+        self.assertEqual(self.tracker.positions['CRZY'].position, 0)
+
+        self.server.market.orders[order.order_id].update(
+            quantity_filled=100.0,
+            vwap=26.0,
+            status='TRANSACTED',
+        )
+        self.tracker.update()
+        self.assertEqual(self.tracker.positions['CRZY'].position, -100)
+        self.assertEqual(self.tracker.positions['CRZY'].vwap, 26)
+        self.tracker.update()
+        self.assertEqual(self.tracker.positions['CRZY'].position, -100)
+        self.assertEqual(
+            self.metrics.statistics['GET', '/v1/orders/{id}'].count,
+            1,
+        )
+
+    def test_reconcile(self) -> None:
+        market = self.server.market
+        securities = market.securities
+        calls = []
+
+        def fill(ticker: Optional[str]) -> list[dict[str, Any]]:
+            calls.append(ticker)
+
+            if len(calls) == 1:
+                market.post_order(
+                    {
+                        'ticker': 'CRZY',
+                        'type': 'MARKET',
+                        'quantity': '100',
+                        'action': 'BUY',
+                    },
+                )
+
+            return securities(ticker)
+
+        market.securities = fill  # type: ignore[method-assign]
+
+        self.tracker.reconcile()
+        self.assertEqual(len(calls), 2)
+
+        calls.clear()
+        self.tracker.reconciliation_retries = 0
+        self.tracker.reconcile()
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,96 @@
+from threading import Thread
+from time import monotonic, sleep
+from types import SimpleNamespace
+from typing import Any
+from unittest import main, TestCase
+
+from benchmarks.server import API_ORDERS_PER_SECOND, MockServer
+from ritc import Order, RateLimiter, RIT
+
+
+class RateLimiterTestCase(TestCase):
+    def test_acquire(self) -> None:
+        rate_limiter = RateLimiter({'CRZY': 20})
+        start_time = monotonic()
+
+        for _ in range(5):
+            rate_limiter.acquire('CRZY')
+
+        self.assertGreaterEqual(monotonic() - start_time, 0.19)
+        self.assertEqual(rate_limiter.acquire('TAME'), 0.0)
+        self.assertGreater(rate_limiter.wait_time('CRZY'), 0.0)
+        self.assertEqual(rate_limiter.queue_depth('CRZY'), 0)
+
+    def test_burst(self) -> None:
+        rate_limiter = RateLimiter({'CRZY': 1}, burst=3)
+
+        for _ in range(3):
+            self.assertEqual(rate_limiter.acquire('CRZY'), 0.0)
+
+    def test_threads(self) -> None:
+        rate_limiter = RateLimiter({'CRZY': 20})
+        wait_times = [0.0] * 5
+
+        def acquire(index: int) -> None:
+            wait_times[index] = rate_limiter.acquire('CRZY')
+
+        threads = [Thread(target=acquire, args=(i,)) for i in range(5)]
+
+        for thread in threads:
+            thread.start()
+            sleep(0.01)
+
+        self.assertGreater(rate_limiter.queue_depth('CRZY'), 0)
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(wait_times[0], 0.0)
+        self.assertEqual(wait_times, sorted(wait_times))
+        self.assertGreater(wait_times[-1], 0.1)
+        self.assertEqual(rate_limiter.queue_depth('CRZY'), 0)
+        self.assertAlmostEqual(rate_limiter.wait_time('CRZY'), sum(wait_times))
+
+    def test_update(self) -> None:
+        rate_limiter = RateLimiter({'TAME': 5})
+        securities: Any = [
+            SimpleNamespace(ticker='CRZY', api_orders_per_second=10),
+            SimpleNamespace(ticker='TAME', api_orders_per_second=0),
+        ]
+
+        rate_limiter.update(securities)
+
+        self.assertEqual(rate_limiter.rates, {'CRZY': 10, 'TAME': 5})
+
+    def test_post_orders(self) -> None:
+        with MockServer() as server:
+            rit = RIT('TEST', port=server.port, rate_limiter=RateLimiter())
+
+            assert rit.rate_limiter is not None
+
+            rit.rate_limiter.update(rit.get_securities())
+
+            self.assertEqual(
+                rit.rate_limiter.rates,
+                {'CRZY': API_ORDERS_PER_SECOND, 'TAME': API_ORDERS_PER_SECOND},
+            )
+
+            orders = rit.post_orders_bulk(
+                (
+                    {
+                        'ticker': 'CRZY',
+                        'type': Order.Type.MARKET,
+                        'quantity': 1,
+                        'action': Order.Action.BUY,
+                    }
+                    for _ in range(API_ORDERS_PER_SECOND + 5)
+                ),
+                True,
+            )
+
+            self.assertEqual(len(orders), API_ORDERS_PER_SECOND + 5)
+            self.assertGreater(rit.rate_limiter.wait_time('CRZY'), 0.0)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,73 @@
+from json import loads
+from os import remove
+from os.path import getsize
+from tempfile import mkstemp
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import Recorder, RIT
+
+
+class RecorderTestCase(TestCase):
+    def setUp(self) -> None:
+        descriptor, self.path = mkstemp()
+
+        with open(descriptor, 'wb'):
+            pass
+
+    def tearDown(self) -> None:
+        remove(self.path)
+
+    def record(self, compress: bool) -> None:
+        self.truncate(0)
+
+        with MockServer() as server, Recorder(self.path, compress) as recorder:
+            rit = RIT('TEST', port=server.port, hooks=[recorder])
+
+            rit.get_case()
+            rit.get_securities_book(ticker='CRZY')
+            rit.get_securities(ticker='TAME')
+
+    def truncate(self, size: int) -> None:
+        with open(self.path, 'r+b') as file:
+            file.truncate(size)
+
+    def test_read(self) -> None:
+        for compress in (False, True):
+            self.record(compress)
+
+            entries = list(Recorder.read(self.path))
+
+            self.assertEqual(
+                [entry.path for entry in entries],
+                ['/v1/case', '/v1/securities/book', '/v1/securities'],
+            )
+            self.assertEqual(entries[-2].parameters, {'ticker': 'CRZY'})
+            self.assertEqual(entries[-1].status_code, 200)
+            self.assertEqual(loads(entries[-1].content)[0]['ticker'], 'TAME')
+
+    def test_truncated(self) -> None:
+        self.record(False)
+        self.truncate(getsize(self.path) - 1)
+
+        entries = list(Recorder.read(self.path))
+
+        self.assertEqual(len(entries), 2)
+
+        for entry in entries:
+            loads(entry.content)
+
+    def test_truncated_compressed(self) -> None:
+        self.record(True)
+        self.truncate(getsize(self.path) - 8)
+
+        self.assertEqual(len(list(Recorder.read(self.path))), 3)
+
+        self.truncate(getsize(self.path) // 2)
+
+        for entry in Recorder.read(self.path):
+            loads(entry.content)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,122 @@
+from os import remove
+from tempfile import mkstemp
+from unittest import main, TestCase
+
+from requests import HTTPError
+
+from benchmarks.server import MockServer
+from ritc import Case, Order, Recorder, ReplayAdapter, RIT, TickScheduler
+
+
+class ReplayAdapterTestCase(TestCase):
+    def setUp(self) -> None:
+        descriptor, self.path = mkstemp()
+
+        with open(descriptor, 'wb'):
+            pass
+
+        with MockServer() as server, Recorder(self.path) as recorder:
+            rit = RIT('TEST', port=server.port, hooks=[recorder])
+
+            for tick in range(3):
+                server.market.set_tick(tick + 1)
+                rit.get_case()
+                rit.get_securities_book(ticker='CRZY')
+
+            rit.get_securities_book(ticker='TAME', limit=5)
+            rit.get_securities()
+
+        self.rit = RIT('TEST', adapter=ReplayAdapter(self.path))
+
+    def tearDown(self) -> None:
+        remove(self.path)
+
+    def test_case(self) -> None:
+        ticks = [self.rit.get_case().tick for _ in range(3)]
+        case = self.rit.get_case()
+
+        self.assertEqual(ticks, [1, 2, 3])
+        self.assertEqual(case.status, Case.Status.STOPPED)
+
+    def test_speed(self) -> None:
+        rit = RIT('TEST', adapter=ReplayAdapter(self.path, 1e-6))
+        case = rit.get_case()
+
+        self.assertEqual(case.tick, 1)
+        self.assertEqual(case.status, Case.Status.ACTIVE)
+
+        rit = RIT('TEST', adapter=ReplayAdapter(self.path, 1e6))
+        case = rit.get_case()
+
+        self.assertEqual(case.tick, 3)
+        self.assertEqual(case.status, Case.Status.STOPPED)
+
+        ticks: list[int] = []
+        scheduler = TickScheduler(rit, poll_interval=0)
+
+        scheduler.register(lambda case: ticks.append(case.tick))
+        scheduler.run()
+        self.assertFalse(ticks)
+
+    def test_find(self) -> None:
+        self.rit.get_case()
+
+        with self.assertRaises(HTTPError):
+            self.rit.get_securities_book(ticker='TAME')
+
+        with self.assertRaises(HTTPError):
+            self.rit.get_securities_history(ticker='CRZY')
+
+        self.rit.get_case()
+        self.rit.get_case()
+
+        book = self.rit.get_securities_book(ticker='TAME')
+        securities = self.rit.get_securities(ticker='TAME')
+
+        self.assertEqual(len(book.bids), 5)
+        self.assertEqual({order.ticker for order in book.bids}, {'TAME'})
+        self.assertEqual(
+            [security.ticker for security in securities],
+            ['TAME'],
+        )
+
+    def test_orders(self) -> None:
+        self.rit.get_case()
+
+        order = self.rit.post_orders(
+            ticker='CRZY',
+            type=Order.Type.MARKET,
+            quantity=10,
+            action=Order.Action.BUY,
+        )
+
+        self.assertEqual(order.status, Order.Status.TRANSACTED)
+        self.assertEqual(order.vwap, 25.01)
+
+        order = self.rit.post_orders(
+            ticker='CRZY',
+            type=Order.Type.LIMIT,
+            quantity=10,
+            action=Order.Action.BUY,
+            price=24,
+        )
+
+        self.assertEqual(order.status, Order.Status.OPEN)
+        self.assertEqual(
+            list(self.rit.post_commands_cancel(all=1).cancelled_order_ids),
+            [order.order_id],
+        )
+        self.assertFalse(self.rit.get_orders(status=Order.Status.OPEN))
+
+        order = self.rit.post_orders(
+            ticker='TAME',
+            type=Order.Type.MARKET,
+            quantity=10,
+            action=Order.Action.BUY,
+        )
+
+        self.assertEqual(order.quantity_filled, 0)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,106 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic, sleep
+from typing import Any
+from unittest import main, TestCase
+
+from requests import HTTPError
+
+from benchmarks.server import MockServer
+from ritc import Order, PortfolioTracker, RiskError, RiskGate, RIT
+
+
+class RiskGateTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+        self.gate = RiskGate(PortfolioTracker(self.rit))
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def post_orders(self) -> bool:
+        try:
+            self.gate.post_orders(
+                True,
+                ticker='CRZY',
+                type=Order.Type.LIMIT,
+                quantity=10000,
+                action=Order.Action.BUY,
+                price=24,
+            )
+        except RiskError:
+            return False
+
+        return True
+
+    def test_trade_size(self) -> None:
+        with self.assertRaises(RiskError):
+            self.gate.check('CRZY', Order.Action.BUY, 20000)
+
+        self.gate.check('CRZY', Order.Action.BUY, 20000, True)
+
+    def test_open_orders(self) -> None:
+        with ThreadPoolExecutor(15) as executor:
+            results = list(
+                executor.map(lambda _: self.post_orders(), range(15)),
+            )
+
+        self.assertEqual(results.count(True), 10)
+        self.assertEqual(
+            len(self.rit.get_orders(status=Order.Status.OPEN)),
+            10,
+        )
+
+        with self.assertRaises(RiskError):
+            self.gate.check('CRZY', Order.Action.BUY, 1)
+
+        self.gate.check('CRZY', Order.Action.SELL, 10000)
+        self.rit.post_commands_cancel(all=1)
+        self.gate.refresh()
+        self.gate.check('CRZY', Order.Action.BUY, 10000)
+
+    def test_concurrency(self) -> None:
+        post_order = self.server.market.post_order
+
+        def delay(parameters: dict[str, str]) -> tuple[int, dict[str, Any]]:
+            sleep(0.05)
+
+            return post_order(parameters)
+
+        self.server.market.post_order = delay  # type: ignore[method-assign]
+        start_time = monotonic()
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(
+                executor.map(lambda _: self.post_orders(), range(8)),
+            )
+
+        self.assertEqual(results, [True] * 8)
+        self.assertLess(monotonic() - start_time, 0.3)
+
+    def test_rollback(self) -> None:
+        self.server.market.post_order = (  # type: ignore[method-assign]
+            lambda parameters: (500, {'code': 'ERROR', 'message': 'Error'})
+        )
+
+        for _ in range(10):
+            self.assertRaises(HTTPError, self.post_orders)
+
+        self.gate.check('CRZY', Order.Action.BUY, 100000, True)
+
+    def test_post_orders_sliced(self) -> None:
+        report = self.gate.post_orders_sliced(
+            'CRZY',
+            25000,
+            Order.Action.BUY,
+        )
+
+        self.assertEqual(
+            [order.quantity for order in report.orders],
+            [10000, 10000, 5000],
+        )
+        self.assertEqual(self.gate.tracker.positions['CRZY'].position, 25000)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
@@ -0,0 +1,74 @@
+from time import sleep
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import Case, RIT, TickScheduler
+
+
+class TickSchedulerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+        self.ticks: list[int] = []
+        self.scheduler = TickScheduler(self.rit, pause_interval=0.25)
+
+        self.scheduler.register(lambda case: self.ticks.append(case.tick))
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_poll(self) -> None:
+        market = self.server.market
+
+        market.set_tick(10)
+        self.scheduler.poll()
+        self.scheduler.poll()
+        market.set_tick(12)
+        self.scheduler.poll()
+
+        self.assertEqual(self.ticks, [10, 12])
+        self.assertIsNotNone(self.scheduler.tick_duration)
+
+    def test_pause(self) -> None:
+        self.server.market.status = Case.Status.PAUSED.value
+
+        self.assertEqual(self.scheduler.poll(), 0.25)
+        self.assertEqual(self.ticks, [])
+
+    def test_resume(self) -> None:
+        market = self.server.market
+
+        market.set_tick(10)
+        self.scheduler.poll()
+        market.set_tick(11)
+        self.scheduler.poll()
+
+        tick_duration = self.scheduler.tick_duration
+
+        assert tick_duration is not None
+
+        market.status = Case.Status.PAUSED.value
+
+        self.scheduler.poll()
+        sleep(0.5)
+
+        market.status = Case.Status.ACTIVE.value
+
+        self.scheduler.poll()
+        market.set_tick(12)
+        self.scheduler.poll()
+
+        self.assertEqual(self.scheduler.tick_duration, tick_duration)
+        self.assertEqual(self.ticks, [10, 11, 12])
+
+    def test_run(self) -> None:
+        self.server.market.status = Case.Status.STOPPED.value
+
+        self.scheduler.run()
+
+        self.assertIsNone(self.scheduler.poll())
+        self.assertEqual(self.ticks, [])
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
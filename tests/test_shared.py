@@ -0,0 +1,47 @@
+from struct import pack_into
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer, TICKERS
+from ritc import RIT, SharedMarketPublisher, SharedMarketReader
+
+
+class SharedMarketTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+        self.publisher = SharedMarketPublisher(TICKERS)
+
+    def tearDown(self) -> None:
+        self.publisher.close()
+        self.server.__exit__()
+
+    def test_read(self) -> None:
+        self.publisher.update(self.rit)
+
+        with SharedMarketReader(self.publisher.name or '') as reader:
+            state = reader.read()
+
+            self.assertEqual(reader.tickers, TICKERS)
+            self.assertEqual(state.sequence, 1)
+            self.assertEqual(state.tick, self.server.market.tick)
+            self.assertEqual(state.quotes['CRZY'].bid, 24.99)
+            self.assertEqual(reader.get('TAME').ask, 25.01)
+
+    def test_long_ticker(self) -> None:
+        with self.assertRaises(ValueError):
+            SharedMarketPublisher(['CRZY', 'T' * 17])
+
+    def test_timeout(self) -> None:
+        with SharedMarketReader(self.publisher.name or '', 0.01) as reader:
+            memory = getattr(reader, '_SharedMarketReader__memory')
+            pack_into('<Q', memory.buf, 0, 1)
+
+            with self.assertRaises(TimeoutError):
+                reader.read()
+
+            with self.assertRaises(TimeoutError):
+                reader.get('CRZY')
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
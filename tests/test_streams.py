@@ -0,0 +1,49 @@
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer, NEWS_INTERVAL
+from ritc import NewsStream, RIT, TASStream
+
+
+class StreamTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_tas(self) -> None:
+        market = self.server.market
+        stream = TASStream(self.rit, ['CRZY'], limit=5)
+
+        market.set_tick(10)
+
+        ids = [item.id for item in stream.update()['CRZY']]
+
+        self.assertEqual(ids, list(range(1, 21)))
+
+        market.set_tick(30)
+
+        ids = [item.id for item in stream.update()['CRZY']]
+
+        self.assertEqual(ids, list(range(21, 61)))
+        self.assertEqual(stream.cursors['CRZY'], 60)
+        self.assertEqual(len(stream.buffers['CRZY']), 60)
+        self.assertEqual(stream.update(), {'CRZY': []})
+
+    def test_news(self) -> None:
+        market = self.server.market
+        stream = NewsStream(self.rit)
+
+        market.set_tick(5 * NEWS_INTERVAL)
+        stream.update()
+        market.set_tick(29 * NEWS_INTERVAL)
+
+        ids = [item.news_id for item in stream.update()]
+
+        self.assertEqual(ids, list(range(6, 30)))
+        self.assertEqual(stream.update(), [])
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
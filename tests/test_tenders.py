@@ -0,0 +1,87 @@
+from typing import Any
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import Metrics, RIT, TenderEvaluator
+
+
+class TenderEvaluatorTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = MockServer().__enter__()
+        self.rit = RIT('TEST', port=self.server.port)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_book_age(self) -> None:
+        evaluator = TenderEvaluator(self.rit, ['CRZY'])
+
+        self.assertEqual(evaluator.book_age, float('inf'))
+
+        decision, = evaluator.poll()
+
+        self.assertIsNotNone(decision.unwind_price)
+        self.assertLess(decision.book_age, evaluator.latency_budget)
+        self.assertFalse(evaluator.poll())
+
+    def test_latency_budget(self) -> None:
+        evaluator = TenderEvaluator(
+            self.rit,
+            ['CRZY'],
+            is_automated=True,
+            latency_budget=0,
+        )
+        decision, = evaluator.poll()
+
+        self.assertGreater(decision.latency, evaluator.latency_budget)
+        self.assertFalse(evaluator.decisions)
+
+        evaluator.latency_budget = 10
+        decision, = evaluator.poll()
+
+        self.assertEqual(
+            list(evaluator.decisions),
+            [decision.tender.tender_id],
+        )
+        self.assertFalse(evaluator.poll())
+
+    def test_unwind_price(self) -> None:
+        metrics = Metrics()
+        rit = RIT('TEST', port=self.server.port, hooks=[metrics])
+        evaluator = TenderEvaluator(rit, ['TAME'], is_automated=True)
+        decision, = evaluator.poll()
+
+        self.assertIsNone(decision.unwind_price)
+        self.assertFalse(decision.is_worthwhile)
+        self.assertFalse(evaluator.decisions)
+        self.assertNotIn(
+            ('DELETE', '/v1/tenders/{id}'),
+            metrics.statistics,
+        )
+
+        evaluator.tickers = ['CRZY']
+        evaluator.refresh()
+        decision, = evaluator.poll()
+
+        self.assertIsNotNone(decision.unwind_price)
+        self.assertIn(decision.tender.tender_id, evaluator.decisions)
+
+    def test_expires(self) -> None:
+        market = self.server.market
+        tenders = market.tenders
+
+        def expire() -> list[dict[str, Any]]:
+            return [
+                {**tender, 'expires': market.tick - 1}
+                for tender in tenders()
+            ]
+
+        market.tenders = expire  # type: ignore[method-assign]
+        evaluator = TenderEvaluator(self.rit, ['CRZY'], is_automated=True)
+
+        self.assertFalse(evaluator.poll())
+        self.assertFalse(evaluator.decisions)
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover
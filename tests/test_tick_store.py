@@ -0,0 +1,94 @@
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import main, TestCase
+
+from benchmarks.server import MockServer
+from ritc import RIT, TickStore
+
+
+class TickStoreTestCase(TestCase):
+    def setUp(self) -> None:
+        self.directory = mkdtemp()
+
+        with MockServer() as server:
+            rit = RIT('TEST', port=server.port)
+            self.tas = rit.get_securities_tas(ticker='CRZY', limit=50)
+            self.history = rit.get_securities_history(ticker='CRZY', limit=20)
+
+    def tearDown(self) -> None:
+        rmtree(self.directory)
+
+    def test_append(self) -> None:
+        with TickStore(self.directory, 4) as store:
+            self.assertEqual(store.append_tas('CRZY', self.tas), 50)
+            self.assertEqual(store.append_tas('CRZY', self.tas[:10]), 0)
+            self.assertEqual(
+                store.append_history('CRZY', 1, self.history),
+                20,
+            )
+            self.assertEqual(
+                store.append_history('CRZY', 1, self.history[:2]),
+                1,
+            )
+            self.assertEqual(store.tickers, ['CRZY'])
+
+    def test_get(self) -> None:
+        tick = self.history[0].tick
+
+        with TickStore(self.directory, 4) as store:
+            store.append_tas('CRZY', self.tas)
+            store.append_history('CRZY', 1, self.history)
+
+            tas = store.get_tas('CRZY', (1, tick - 5), (1, tick))
+            history = store.get_history('CRZY', (1, tick - 5))
+
+            self.assertEqual(
+                [item.id for item in tas],
+                sorted(item.id for item in self.tas if item.tick < tick)[-10:],
+            )
+            self.assertEqual(
+                [item.tick for item in history],
+                [tick - i for i in range(5, -1, -1)],
+            )
+            self.assertEqual(
+                set(store.get_history_array('CRZY')['period']),
+                {1},
+            )
+            self.assertEqual(history[-1].close, self.history[0].close)
+
+    def test_reopen(self) -> None:
+        with TickStore(self.directory) as store:
+            store.append_tas('CRZY', self.tas[:40])
+
+        with TickStore(self.directory) as store:
+            self.assertEqual(store.append_tas('CRZY', self.tas), 0)
+
+            array = store.get_tas_array('CRZY')
+
+            self.assertEqual(len(array), 40)
+            self.assertEqual(list(array['id']), sorted(array['id']))
+
+            del array
+
+    def test_close(self) -> None:
+        store = TickStore(self.directory)
+
+        store.append_tas('CRZY', self.tas)
+        store.append_history('CRZY', 1, self.history)
+
+        array = store.get_history_array('CRZY')
+
+        with self.assertRaises(BufferError):
+            store.close()
+
+        self.assertEqual(len(store.get_tas('CRZY')), 50)
+        self.assertEqual(array['close'][-1], self.history[0].close)
+
+        del array
+
+        store.close()
+        store.close()
+
+
+if __name__ == '__main__':
+    main()  # pragma: no cover